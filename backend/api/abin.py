@@ -1,216 +1,247 @@
 from __future__ import annotations
 
-from typing import Any
-
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
 from backend.api.constants import AbinEndpoints
-from backend.core.dependencies import get_api_client
+from backend.core.dependencies import get_abin_tree, get_api_client
+from backend.core.responses import RawJSONResponse, stream_upstream
+from backend.services.abin_tree import AbinTree
 from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
 
 router = APIRouter(prefix="/api/abin", tags=["abin"])
 
 
-@router.get("/helalandet")
+@router.get("/helalandet", response_class=RawJSONResponse)
 async def get_helalandet(
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> RawJSONResponse:
     """Get national browsing inventory summary for all of Sweden.
 
     Returns either a single object or a list of objects with historical data.
     """
-    result = await client.get(AbinEndpoints.HELALANDET)
-    return result
+    result = await client.get_raw(AbinEndpoints.HELALANDET)
+    return RawJSONResponse(result)
 
 
-@router.get("/helalandet/geometri")
+@router.get("/helalandet/geometri", response_class=StreamingResponse)
 async def get_helalandet_geometri(
+    request: Request,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> Response:
     """Get national browsing inventory summary with WKT geometry.
 
     Returns either a single object or a list of objects with historical data.
+    The upstream body is streamed through without decoding.
+    """
+    return await stream_upstream(client, request, AbinEndpoints.HELALANDET_GEOMETRI)
+
+
+@router.get("/tree", response_class=RawJSONResponse)
+async def get_tree(
+    summaries: bool = Query(default=False, description="Include each area's summary"),
+    tree: AbinTree = Depends(get_abin_tree),
+) -> RawJSONResponse:
+    """Get the whole landsdel -> län -> ÄFO -> stratum hierarchy in one document.
+
+    Each area is its metadata entry with its children under ``lan``,
+    ``afo`` or ``stratum``. With ``summaries`` every area also has its
+    summary under ``summary``, and the national one is under
+    ``helalandet``. The tree is assembled from the metadata endpoints with
+    bounded concurrency and cached.
     """
-    result = await client.get(AbinEndpoints.HELALANDET_GEOMETRI)
-    return result
+    return RawJSONResponse(await tree.get(summaries))
 
 
-@router.get("/landsdel/metadata")
+@router.get("/landsdel/metadata", response_class=RawJSONResponse)
 async def get_landsdel_metadata(
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> list[dict[str, Any]]:
+) -> RawJSONResponse:
     """Get metadata for all regions (landsdel).
 
     Returns available region codes and names.
     """
-    result = await client.get(AbinEndpoints.LANDSDEL_METADATA)
-    return result
+    result = await client.get_raw(AbinEndpoints.LANDSDEL_METADATA)
+    return RawJSONResponse(result)
 
 
-@router.get("/landsdel/{landsdelkod}")
+@router.get("/landsdel/{landsdelkod}", response_class=RawJSONResponse)
 async def get_landsdel(
     landsdelkod: str,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> RawJSONResponse:
     """Get browsing inventory summary for specific region (landsdel).
 
     Returns either a single object or a list of objects with historical data.
     """
-    result = await client.get(AbinEndpoints.LANDSDEL.format(landsdelkod=landsdelkod))
-    return result
+    result = await client.get_raw(AbinEndpoints.LANDSDEL.format(landsdelkod=landsdelkod))
+    return RawJSONResponse(result)
 
 
-@router.get("/landsdel/{landsdelkod}/geometri")
+@router.get("/landsdel/{landsdelkod}/geometri", response_class=StreamingResponse)
 async def get_landsdel_geometri(
     landsdelkod: str,
+    request: Request,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> Response:
     """Get browsing inventory summary for region with WKT geometry.
 
     Returns either a single object or a list of objects with historical data.
+    The upstream body is streamed through without decoding.
     """
-    result = await client.get(AbinEndpoints.LANDSDEL_GEOMETRI.format(landsdelkod=landsdelkod))
-    return result
+    endpoint = AbinEndpoints.LANDSDEL_GEOMETRI.format(landsdelkod=landsdelkod)
+    return await stream_upstream(client, request, endpoint)
 
 
-@router.get("/landsdel/{landsdelkod}/lan/metadata")
+@router.get("/landsdel/{landsdelkod}/lan/metadata", response_class=RawJSONResponse)
 async def get_lan_metadata(
     landsdelkod: str,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> list[dict[str, Any]]:
+) -> RawJSONResponse:
     """Get metadata for counties (län) in specific region.
 
     Returns available county codes and names.
     """
-    result = await client.get(AbinEndpoints.LAN_METADATA.format(landsdelkod=landsdelkod))
-    return result
+    result = await client.get_raw(AbinEndpoints.LAN_METADATA.format(landsdelkod=landsdelkod))
+    return RawJSONResponse(result)
 
 
-@router.get("/lan/{lankod}")
+@router.get("/lan/{lankod}", response_class=RawJSONResponse)
 async def get_lan(
     lankod: str,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> RawJSONResponse:
     """Get browsing inventory summary for specific county (län).
 
     Returns either a single object or a list of objects with historical data.
     """
-    result = await client.get(AbinEndpoints.LAN.format(lankod=lankod))
-    return result
+    result = await client.get_raw(AbinEndpoints.LAN.format(lankod=lankod))
+    return RawJSONResponse(result)
 
 
-@router.get("/lan/{lankod}/geometri")
+@router.get("/lan/{lankod}/geometri", response_class=StreamingResponse)
 async def get_lan_geometri(
     lankod: str,
+    request: Request,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> Response:
     """Get browsing inventory summary for county with WKT geometry.
 
     Returns either a single object or a list of objects with historical data.
+    The upstream body is streamed through without decoding.
     """
-    result = await client.get(AbinEndpoints.LAN_GEOMETRI.format(lankod=lankod))
-    return result
+    return await stream_upstream(client, request, AbinEndpoints.LAN_GEOMETRI.format(lankod=lankod))
 
 
-@router.get("/landsdel/{landsdelkod}/lan/{lankod}/afo/metadata")
+@router.get("/landsdel/{landsdelkod}/lan/{lankod}/afo/metadata", response_class=RawJSONResponse)
 async def get_afo_metadata(
     landsdelkod: str,
     lankod: str,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> list[dict[str, Any]]:
+) -> RawJSONResponse:
     """Get metadata for moose management areas (ÄFO) in county.
 
     Returns available ÄFO numbers and names.
     """
-    result = await client.get(
+    result = await client.get_raw(
         AbinEndpoints.AFO_METADATA.format(landsdelkod=landsdelkod, lankod=lankod)
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.get("/lan/{lankod}/afo/{afonr}")
+@router.get("/lan/{lankod}/afo/{afonr}", response_class=RawJSONResponse)
 async def get_afo(
     lankod: str,
     afonr: int,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> RawJSONResponse:
     """Get browsing inventory summary for moose management area (ÄFO).
 
     Returns either a single object or a list of objects with historical data.
     """
-    result = await client.get(AbinEndpoints.AFO.format(lankod=lankod, afonr=afonr))
-    return result
+    result = await client.get_raw(AbinEndpoints.AFO.format(lankod=lankod, afonr=afonr))
+    return RawJSONResponse(result)
 
 
-@router.get("/lan/{lankod}/afo/{afonr}/geometri")
+@router.get("/lan/{lankod}/afo/{afonr}/geometri", response_class=StreamingResponse)
 async def get_afo_geometri(
     lankod: str,
     afonr: int,
+    request: Request,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> Response:
     """Get browsing inventory summary for ÄFO with WKT geometry.
 
     Returns either a single object or a list of objects with historical data.
+    The upstream body is streamed through without decoding.
     """
-    result = await client.get(AbinEndpoints.AFO_GEOMETRI.format(lankod=lankod, afonr=afonr))
-    return result
+    endpoint = AbinEndpoints.AFO_GEOMETRI.format(lankod=lankod, afonr=afonr)
+    return await stream_upstream(client, request, endpoint)
 
 
-@router.get("/landsdel/{landsdelkod}/lan/{lankod}/afo/{afonr}/stratum/metadata")
+@router.get(
+    "/landsdel/{landsdelkod}/lan/{lankod}/afo/{afonr}/stratum/metadata",
+    response_class=RawJSONResponse,
+)
 async def get_stratum_metadata(
     landsdelkod: str,
     lankod: str,
     afonr: int,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> list[dict[str, Any]]:
+) -> RawJSONResponse:
     """Get metadata for sub-areas (stratum) in ÄFO.
 
     Returns available stratum numbers.
     """
-    result = await client.get(
+    result = await client.get_raw(
         AbinEndpoints.STRATUM_METADATA.format(landsdelkod=landsdelkod, lankod=lankod, afonr=afonr)
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.get("/lan/{lankod}/afo/{afonr}/stratum/{delomradesnummer}")
+@router.get("/lan/{lankod}/afo/{afonr}/stratum/{delomradesnummer}", response_class=RawJSONResponse)
 async def get_stratum(
     lankod: str,
     afonr: int,
     delomradesnummer: int,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> RawJSONResponse:
     """Get browsing inventory summary for sub-area (stratum).
 
     Returns either a single object or a list of objects with historical data.
     """
-    result = await client.get(
+    result = await client.get_raw(
         AbinEndpoints.STRATUM.format(lankod=lankod, afonr=afonr, delomradesnummer=delomradesnummer)
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.get("/lan/{lankod}/afo/{afonr}/stratum/{delomradesnummer}/geometri")
+@router.get(
+    "/lan/{lankod}/afo/{afonr}/stratum/{delomradesnummer}/geometri",
+    response_class=StreamingResponse,
+)
 async def get_stratum_geometri(
     lankod: str,
     afonr: int,
     delomradesnummer: int,
+    request: Request,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any] | list[dict[str, Any]]:
+) -> Response:
     """Get browsing inventory summary for stratum with WKT geometry.
 
     Returns either a single object or a list of objects with historical data.
+    The upstream body is streamed through without decoding.
     """
-    result = await client.get(
-        AbinEndpoints.STRATUM_GEOMETRI.format(lankod=lankod, afonr=afonr, delomradesnummer=delomradesnummer)
+    endpoint = AbinEndpoints.STRATUM_GEOMETRI.format(
+        lankod=lankod, afonr=afonr, delomradesnummer=delomradesnummer
     )
-    return result
+    return await stream_upstream(client, request, endpoint)
 
 
-@router.get("/api-info")
+@router.get("/api-info", response_class=RawJSONResponse)
 async def get_abin_api_info(
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Get ABIN API information and version details."""
-    result = await client.get(AbinEndpoints.API_INFO)
-    return result
+    result = await client.get_raw(AbinEndpoints.API_INFO)
+    return RawJSONResponse(result)
@@ -47,3 +47,55 @@ class AbinEndpoints:
     STRATUM = "/abin/v2/lan/{lankod}/afo/{afonr}/stratum/{delomradesnummer}"
     STRATUM_GEOMETRI = "/abin/v2/lan/{lankod}/afo/{afonr}/stratum/{delomradesnummer}/geometri"
     API_INFO = "/abin/v2/api-info"
+
+
+class ApiFamily:
+    """Skogsstyrelsen API families, each served under its own path prefix."""
+
+    RASTER = "raster"
+    GRUNDDATA = "grunddata"
+    ABIN = "abin"
+
+
+API_FAMILY_PREFIXES = {
+    ApiFamily.RASTER: "/raster/",
+    ApiFamily.GRUNDDATA: "/skogligagrunddata/",
+    ApiFamily.ABIN: "/abin/",
+}
+
+# Response cache endpoint for the tree the gateway assembles from the ABIN metadata
+# (not an upstream path); under the ABIN prefix so it follows that family's version
+ABIN_TREE_CACHE_ENDPOINT = "/abin/v2/tree"
+
+# Version information per family, used to tell when upstream data changes
+API_INFO_ENDPOINTS = {
+    ApiFamily.RASTER: RasterEndpoints.API_INFO,
+    ApiFamily.GRUNDDATA: GrundataEndpoints.API_INFO,
+    ApiFamily.ABIN: AbinEndpoints.API_INFO,
+}
+
+# Per-hectare statistics served by /api/grunddata/metrics, by metric name
+GRUNDDATA_METRICS = {
+    "biomassa": GrundataEndpoints.BIOMASSA,
+    "volym": GrundataEndpoints.VOLYM,
+    "grundyta": GrundataEndpoints.GRUNDYTA,
+    "medelhojd": GrundataEndpoints.MEDELHOJD,
+    "medeldiameter": GrundataEndpoints.MEDELDIAMETER,
+}
+
+# Area distributions served by /api/grunddata/histograms, by metric name
+GRUNDDATA_HISTOGRAMS = {
+    "biomassa": GrundataEndpoints.BIOMASSA_HISTOGRAM,
+    "volym": GrundataEndpoints.VOLYM_HISTOGRAM,
+    "grundyta": GrundataEndpoints.GRUNDYTA_HISTOGRAM,
+    "medelhojd": GrundataEndpoints.MEDELHOJD_HISTOGRAM,
+    "medeldiameter": GrundataEndpoints.MEDELDIAMETER_HISTOGRAM,
+}
+
+
+def api_family(endpoint: str) -> str | None:
+    """Return the API family an endpoint path belongs to."""
+    for family, prefix in API_FAMILY_PREFIXES.items():
+        if endpoint.startswith(prefix):
+            return family
+    return None
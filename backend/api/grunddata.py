@@ -1,214 +1,320 @@
 from __future__ import annotations
 
+import json
+import time
+from collections.abc import AsyncIterator
+from functools import partial
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
-from backend.api.constants import GrundataEndpoints
+from backend.api.constants import GRUNDDATA_HISTOGRAMS, GRUNDDATA_METRICS, GrundataEndpoints
+from backend.core.config import Settings, get_settings
 from backend.core.dependencies import get_api_client
+from backend.core.responses import DuplexStreamingResponse, RawJSONResponse
 from backend.models.requests import (
     FramskrivningVolymParameters,
+    GrunddataMetric,
     HistogramParameters,
+    MultiHistogramParameters,
     StatistikParameters,
 )
+from backend.services.batch import NDJSON_MEDIA_TYPE, BatchRunner, ndjson_lines
+from backend.services.fanout import fan_out, merge_results
 from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
 
 router = APIRouter(prefix="/api/grunddata", tags=["grunddata"])
 
 
-@router.get("/valid-dates")
+@router.get("/valid-dates", response_class=RawJSONResponse)
 async def get_valid_projection_dates(
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> list[str]:
+) -> RawJSONResponse:
     """Get valid dates for volume projection.
 
     Returns list of dates in YYYY-MM-DD format (always January 1st).
     """
-    result = await client.get(GrundataEndpoints.VALID_DATES)
-    return result
+    result = await client.get_raw(GrundataEndpoints.VALID_DATES)
+    return RawJSONResponse(result)
 
 
-@router.post("/biomassa")
+@router.post("/biomassa", response_class=RawJSONResponse)
 async def get_biomassa(
     request: StatistikParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Calculate biomass (ton dry substance/ha) for specified area.
 
     Returns mean biomass per hectare and total biomass by land type.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.BIOMASSA,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/biomassa/histogram")
+@router.post("/biomassa/histogram", response_class=RawJSONResponse)
 async def get_biomassa_histogram(
     request: HistogramParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Get area distribution across biomass classes.
 
     Returns area (hectares) per biomass class with configurable class width.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.BIOMASSA_HISTOGRAM,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/volym")
+@router.post("/volym", response_class=RawJSONResponse)
 async def get_volym(
     request: StatistikParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Calculate timber volume (m³sk/ha) for specified area.
 
     Returns mean volume per hectare and total volume by land type.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.VOLYM,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/volym/histogram")
+@router.post("/volym/histogram", response_class=RawJSONResponse)
 async def get_volym_histogram(
     request: HistogramParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Get area distribution across volume classes.
 
     Returns area (hectares) per volume class with configurable class width.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.VOLYM_HISTOGRAM,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/volym-framskriven")
+@router.post("/volym-framskriven", response_class=RawJSONResponse)
 async def get_volym_framskriven(
     request: FramskrivningVolymParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Calculate projected volume with growth model.
 
     Projects volume, mean height, and basal area to specified future date.
     Use /valid-dates to get available projection dates.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.VOLYM_FRAMSKRIVEN,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/grundyta")
+@router.post("/grundyta", response_class=RawJSONResponse)
 async def get_grundyta(
     request: StatistikParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Calculate basal area (m²/ha) for specified area.
 
     Returns mean basal area per hectare by land type.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.GRUNDYTA,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/grundyta/histogram")
+@router.post("/grundyta/histogram", response_class=RawJSONResponse)
 async def get_grundyta_histogram(
     request: HistogramParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Get area distribution across basal area classes.
 
     Returns area (hectares) per basal area class with configurable class width.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.GRUNDYTA_HISTOGRAM,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/medelhojd")
+@router.post("/medelhojd", response_class=RawJSONResponse)
 async def get_medelhojd(
     request: StatistikParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Calculate mean height (meters, basal area weighted) for specified area.
 
     Returns mean height per hectare by land type.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.MEDELHOJD,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/medelhojd/histogram")
+@router.post("/medelhojd/histogram", response_class=RawJSONResponse)
 async def get_medelhojd_histogram(
     request: HistogramParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Get area distribution across height classes.
 
     Returns area (hectares) per height class with configurable class width.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.MEDELHOJD_HISTOGRAM,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/medeldiameter")
+@router.post("/medeldiameter", response_class=RawJSONResponse)
 async def get_medeldiameter(
     request: StatistikParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Calculate mean diameter (cm, basal area weighted) for specified area.
 
     Returns mean diameter by land type.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.MEDELDIAMETER,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.post("/medeldiameter/histogram")
+@router.post("/medeldiameter/histogram", response_class=RawJSONResponse)
 async def get_medeldiameter_histogram(
     request: HistogramParameters,
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Get area distribution across diameter classes.
 
     Returns area (hectares) per diameter class with configurable class width.
     """
-    result = await client.post(
+    result = await client.post_raw(
         GrundataEndpoints.MEDELDIAMETER_HISTOGRAM,
         json_data=request.to_api_dict(),
     )
-    return result
+    return RawJSONResponse(result)
 
 
-@router.get("/api-info")
+@router.post("/metrics", response_class=RawJSONResponse)
+async def get_metrics(
+    request: StatistikParameters,
+    client: SkogsstyrelsenClient = Depends(get_api_client),
+) -> RawJSONResponse:
+    """Calculate biomass, volume, basal area, mean height and mean diameter at once.
+
+    The five upstream calls run concurrently with the same parameters. Each
+    metric reports its status and duration in milliseconds; metrics that
+    fail are listed under ``failed`` while the others are still returned.
+    """
+    body = request.to_api_dict()
+    started = time.monotonic()
+    results = await fan_out(
+        {
+            name: partial(client.post_raw, endpoint, json_data=body)
+            for name, endpoint in GRUNDDATA_METRICS.items()
+        }
+    )
+    return RawJSONResponse(merge_results(results, "metrics", time.monotonic() - started))
+
+
+@router.post("/histograms", response_class=RawJSONResponse)
+async def get_histograms(
+    request: MultiHistogramParameters,
+    client: SkogsstyrelsenClient = Depends(get_api_client),
+) -> RawJSONResponse:
+    """Get area distributions for all five metrics at once.
+
+    The geometry is sent once, with an optional class layout per metric
+    under ``klasser``. The upstream histogram calls run concurrently and
+    are reported like ``/metrics``, keyed by metric under ``histograms``.
+    """
+    started = time.monotonic()
+    results = await fan_out(
+        {
+            name: partial(client.post_raw, endpoint, json_data=request.histogram_dict(name))
+            for name, endpoint in GRUNDDATA_HISTOGRAMS.items()
+        }
+    )
+    return RawJSONResponse(merge_results(results, "histograms", time.monotonic() - started))
+
+
+@router.post("/batch", response_class=StreamingResponse)
+async def get_batch(
+    request: Request,
+    metrics: list[GrunddataMetric] = Query(
+        default=list(GRUNDDATA_METRICS), description="Metrics for areas that select none"
+    ),
+    client: SkogsstyrelsenClient = Depends(get_api_client),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    """Calculate metrics for many areas, streaming one NDJSON line per area.
+
+    The body is an NDJSON stream (``Content-Type: application/x-ndjson``),
+    read as areas are processed so memory stays flat however large the
+    batch, or for small batches a JSON array, which is read whole and
+    limited to ``batch_max_json_bytes``. Each area takes the ``/metrics`` parameters plus an
+    optional ``id`` and ``metrics`` selection. Areas are computed a few at
+    a time and their lines sent as they complete, with ``index`` giving
+    the area's position in the batch; failures are reported per area.
+    """
+    runner = BatchRunner(client, metrics, settings.batch_concurrency)
+    items = await batch_items(request, settings)
+    return DuplexStreamingResponse(runner.run(items), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def batch_items(request: Request, settings: Settings) -> AsyncIterator[Any] | list[Any]:
+    """Areas of a batch body: NDJSON lines read as consumed, or a whole JSON array."""
+    if request.headers.get("Content-Type", "").startswith(NDJSON_MEDIA_TYPE):
+        return ndjson_lines(request.stream(), settings.batch_max_item_bytes)
+    return await _json_items(request, settings.batch_max_json_bytes)
+
+
+async def _json_items(request: Request, max_bytes: int) -> list[Any]:
+    """Areas of a JSON array batch body, rejecting bodies over ``max_bytes``."""
+    too_large = HTTPException(
+        status_code=413, detail="Batch body too large; send large batches as NDJSON"
+    )
+    if int(request.headers.get("Content-Length") or 0) > max_bytes:
+        raise too_large
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise too_large
+    try:
+        items = json.loads(body)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail="Batch body is not valid JSON") from e
+    if not isinstance(items, list):
+        raise HTTPException(status_code=422, detail="Batch body must be a JSON array")
+    return items
+
+
+@router.get("/api-info", response_class=RawJSONResponse)
 async def get_grunddata_api_info(
     client: SkogsstyrelsenClient = Depends(get_api_client),
-) -> dict[str, Any]:
+) -> RawJSONResponse:
     """Get Forest Base Data API information and version details."""
-    result = await client.get(GrundataEndpoints.API_INFO)
-    return result
+    result = await client.get_raw(GrundataEndpoints.API_INFO)
+    return RawJSONResponse(result)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from backend.api.constants import GRUNDDATA_METRICS
+from backend.api.grunddata import batch_items
+from backend.core.config import Settings, get_settings
+from backend.core.dependencies import get_job_queue
+from backend.core.responses import RawJSONResponse
+from backend.models.requests import GrunddataMetric
+from backend.services.batch import NDJSON_MEDIA_TYPE
+from backend.services.fanout import dumps
+from backend.services.jobs import PAGE_SIZE, Job, JobQueue, JobTooLarge
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+@router.post("", status_code=202)
+async def submit_job(
+    request: Request,
+    metrics: list[GrunddataMetric] = Query(
+        default=list(GRUNDDATA_METRICS), description="Metrics for areas that select none"
+    ),
+    idempotency_key: str | None = Header(default=None, max_length=255),
+    queue: JobQueue = Depends(get_job_queue),
+    settings: Settings = Depends(get_settings),
+) -> JSONResponse:
+    """Submit a batch to be computed in the background, returning its job.
+
+    The body is the same as for ``/api/grunddata/batch``: NDJSON for large
+    batches, or a JSON array. Items are stored before the job is queued, so
+    the response (202) comes once the whole body has been read. A repeated
+    ``Idempotency-Key`` returns the job first submitted with it (200)
+    without storing the body again.
+    """
+    items = await batch_items(request, settings)
+    try:
+        job, created = await queue.submit(items, metrics, idempotency_key)
+    except JobTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e)) from e
+    return JSONResponse(
+        content=job.to_dict(),
+        status_code=202 if created else 200,
+        headers={"Location": f"{router.prefix}/{job.id}"},
+    )
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, queue: JobQueue = Depends(get_job_queue)) -> dict[str, Any]:
+    """Get a job's status and progress."""
+    return (await _job(queue, job_id)).to_dict()
+
+
+@router.get("/{job_id}/results", response_class=RawJSONResponse)
+async def get_job_results(
+    job_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    queue: JobQueue = Depends(get_job_queue),
+) -> RawJSONResponse:
+    """Get a page of a job's results, ordered by item index.
+
+    Results are available as soon as each item is computed, so pages of a
+    running job grow until it finishes; ``job.done`` is the number of
+    results there will be to page through so far.
+    """
+    job = await _job(queue, job_id)
+    rows = await queue.store.results(job_id, limit, offset)
+    head = dumps({"job": job.to_dict(), "offset": offset, "limit": limit})
+    # Result lines are stored serialized and spliced in without decoding
+    results = b",".join(line.rstrip(b"\n") for _, line in rows)
+    return RawJSONResponse(head[:-1] + b',"results":[' + results + b"]}")
+
+
+@router.get("/{job_id}/download", response_class=StreamingResponse)
+async def download_job_results(
+    job_id: str, queue: JobQueue = Depends(get_job_queue)
+) -> StreamingResponse:
+    """Download all of a job's results computed so far as NDJSON, ordered by item index."""
+    job = await _job(queue, job_id)
+
+    async def lines() -> AsyncIterator[bytes]:
+        after = -1
+        while rows := await queue.store.results(job_id, PAGE_SIZE, after=after):
+            yield b"".join(line for _, line in rows)
+            after = rows[-1][0]
+
+    return StreamingResponse(
+        lines(),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="job-{job.id}.ndjson"'},
+    )
+
+
+async def _job(queue: JobQueue, job_id: str) -> Job:
+    """Get a job, or fail with 404."""
+    job = await queue.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
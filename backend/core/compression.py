@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import Settings
+from backend.services.encoding import (
+    COMPRESSION_ENCODINGS,
+    StreamCompressor,
+    compress_body,
+    negotiate_encoding,
+)
+
+# Bodies or chunks at least this large are compressed off the event loop
+THREAD_THRESHOLD = 64 * 1024
+
+# Streamed media types whose chunks are flushed through the compressor as they
+# are sent, so each record reaches the client without waiting for the next
+INCREMENTAL_MEDIA_TYPES = frozenset(
+    {"application/x-ndjson", "application/jsonl", "text/event-stream"}
+)
+
+
+def is_compressible(content_type: str) -> bool:
+    """Check if a media type is text-like and worth compressing."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type.startswith("text/") or media_type.endswith(("json", "xml", "javascript"))
+
+
+def is_incremental(content_type: str) -> bool:
+    """Check if a media type is read record by record while it streams, like NDJSON."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type in INCREMENTAL_MEDIA_TYPES
+
+
+class CompressedVariantCache:
+    """LRU of compressed bodies keyed by encoding and body digest, bounded in bytes.
+
+    Hot responses, such as cached ABIN geometries, are sent with the same
+    body over and over; hashing a body is far cheaper than compressing it.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(encoding: str, content: bytes) -> tuple[str, bytes]:
+        """Build the key for a body in an encoding."""
+        return encoding, hashlib.blake2b(content, digest_size=16).digest()
+
+    def get(self, key: tuple[str, bytes]) -> bytes | None:
+        """Get a compressed body, or None if not cached."""
+        compressed = self._entries.get(key)
+        if compressed is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return compressed
+
+    def set(self, key: tuple[str, bytes], compressed: bytes) -> None:
+        """Store a compressed body, evicting least recently used ones to make room."""
+        if len(compressed) > self.max_bytes or key in self._entries:
+            return
+        while self._entries and self._bytes + len(compressed) > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+        self._entries[key] = compressed
+        self._bytes += len(compressed)
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class CompressionMiddleware:
+    """Compress responses with the best encoding the client accepts.
+
+    Bodies smaller than ``min_size``, non-text media types and responses
+    that already carry a Content-Encoding (such as relayed upstream bodies)
+    are sent unchanged. Complete bodies are compressed in one go and their
+    compressed variants cached; streamed bodies are compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        levels: dict[str, int],
+        min_size: int = 1024,
+        variants: CompressedVariantCache | None = None,
+    ) -> None:
+        self.app = app
+        self.levels = levels
+        self.min_size = min_size
+        self.variants = variants
+        self.encodings = tuple(
+            encoding for encoding in COMPRESSION_ENCODINGS if encoding in levels
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("Accept-Encoding")
+        encoding = negotiate_encoding(accept_encoding, self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    async def compress(self, content: bytes, encoding: str) -> bytes:
+        """Compress a complete body, reusing a cached variant when available."""
+        key = None
+        if self.variants is not None:
+            key = self.variants.key_for(encoding, content)
+            compressed = self.variants.get(key)
+            if compressed is not None:
+                return compressed
+
+        level = self.levels[encoding]
+        if len(content) >= THREAD_THRESHOLD:
+            compressed = await asyncio.to_thread(compress_body, content, encoding, level)
+        else:
+            compressed = compress_body(content, encoding, level)
+
+        if key is not None:
+            self.variants.set(key, compressed)
+        return compressed
+
+
+class _CompressionResponder:
+    """Send wrapper deciding per response whether and how to compress it."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        self._compressor: StreamCompressor | None = None
+        self._flush = False
+        # Set once the response is sent unchanged, or completely
+        self._passthrough = False
+        self._done = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+        if self._done:
+            # The complete body went out with the first chunk
+            return
+        if self._compressor is not None:
+            await self._send_chunk(message)
+            return
+
+        start = self._start
+        headers = MutableHeaders(scope=start)
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        content_length = headers.get("Content-Length")
+        complete = not more_body or (
+            content_length is not None and int(content_length) == len(body)
+        )
+
+        if (
+            "Content-Encoding" in headers
+            or not is_compressible(headers.get("Content-Type", ""))
+            or (complete and len(body) < self.middleware.min_size)
+        ):
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if complete:
+            compressed = await self.middleware.compress(body, self.encoding)
+            headers["Content-Length"] = str(len(compressed))
+            self._done = True
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # Streamed body of unknown or larger length: compress as it arrives
+        if "Content-Length" in headers:
+            del headers["Content-Length"]
+        self._compressor = StreamCompressor(self.encoding, self.middleware.levels[self.encoding])
+        self._flush = is_incremental(headers.get("Content-Type", ""))
+        await self._send(start)
+        await self._send_chunk(message)
+
+    async def _send_chunk(self, message: Message) -> None:
+        """Compress and send one chunk of a streamed body."""
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if len(body) >= THREAD_THRESHOLD:
+            output = await asyncio.to_thread(self._compressor.compress, body)
+        else:
+            output = self._compressor.compress(body)
+        if not more_body:
+            output += self._compressor.finish()
+        elif self._flush and body:
+            output += self._compressor.flush()
+        if output or not more_body:
+            await self._send(
+                {"type": "http.response.body", "body": output, "more_body": more_body}
+            )
+
+
+def create_variant_cache(settings: Settings) -> CompressedVariantCache | None:
+    """Create the compressed variant cache, or None when disabled."""
+    if settings.compression_cache_max_bytes <= 0:
+        return None
+    return CompressedVariantCache(settings.compression_cache_max_bytes)
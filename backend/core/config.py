@@ -36,12 +36,134 @@ class Settings(BaseSettings):
     request_timeout: float = 30.0
 
     # HTTP client connection pooling
-    http_max_connections: int = 100
-    http_max_keepalive_connections: int = 20
+    http_max_connections: int = 100  # Pool for endpoints outside the API families below
+    http_max_keepalive_connections: int = 20  # Per pool
+
+    # Bulkheads: each API family has its own connection pool and concurrency cap,
+    # so slow grunddata statistics cannot starve quick ABIN or token requests.
+    # Requests over the cap wait in a bounded queue.
+    raster_max_connections: int = 20
+    raster_max_queue: int = 100
+    grunddata_max_connections: int = 40
+    grunddata_max_queue: int = 200
+    abin_max_connections: int = 20
+    abin_max_queue: int = 100
+    auth_max_connections: int = 5
+    auth_max_queue: int = 50
+    bulkhead_queue_timeout_seconds: float = 10.0  # Longest wait for a connection slot
+    # Streamed bodies (*/geometri) keep their connection while being relayed, after
+    # their bulkhead slot is freed; each family's pool has this many extra for them
+    stream_max_relays: int = 10
+
+    # Adaptive concurrency: AIMD limit within each family's bulkhead, capped by its pool
+    adaptive_concurrency_enabled: bool = True
+    adaptive_concurrency_initial_limit: int = 10
+    adaptive_concurrency_min_limit: int = 2
+    adaptive_concurrency_backoff_ratio: float = 0.9  # Multiplicative decrease on overload
+    adaptive_concurrency_latency_tolerance: float = 2.0  # Back off above this x baseline latency
+
+    # Retries for idempotent upstream calls (GETs and raster/grunddata POSTs)
+    retry_max_attempts: int = 3  # Total attempts, including the first
+    retry_backoff_base_seconds: float = 0.2
+    retry_backoff_max_seconds: float = 5.0  # Longer Retry-After values are not waited for
+    retry_budget_ratio: float = 0.2  # Retries allowed per request
+    retry_budget_min_per_second: float = 1.0  # Reserve for low traffic
+
+    # Hedged requests: race a second copy of an idempotent read that is slower
+    # than its rolling percentile; the budget caps the extra upstream load
+    hedging_enabled: bool = False
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 20  # Samples needed before a request kind is hedged
+    hedge_min_delay_seconds: float = 0.05
+    hedge_budget_ratio: float = 0.05  # Hedges allowed per request
+
+    # Circuit breaker per API family (raster, grunddata, abin)
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_window_seconds: float = 30.0  # Rolling window for error and latency ratios
+    circuit_breaker_minimum_calls: int = 10  # Calls in the window before the breaker may trip
+    circuit_breaker_failure_ratio: float = 0.5
+    circuit_breaker_slow_call_seconds: float = 10.0
+    circuit_breaker_slow_call_ratio: float = 0.8
+    circuit_breaker_open_seconds: float = 30.0  # Fail fast this long before probing
+    circuit_breaker_half_open_calls: int = 1  # Probe calls allowed while half-open
+
+    # Share one upstream call between identical concurrent requests
+    coalesce_requests: bool = True
+
+    # In-memory response cache (sizes in bytes, TTLs in seconds)
+    cache_enabled: bool = True
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_geometry_max_bytes: int = 256 * 1024 * 1024  # Separate budget for */geometri
+    cache_abin_ttl_seconds: float = 24 * 3600
+    cache_abin_metadata_ttl_seconds: float = 7 * 24 * 3600
+    cache_abin_geometry_ttl_seconds: float = 7 * 24 * 3600
+    cache_api_info_ttl_seconds: float = 3600
+    cache_valid_dates_ttl_seconds: float = 6 * 3600
+    cache_grunddata_ttl_seconds: float = 24 * 3600
+    cache_geometry_precision: int = 2  # Decimals kept when canonicalizing WKT keys
+    # Serve expired GET entries while refreshing them, up to this long past their TTL
+    cache_stale_while_revalidate: bool = True
+    cache_max_stale_seconds: float = 24 * 3600
+
+    # Poll each family's api-info and namespace cache keys by its upstream version,
+    # so a new release invalidates exactly that family's cached responses
+    api_version_polling: bool = True
+    api_version_poll_interval_seconds: float = 300.0
+
+    # Preload the ABIN metadata tree, valid-dates and api-info at startup and
+    # periodically; /ready reports ready once a pass loads the given share of them
+    cache_warmup_enabled: bool = False
+    cache_warmup_concurrency: int = 4
+    cache_warmup_interval_seconds: float = 6 * 3600  # 0 warms only at startup
+    cache_warmup_ready_ratio: float = 0.9
+    cache_warmup_summaries: bool = False  # Also preload each area's summary
+
+    # Whole ABIN tree (/api/abin/tree): upstream calls at once while assembling it;
+    # the assembled tree is kept in the response cache
+    abin_tree_concurrency: int = 8
+
+    # Batch statistics (/api/grunddata/batch): areas computed at once, each fanning
+    # out to its metrics; the upstream calls still queue in the grunddata bulkhead
+    batch_concurrency: int = 8
+    batch_max_item_bytes: int = 4 * 1024 * 1024  # Longer NDJSON lines are rejected
+    batch_max_json_bytes: int = 16 * 1024 * 1024  # JSON array bodies; larger get 413
+
+    # Background batch jobs (/api/jobs), persisted in SQLite so they resume after a
+    # restart; items of each job are computed like /api/grunddata/batch
+    jobs_db_path: str | None = None  # Enabled when set
+    jobs_workers: int = 2  # Jobs processed at once
+    jobs_item_concurrency: int = 8  # Areas computed at once within a job
+    jobs_max_items: int = 100_000
+    jobs_retention_seconds: float = 7 * 24 * 3600  # Finished jobs are deleted after this
+
+    # Persistent response cache beneath the memory cache (SQLite, zstd-compressed)
+    disk_cache_path: str | None = None  # Enabled when set
+    disk_cache_max_bytes: int = 1024 * 1024 * 1024
+    disk_cache_compaction_interval_seconds: float = 600.0
+    disk_cache_compression_level: int = 3
+
+    # Response compression negotiated with clients (brotli only when installed)
+    compression_enabled: bool = True
+    compression_min_size: int = 1024  # Smaller bodies are sent uncompressed
+    compression_gzip_level: int = 6
+    compression_zstd_level: int = 3
+    compression_brotli_quality: int = 4
+    compression_cache_max_bytes: int = 32 * 1024 * 1024  # Compressed variants of hot bodies
+
+    # Cache-Control max-age for clients per route family (0 sends none); responses
+    # carry ETags, so clients revalidate cheaply with If-None-Match afterwards
+    http_cache_abin_max_age_seconds: int = 3600
+    http_cache_api_info_max_age_seconds: int = 300
+    http_cache_valid_dates_max_age_seconds: int = 600
+    http_cache_stale_while_revalidate_seconds: int = 60
 
     # Authentication settings
     auth_request_timeout: float = 10.0
     token_refresh_buffer_minutes: int = 5  # Refresh token N minutes before expiry
+    token_background_renewal: bool = True  # Renew token in the background
+    token_renewal_lead_seconds: int = 60  # Renew this long before the refresh buffer
+    token_renewal_retry_seconds: float = 30.0  # Wait after a failed background renewal
+    token_store_path: str | None = None  # Share tokens between workers via this file
 
 
 @lru_cache
@@ -1,21 +1,35 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from fastapi import HTTPException, Request
 
-from backend.core.config import Settings, get_settings
+from backend.services.abin_tree import AbinTree
 from backend.services.auth import SkogsstyrelsenAuth
+from backend.services.jobs import JobQueue
 from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
 
 
-@lru_cache
-def get_auth_service() -> SkogsstyrelsenAuth:
-    """Get singleton auth service instance."""
-    settings = get_settings()
-    return SkogsstyrelsenAuth(settings)
+def get_auth_service(request: Request) -> SkogsstyrelsenAuth:
+    """Get the auth service shared by the application."""
+    return request.app.state.auth
 
 
-def get_api_client() -> SkogsstyrelsenClient:
-    """Get API client with dependencies."""
-    settings = get_settings()
-    auth = get_auth_service()
-    return SkogsstyrelsenClient(auth, settings)
+def get_api_client(request: Request) -> SkogsstyrelsenClient:
+    """Get the API client shared by the application.
+
+    The client and its connection pool are created and closed by the
+    application lifespan handler, so all requests reuse the same pool.
+    """
+    return request.app.state.api_client
+
+
+def get_abin_tree(request: Request) -> AbinTree:
+    """Get the ABIN tree builder shared by the application."""
+    return request.app.state.abin_tree
+
+
+def get_job_queue(request: Request) -> JobQueue:
+    """Get the background job queue, or fail with 503 when jobs are not configured."""
+    queue = request.app.state.job_queue
+    if queue is None:
+        raise HTTPException(status_code=503, detail="Background jobs are not enabled")
+    return queue
@@ -23,6 +23,21 @@ class APIError(SkogsstyrelsenError):
     pass
 
 
+class CircuitOpenError(APIError):
+    """Upstream API is failing and calls are rejected by its circuit breaker."""
+
+    def __init__(self, message: str, retry_after: float = 0.0) -> None:
+        super().__init__(message, status_code=503)
+        self.retry_after = retry_after
+
+
+class BulkheadFullError(APIError):
+    """Too many requests are already waiting for an upstream API."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message, status_code=503)
+
+
 class ConfigurationError(SkogsstyrelsenError):
     """Configuration error."""
 
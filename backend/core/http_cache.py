@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from starlette.datastructures import MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import Settings
+
+CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
+
+# Headers a 304 repeats from the full response (RFC 9110, section 15.4.5)
+_NOT_MODIFIED_HEADERS = ("ETag", "Vary", "Cache-Control")
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(headers: MutableHeaders) -> Response:
+    """Build a 304 response carrying the validators of the full response."""
+    return Response(
+        status_code=304,
+        headers={name: headers[name] for name in _NOT_MODIFIED_HEADERS if name in headers},
+    )
+
+
+@dataclass(frozen=True)
+class CacheControlRule:
+    """Cache-Control header for gateway routes matching a path pattern."""
+
+    pattern: re.Pattern[str]
+    value: str
+
+    @classmethod
+    def for_max_age(
+        cls, pattern: str, max_age: int, stale_while_revalidate: int = 0
+    ) -> CacheControlRule:
+        """Build a rule letting clients and shared caches reuse responses for ``max_age``."""
+        value = f"public, max-age={max_age}"
+        if stale_while_revalidate > 0:
+            value += f", stale-while-revalidate={stale_while_revalidate}"
+        return cls(re.compile(pattern), value)
+
+
+def build_cache_control_rules(settings: Settings) -> list[CacheControlRule]:
+    """Client caching policy per route family; families with max-age 0 get none."""
+    swr = settings.http_cache_stale_while_revalidate_seconds
+    rules = [
+        (r"^/api/[^/]+/api-info$", settings.http_cache_api_info_max_age_seconds),
+        (r"^/api/grunddata/valid-dates$", settings.http_cache_valid_dates_max_age_seconds),
+        (r"^/api/abin/", settings.http_cache_abin_max_age_seconds),
+    ]
+    return [
+        CacheControlRule.for_max_age(pattern, max_age, swr)
+        for pattern, max_age in rules
+        if max_age > 0
+    ]
+
+
+class CacheControlMiddleware:
+    """Add Cache-Control to successful GET responses of cacheable route families.
+
+    Responses that set their own Cache-Control keep it.
+    """
+
+    def __init__(self, app: ASGIApp, rules: list[CacheControlRule]) -> None:
+        self.app = app
+        self.rules = rules
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in CONDITIONAL_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        rule = next((rule for rule in self.rules if rule.pattern.match(scope["path"])), None)
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_control(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] in (200, 304):
+                headers = MutableHeaders(scope=message)
+                if "Cache-Control" not in headers:
+                    headers["Cache-Control"] = rule.value
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from uuid import uuid4
 
 from fastapi import Request, status
@@ -8,6 +9,7 @@ from fastapi.responses import JSONResponse
 from backend.core.exceptions import (
     APIError,
     AuthenticationError,
+    CircuitOpenError,
     ConfigurationError,
     SkogsstyrelsenError,
 )
@@ -52,6 +54,18 @@ async def error_handler_middleware(request: Request, call_next):
                 "request_id": request_id,
             },
         )
+    except CircuitOpenError as e:
+        logger.warning(f"[{request_id}] Circuit open: {e.message}")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "detail": e.message,
+                "type": "circuit_open",
+                "status_code": e.status_code,
+                "request_id": request_id,
+            },
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+        )
     except APIError as e:
         logger.error(f"[{request_id}] API error: {e.message}")
         return JSONResponse(
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.requests import ClientDisconnect
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
+
+from backend.core.http_cache import CONDITIONAL_METHODS, etag_matches, not_modified
+from backend.services.encoding import COMPRESSION_ENCODINGS, negotiate_encoding
+from backend.services.skogsstyrelsen_client import RawBody, RawResponse, SkogsstyrelsenClient
+
+
+class RawJSONResponse(Response):
+    """JSON body that is already serialized, such as an upstream or cached body.
+
+    Proxy routes return upstream JSON unchanged, so there is nothing to
+    decode, validate or re-encode. The body's ETag is sent and a matching
+    If-None-Match on a GET is answered with 304. For cached bodies a
+    precompressed variant is picked by the request's Accept-Encoding.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: bytes | RawBody,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.variants: dict[str, bytes] = {}
+        self.etag: str | None = None
+        if isinstance(content, RawBody):
+            self.variants = content.variants
+            self.etag = content.etag
+            if content.etag:
+                headers = {**(headers or {}), "ETag": content.etag}
+            content = content.content
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request_headers = Headers(scope=scope)
+        if self.variants:
+            self.headers.add_vary_header("Accept-Encoding")
+        if (
+            self.etag
+            and self.status_code == 200
+            and scope["method"] in CONDITIONAL_METHODS
+            and etag_matches(request_headers.get("If-None-Match"), self.etag)
+        ):
+            await not_modified(self.headers)(scope, receive, send)
+            return
+
+        if self.variants:
+            available = tuple(e for e in COMPRESSION_ENCODINGS if e in self.variants)
+            encoding = negotiate_encoding(request_headers.get("Accept-Encoding"), available)
+            if encoding is not None:
+                self.body = self.variants[encoding]
+                self.headers["Content-Encoding"] = encoding
+                self.headers["Content-Length"] = str(len(self.body))
+        await super().__call__(scope, receive, send)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """Streamed response produced while the request body is still being read.
+
+    StreamingResponse watches for a client disconnect by calling
+    ``receive()`` next to the body iterator, which takes the request body
+    messages away from an iterator that reads them. Here the body iterator
+    is the only reader; a disconnect reaches it as ClientDisconnect.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as e:
+            raise ClientDisconnect() from e
+        if self.background is not None:
+            await self.background()
+
+
+def passthrough_response(raw: RawResponse) -> StreamingResponse:
+    """Relay an upstream body unchanged, keeping its Content-Encoding."""
+    headers: dict[str, str] = {}
+    if raw.content_encoding:
+        headers["Content-Encoding"] = raw.content_encoding
+        headers["Vary"] = "Accept-Encoding"
+    if raw.content_length is not None:
+        headers["Content-Length"] = str(raw.content_length)
+    if raw.etag:
+        headers["ETag"] = raw.etag
+
+    return StreamingResponse(
+        raw.chunks,
+        media_type=raw.media_type,
+        headers=headers,
+        background=BackgroundTask(raw.close) if raw.close is not None else None,
+    )
+
+
+async def stream_upstream(
+    client: SkogsstyrelsenClient,
+    request: Request,
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+) -> Response:
+    """Stream an upstream GET to the caller without decoding the body.
+
+    A cached body whose ETag matches If-None-Match is answered with 304.
+    """
+    raw = await client.stream(
+        endpoint, params=params, accept_encoding=request.headers.get("Accept-Encoding")
+    )
+    response = passthrough_response(raw)
+    if raw.etag and etag_matches(request.headers.get("If-None-Match"), raw.etag):
+        if raw.close is not None:
+            await raw.close()
+        return not_modified(response.headers)
+    return response
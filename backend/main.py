@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from typing import Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from backend.api import abin, grunddata, raster
+from backend.api import abin, grunddata, jobs, raster
+from backend.core.compression import CompressionMiddleware, create_variant_cache
 from backend.core.config import get_settings
+from backend.core.http_cache import CacheControlMiddleware, build_cache_control_rules
 from backend.core.logging import setup_logging
 from backend.core.middleware import error_handler_middleware, request_id_middleware
+from backend.services.abin_tree import AbinTree
+from backend.services.auth import SkogsstyrelsenAuth
+from backend.services.encoding import compression_levels
+from backend.services.jobs import create_job_queue
+from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
+from backend.services.token_store import create_token_store
+from backend.services.versions import ApiVersionPoller
+from backend.services.warmup import create_cache_warmer
 
 
 @asynccontextmanager
@@ -17,7 +29,39 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     settings = get_settings()
     setup_logging(debug=settings.debug)
-    yield
+
+    # One auth service and one pooled API client shared by all routers
+    auth = SkogsstyrelsenAuth(settings, token_store=create_token_store(settings))
+    if settings.token_background_renewal:
+        auth.start()
+    api_client = SkogsstyrelsenClient(auth, settings)
+    await api_client.start()
+    version_poller = ApiVersionPoller(api_client, settings.api_version_poll_interval_seconds)
+    if settings.api_version_polling:
+        version_poller.start()
+    # Warming runs in the background; /ready reports when it has got far enough
+    cache_warmer = create_cache_warmer(settings, api_client, version_poller)
+    if settings.cache_warmup_enabled:
+        cache_warmer.start()
+    job_queue = create_job_queue(settings, api_client)
+    if job_queue is not None:
+        await job_queue.start()
+    app.state.auth = auth
+    app.state.api_client = api_client
+    app.state.version_poller = version_poller
+    app.state.cache_warmer = cache_warmer
+    app.state.abin_tree = AbinTree(api_client, settings.abin_tree_concurrency)
+    app.state.job_queue = job_queue
+
+    try:
+        yield
+    finally:
+        if job_queue is not None:
+            await job_queue.close()
+        await cache_warmer.close()
+        await version_poller.close()
+        await api_client.close()
+        await auth.close()
 
 
 app = FastAPI(
@@ -33,6 +77,19 @@ app.middleware("http")(error_handler_middleware)
 # Request ID middleware (register second, runs first for proper tracing)
 app.middleware("http")(request_id_middleware)
 
+# Response compression (runs inside CORS, outside error handling)
+if get_settings().compression_enabled:
+    app.state.compression_variants = create_variant_cache(get_settings())
+    app.add_middleware(
+        CompressionMiddleware,
+        levels=compression_levels(get_settings()),
+        min_size=get_settings().compression_min_size,
+        variants=app.state.compression_variants,
+    )
+
+# Cache-Control per route family for cacheable GET routes
+app.add_middleware(CacheControlMiddleware, rules=build_cache_control_rules(get_settings()))
+
 # CORS middleware for frontend communication
 app.add_middleware(
     CORSMiddleware,
@@ -46,6 +103,7 @@ app.add_middleware(
 app.include_router(raster.router)
 app.include_router(grunddata.router)
 app.include_router(abin.router)
+app.include_router(jobs.router)
 
 
 @app.get("/")
@@ -60,6 +118,30 @@ def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_check(request: Request) -> JSONResponse:
+    """Readiness check: 503 until cache warm-up has loaded enough endpoints."""
+    warmup = request.app.state.cache_warmer.stats()
+    if not warmup["ready"]:
+        return JSONResponse(status_code=503, content={"status": "warming", "warmup": warmup})
+    return JSONResponse(content={"status": "ready", "warmup": warmup})
+
+
+@app.get("/metrics")
+async def metrics(request: Request) -> dict[str, Any]:
+    """Upstream client, API version, warm-up, ABIN tree, job and compression metrics."""
+    stats = request.app.state.api_client.stats()
+    stats["api_versions"] = request.app.state.version_poller.stats()
+    stats["warmup"] = request.app.state.cache_warmer.stats()
+    stats["abin_tree"] = request.app.state.abin_tree.stats()
+    if request.app.state.job_queue is not None:
+        stats["jobs"] = request.app.state.job_queue.stats()
+    variants = getattr(request.app.state, "compression_variants", None)
+    if variants is not None:
+        stats["compression"] = variants.stats()
+    return stats
+
+
 def main() -> None:
     """Entry point for running the application."""
     import uvicorn
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -74,6 +74,47 @@ class HistogramParameters(StatistikParameters):
     antal_klasser: int | None = Field(None, alias="antalKlasser", ge=1, le=255)
 
 
+GrunddataMetric = Literal["biomassa", "volym", "grundyta", "medelhojd", "medeldiameter"]
+
+
+class HistogramClasses(BaseAPIRequest):
+    """Class layout of one metric's histogram."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    klass_bredd: int | None = Field(None, alias="klassBredd", ge=1)
+    antal_klasser: int | None = Field(None, alias="antalKlasser", ge=1, le=255)
+
+
+class MultiHistogramParameters(StatistikParameters):
+    """Parameters for fetching every metric's histogram for one area."""
+
+    klasser: dict[GrunddataMetric, HistogramClasses] = Field(
+        default_factory=dict,
+        description="Class layout per metric; metrics left out use the upstream defaults",
+    )
+
+    def histogram_dict(self, metric: GrunddataMetric) -> dict[str, Any]:
+        """API body for one metric's histogram request."""
+        body = self.model_dump(by_alias=True, exclude_none=True, exclude={"klasser"})
+        if metric in self.klasser:
+            body.update(self.klasser[metric].to_api_dict())
+        return body
+
+
+class BatchItem(StatistikParameters):
+    """One area of a batch statistics request."""
+
+    id: str | int | None = Field(None, description="Caller's identifier, echoed in the result")
+    metrics: list[GrunddataMetric] | None = Field(
+        None, description="Metrics for this area; defaults to the batch's selection"
+    )
+
+    def to_api_dict(self) -> dict[str, Any]:
+        """API body shared by this area's metric requests."""
+        return self.model_dump(by_alias=True, exclude_none=True, exclude={"id", "metrics"})
+
+
 class FramskrivningVolymParameters(StatistikParameters):
     """Parameters for volume projection endpoint."""
 
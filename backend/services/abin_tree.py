@@ -0,0 +1,167 @@
+"""The ABIN area hierarchy, walked landsdel -> län -> ÄFO -> stratum."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
+
+from backend.api.constants import ABIN_TREE_CACHE_ENDPOINT, AbinEndpoints
+from backend.core.logging import get_logger
+from backend.services.fanout import dumps
+from backend.services.keys import make_etag
+from backend.services.singleflight import SingleFlight
+from backend.services.skogsstyrelsen_client import RawBody, SkogsstyrelsenClient
+
+logger = get_logger(__name__)
+
+# GETs an endpoint and returns its decoded body, or None to leave that branch empty
+Load = Callable[[str], Awaitable[Any]]
+
+
+def metadata_entries(body: Any) -> list[dict[str, Any]]:
+    """Entries listed in an ABIN metadata body (``[{"namn": ..., "kod": ...}]``)."""
+    if not isinstance(body, list):
+        return []
+    return [item for item in body if isinstance(item, dict) and item.get("kod")]
+
+
+async def walk_abin_tree(load: Load, summaries: bool = False) -> list[dict[str, Any]]:
+    """Load the ABIN metadata tree level by level, returning its regions as nested nodes.
+
+    Each node is its metadata entry with the next level's entries under
+    ``lan``, ``afo`` or ``stratum``, and with ``summaries`` also the area's
+    summary under ``summary``. Siblings are loaded concurrently; ``load``
+    is where any limit on upstream calls belongs.
+    """
+
+    async def level(endpoint: str, expand: Callable[[dict[str, Any]], Awaitable[Any]]) -> list:
+        entries = metadata_entries(await load(endpoint))
+        return list(await asyncio.gather(*(expand(entry) for entry in entries)))
+
+    async def node(
+        entry: dict[str, Any], key: str, children: Awaitable[list], summary: str
+    ) -> dict[str, Any]:
+        if not summaries:
+            return {**entry, key: await children}
+        loaded, body = await asyncio.gather(children, load(summary))
+        return {**entry, key: loaded, "summary": body}
+
+    async def landsdel(entry: dict[str, Any]) -> dict[str, Any]:
+        landsdelkod = str(entry["kod"])
+        return await node(
+            entry,
+            "lan",
+            level(
+                AbinEndpoints.LAN_METADATA.format(landsdelkod=landsdelkod),
+                lambda child: lan(landsdelkod, child),
+            ),
+            AbinEndpoints.LANDSDEL.format(landsdelkod=landsdelkod),
+        )
+
+    async def lan(landsdelkod: str, entry: dict[str, Any]) -> dict[str, Any]:
+        lankod = str(entry["kod"])
+        return await node(
+            entry,
+            "afo",
+            level(
+                AbinEndpoints.AFO_METADATA.format(landsdelkod=landsdelkod, lankod=lankod),
+                lambda child: afo(landsdelkod, lankod, child),
+            ),
+            AbinEndpoints.LAN.format(lankod=lankod),
+        )
+
+    async def afo(landsdelkod: str, lankod: str, entry: dict[str, Any]) -> dict[str, Any]:
+        afonr = str(entry["kod"])
+        return await node(
+            entry,
+            "stratum",
+            level(
+                AbinEndpoints.STRATUM_METADATA.format(
+                    landsdelkod=landsdelkod, lankod=lankod, afonr=afonr
+                ),
+                lambda child: stratum(lankod, afonr, child),
+            ),
+            AbinEndpoints.AFO.format(lankod=lankod, afonr=afonr),
+        )
+
+    async def stratum(lankod: str, afonr: str, entry: dict[str, Any]) -> dict[str, Any]:
+        if not summaries:
+            return entry
+        endpoint = AbinEndpoints.STRATUM.format(
+            lankod=lankod, afonr=afonr, delomradesnummer=str(entry["kod"])
+        )
+        return {**entry, "summary": await load(endpoint)}
+
+    return await level(AbinEndpoints.LANDSDEL_METADATA, landsdel)
+
+
+class AbinTree:
+    """Assemble the whole ABIN tree in one document and keep it in the response cache.
+
+    The walk makes at most ``concurrency`` upstream calls at a time, each
+    going through the client and its cache, so rebuilding after the tree
+    expires mostly reads cached metadata. Concurrent builds are shared.
+    Upstream errors fail the build rather than caching an incomplete tree.
+    """
+
+    def __init__(self, client: SkogsstyrelsenClient, concurrency: int = 8) -> None:
+        self.client = client
+        self.concurrency = concurrency
+        self._singleflight = SingleFlight()
+        self.builds = 0
+        self.last_duration: float | None = None
+
+    async def get(self, summaries: bool = False) -> RawBody:
+        """Get the tree, from the response cache if it holds a fresh copy."""
+        cache = self.client.cache
+        params = {"summaries": summaries}
+        rule = cache.rule_for("GET", ABIN_TREE_CACHE_ENDPOINT) if cache is not None else None
+        if rule is None:
+            content = await self._singleflight.do(
+                f"summaries={summaries}", partial(self.build, summaries)
+            )
+            return RawBody(content, etag=make_etag(content))
+
+        key = cache.key_for(rule, "GET", ABIN_TREE_CACHE_ENDPOINT, params)
+        entry = await cache.get(rule, key, ABIN_TREE_CACHE_ENDPOINT)
+        if entry is None or not entry.is_fresh():
+
+            async def build_and_store() -> Any:
+                content = await self.build(summaries)
+                return await cache.set(rule, key, ABIN_TREE_CACHE_ENDPOINT, content)
+
+            entry = await self._singleflight.do(key, build_and_store)
+        return RawBody.from_response(entry)
+
+    async def build(self, summaries: bool = False) -> bytes:
+        """Walk the hierarchy from upstream and serialize the tree."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def load(endpoint: str) -> Any:
+            async with semaphore:
+                return await self.client.get(endpoint)
+
+        started = time.monotonic()
+        tree: dict[str, Any] = {}
+        if summaries:
+            landsdelar, tree["helalandet"] = await asyncio.gather(
+                walk_abin_tree(load, summaries=True), load(AbinEndpoints.HELALANDET)
+            )
+        else:
+            landsdelar = await walk_abin_tree(load)
+        tree["landsdel"] = landsdelar
+
+        self.builds += 1
+        self.last_duration = time.monotonic() - started
+        logger.info(f"Built ABIN tree in {self.last_duration:.1f}s")
+        return dumps(tree)
+
+    def stats(self) -> dict[str, Any]:
+        """Return build counters."""
+        return {
+            "builds": self.builds,
+            "last_duration": round(self.last_duration, 2) if self.last_duration else None,
+        }
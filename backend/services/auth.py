@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import asyncio
+import time
+from typing import Any
 
 import httpx
 
 from backend.core.config import Settings
 from backend.core.exceptions import AuthenticationError
 from backend.core.logging import get_logger
+from backend.services.bulkhead import Bulkhead, http_pool_stats
+from backend.services.token_store import StoredToken, TokenStore
 
 logger = get_logger(__name__)
 
@@ -14,10 +18,22 @@ logger = get_logger(__name__)
 class SkogsstyrelsenAuth:
     """Handles OAuth2 authentication for Skogsstyrelsen APIs."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, token_store: TokenStore | None = None) -> None:
         self.settings = settings
+        self.token_store = token_store
         self._access_token: str | None = None
-        self._token_expiry: datetime | None = None
+        # Expiry as a time.monotonic() timestamp, immune to wall clock changes
+        self._token_expiry: float | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self._refresh_task: asyncio.Task[str] | None = None
+        self._renewal_task: asyncio.Task[None] | None = None
+        # Token requests get their own pool so API traffic cannot block them
+        self.bulkhead = Bulkhead(
+            "auth",
+            settings.auth_max_connections,
+            settings.auth_max_queue,
+            settings.bulkhead_queue_timeout_seconds,
+        )
 
         if not settings.skogsstyrelsen_client_id or not settings.skogsstyrelsen_client_secret:
             raise AuthenticationError(
@@ -29,7 +45,28 @@ class SkogsstyrelsenAuth:
         if self._is_token_valid():
             return self._access_token
 
-        return await self._fetch_new_token()
+        return await self._refresh()
+
+    def start(self) -> None:
+        """Start background renewal so requests never wait on the auth server."""
+        if self._renewal_task is None or self._renewal_task.done():
+            self._renewal_task = asyncio.create_task(self._renewal_loop())
+
+    async def close(self) -> None:
+        """Stop background renewal and release the auth connection pool."""
+        for task in (self._renewal_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, AuthenticationError):
+                    pass
+        self._renewal_task = None
+        self._refresh_task = None
+
+        if self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+            self._http_client = None
 
     def _is_token_valid(self) -> bool:
         """Check if current token is still valid."""
@@ -37,15 +74,104 @@ class SkogsstyrelsenAuth:
             return False
 
         # Refresh token before expiry (configurable buffer)
-        buffer = timedelta(minutes=self.settings.token_refresh_buffer_minutes)
-        return datetime.now() < (self._token_expiry - buffer)
+        buffer = self.settings.token_refresh_buffer_minutes * 60
+        return time.monotonic() < (self._token_expiry - buffer)
+
+    def _seconds_until_renewal(self) -> float:
+        """Seconds until the background task should renew the token."""
+        if not self._access_token or not self._token_expiry:
+            return 0.0
+
+        # Renew ahead of the request-path buffer so get_token stays a cache hit
+        lead = (
+            self.settings.token_refresh_buffer_minutes * 60
+            + self.settings.token_renewal_lead_seconds
+        )
+        return max(0.0, self._token_expiry - lead - time.monotonic())
+
+    async def _renewal_loop(self) -> None:
+        """Keep the token fresh until cancelled."""
+        while True:
+            await asyncio.sleep(self._seconds_until_renewal())
+            try:
+                await self._refresh()
+            except AuthenticationError as e:
+                logger.warning(f"Background token renewal failed: {e.message}")
+                await asyncio.sleep(self.settings.token_renewal_retry_seconds)
+
+    async def _refresh(self) -> str:
+        """Refresh the token, sharing a single in-flight fetch between callers."""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._fetch_new_token())
+            self._refresh_task.add_done_callback(self._clear_refresh_task)
+
+        # Shield so a cancelled caller does not cancel the fetch other callers await
+        return await asyncio.shield(self._refresh_task)
+
+    def _clear_refresh_task(self, task: asyncio.Task[str]) -> None:
+        """Forget a finished refresh so the next expiry starts a new one."""
+        if self._refresh_task is task:
+            self._refresh_task = None
+        # Mark failures as retrieved when every caller has gone away
+        if not task.cancelled():
+            task.exception()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create reusable HTTP client for the auth server."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=self.settings.auth_request_timeout,
+                limits=httpx.Limits(max_connections=self.settings.auth_max_connections),
+            )
+        return self._http_client
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Return connection pool and queue statistics for the auth server."""
+        stats = http_pool_stats(self._http_client)
+        stats["bulkhead"] = self.bulkhead.stats()
+        return stats
 
     async def _fetch_new_token(self) -> str:
+        """Get a new token from the shared store or, failing that, the auth server."""
+        if self.token_store is None:
+            return await self._request_token()
+
+        async with self.token_store.lock():
+            # Another worker may already have refreshed while we waited for the lock
+            stored = await self.token_store.load()
+            if stored is not None and self._adopt_stored_token(stored):
+                logger.debug("Using OAuth2 token from shared token store")
+                return self._access_token
+
+            token = await self._request_token()
+            remaining = self._token_expiry - time.monotonic()
+            await self.token_store.save(
+                StoredToken(access_token=token, expires_at=time.time() + remaining)
+            )
+            return token
+
+    def _adopt_stored_token(self, stored: StoredToken) -> bool:
+        """Use a shared token unless it is already due for renewal."""
+        remaining = stored.expires_at - time.time()
+        lead = (
+            self.settings.token_refresh_buffer_minutes * 60
+            + self.settings.token_renewal_lead_seconds
+        )
+        if remaining <= lead:
+            return False
+
+        self._access_token = stored.access_token
+        self._token_expiry = time.monotonic() + remaining
+        return True
+
+    async def _request_token(self) -> str:
         """Fetch new access token from auth server."""
         logger.info("Fetching new OAuth2 token")
 
         try:
-            async with httpx.AsyncClient(timeout=self.settings.auth_request_timeout) as client:
+            client = await self._get_client()
+            async with self.bulkhead.acquire():
+                requested_at = time.monotonic()
                 response = await client.post(
                     self.settings.skogsstyrelsen_auth_url,
                     data={
@@ -56,16 +182,15 @@ class SkogsstyrelsenAuth:
                     },
                     headers={"Content-Type": "application/x-www-form-urlencoded"},
                 )
-                response.raise_for_status()
+            response.raise_for_status()
 
-                data = response.json()
-                self._access_token = data["access_token"]
-                self._token_expiry = datetime.now() + timedelta(
-                    seconds=data["expires_in"]
-                )
+            data = response.json()
+            self._access_token = data["access_token"]
+            # Count lifetime from when the request was sent, not when it returned
+            self._token_expiry = requested_at + data["expires_in"]
 
-                logger.info("Successfully obtained OAuth2 token")
-                return self._access_token
+            logger.info("Successfully obtained OAuth2 token")
+            return self._access_token
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Authentication failed: {e.response.status_code}")
@@ -0,0 +1,208 @@
+"""Batch statistics computed with bounded concurrency and streamed back as NDJSON."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Sequence,
+)
+from functools import partial
+from typing import Any, TypeVar
+
+from pydantic import ValidationError
+
+from backend.api.constants import GRUNDDATA_METRICS
+from backend.core.exceptions import SkogsstyrelsenError
+from backend.models.requests import BatchItem
+from backend.services.fanout import dumps, error_dict, fan_out, merge_results
+from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_END = object()
+
+
+def invalid_item(error: ValueError) -> dict[str, Any]:
+    """Describe why a batch item was rejected, like a request validation error."""
+    if isinstance(error, ValidationError):
+        detail: Any = error.errors(include_url=False, include_context=False, include_input=False)
+    else:
+        detail = str(error)
+    return {"type": "validation_error", "detail": detail, "status_code": 422}
+
+
+class ItemTooLarge:
+    """Placeholder for an NDJSON line that exceeded the size limit and was skipped."""
+
+
+async def ndjson_lines(
+    chunks: AsyncIterable[bytes], max_line_bytes: int
+) -> AsyncIterator[bytes | ItemTooLarge]:
+    """Split a byte stream into non-blank lines, holding at most one line in memory.
+
+    Lines longer than ``max_line_bytes`` are dropped and reported as
+    ``ItemTooLarge`` so their position in the batch is kept.
+    """
+    buffer = bytearray()
+    skipping = False
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            if skipping:
+                skipping = False
+                yield ItemTooLarge()
+            else:
+                buffer += chunk[start:end]
+                if len(buffer) > max_line_bytes:
+                    yield ItemTooLarge()
+                elif buffer.strip():
+                    yield bytes(buffer)
+            buffer.clear()
+            start = end + 1
+        if not skipping:
+            buffer += chunk[start:]
+            if len(buffer) > max_line_bytes:
+                skipping = True
+                buffer.clear()
+    if skipping:
+        yield ItemTooLarge()
+    elif buffer.strip():
+        yield bytes(buffer)
+
+
+async def _next(iterator: AsyncIterator[T]) -> Any:
+    """Next item of an async iterator, or ``_END`` once it is exhausted."""
+    try:
+        return await anext(iterator)
+    except StopAsyncIteration:
+        return _END
+
+
+async def bounded_as_completed(
+    items: AsyncIterable[T], worker: Callable[[T], Awaitable[R]], concurrency: int
+) -> AsyncIterator[R]:
+    """Run ``worker`` on items, ``concurrency`` at a time, yielding results as they finish.
+
+    Items are only pulled from ``items`` when a slot is free, so a slow
+    consumer or upstream holds back reading the input rather than
+    buffering it. Results are yielded as soon as they are done, even while
+    the next item is still being read.
+    """
+    iterator = aiter(items)
+    running: set[asyncio.Task[R]] = set()
+    reader: asyncio.Task[Any] | None = None
+    exhausted = False
+    try:
+        while True:
+            if reader is None and not exhausted and len(running) < concurrency:
+                reader = asyncio.create_task(_next(iterator))
+            waiting = (running | {reader}) if reader is not None else running
+            if not waiting:
+                return
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if reader in done:
+                item = reader.result()
+                reader = None
+                if item is _END:
+                    exhausted = True
+                else:
+                    running.add(asyncio.create_task(worker(item)))
+            for task in done & running:
+                running.discard(task)
+                yield task.result()
+    finally:
+        pending = [*running, *([reader] if reader is not None else [])]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+class BatchRunner:
+    """Compute selected grunddata metrics for many areas, one NDJSON line per area.
+
+    Each line carries the area's position in the batch as ``index``, its
+    ``id`` if given, and a ``status`` of ``ok``, ``partial`` (some metrics
+    failed) or ``error`` (invalid item, or every metric failed).
+    """
+
+    def __init__(
+        self,
+        client: SkogsstyrelsenClient,
+        metrics: Sequence[str] = tuple(GRUNDDATA_METRICS),
+        concurrency: int = 8,
+    ) -> None:
+        self.client = client
+        self.metrics = list(metrics)
+        self.concurrency = concurrency
+
+    async def run(self, items: AsyncIterable[Any] | Iterable[Any]) -> AsyncIterator[bytes]:
+        """Stream a result line for each item, in completion order.
+
+        Items are NDJSON lines (``bytes``), already decoded JSON values, or
+        ``ItemTooLarge``.
+        """
+
+        async def numbered() -> AsyncIterator[tuple[int, Any]]:
+            if isinstance(items, AsyncIterable):
+                index = 0
+                async for item in items:
+                    yield index, item
+                    index += 1
+            else:
+                for numbered_item in enumerate(items):
+                    yield numbered_item
+
+        async for _, _, line in self.run_numbered(numbered()):
+            yield line
+
+    async def run_numbered(
+        self, items: AsyncIterable[tuple[int, Any]]
+    ) -> AsyncIterator[tuple[int, str, bytes]]:
+        """Stream ``(index, status, line)`` for already numbered items, in completion order."""
+        async for result in bounded_as_completed(items, self._run_item, self.concurrency):
+            yield result
+
+    async def _run_item(self, numbered_item: tuple[int, Any]) -> tuple[int, str, bytes]:
+        """Compute one area's metrics, reporting any failure in its line."""
+        index, raw = numbered_item
+        try:
+            if isinstance(raw, ItemTooLarge):
+                raise ValueError("Item exceeds the maximum size")
+            if isinstance(raw, bytes):
+                raw = json.loads(raw)
+            item = BatchItem.model_validate(raw)
+        except ValueError as e:
+            item_id = raw.get("id") if isinstance(raw, dict) else None
+            return index, "error", self._line(index, item_id, "error", error=invalid_item(e))
+
+        body = item.to_api_dict()
+        started = time.monotonic()
+        try:
+            results = await fan_out(
+                {
+                    name: partial(self.client.post_raw, GRUNDDATA_METRICS[name], json_data=body)
+                    for name in item.metrics or self.metrics
+                }
+            )
+        except SkogsstyrelsenError as e:
+            return index, "error", self._line(index, item.id, "error", error=error_dict(e))
+
+        status = "ok" if all(result.ok for result in results) else "partial"
+        fields = {"index": index, "id": item.id, "status": status}
+        line = merge_results(results, "metrics", time.monotonic() - started, fields) + b"\n"
+        return index, status, line
+
+    @staticmethod
+    def _line(index: int, item_id: Any, status: str, **fields: Any) -> bytes:
+        """NDJSON line for an area that has no metric results."""
+        return dumps({"index": index, "id": item_id, "status": status, **fields}) + b"\n"
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+
+from backend.core.exceptions import BulkheadFullError
+from backend.services.limiter import AdaptiveLimiter
+
+
+class Bulkhead:
+    """Concurrency cap with a bounded wait queue for one upstream pool.
+
+    At most ``max_concurrent`` calls run at once, or fewer when an adaptive
+    limiter sets a lower limit. Up to ``max_queue`` more wait for a slot in
+    arrival order, each for at most ``queue_timeout`` seconds; anything
+    beyond that is rejected immediately so a slow API cannot pile up work.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        limiter: AdaptiveLimiter | None = None,
+    ) -> None:
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.limiter = limiter
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.active = 0
+        self.peak_queued = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    @property
+    def limit(self) -> int:
+        """Number of calls currently allowed in flight."""
+        if self.limiter is None:
+            return self.max_concurrent
+        return min(self.max_concurrent, self.limiter.limit)
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot."""
+        return len(self._waiters)
+
+    def has_free_slot(self) -> bool:
+        """Check if a call would start at once without queueing."""
+        return self.active < self.limit and not self._waiters
+
+    async def enter(self) -> None:
+        """Take a concurrency slot, queueing for one if necessary; pair with ``release``.
+
+        Raises:
+            BulkheadFullError: If the queue is full or the wait times out.
+        """
+        if self.has_free_slot():
+            self.active += 1
+        else:
+            await self._wait_for_slot()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot, queueing for one if necessary.
+
+        Raises:
+            BulkheadFullError: If the queue is full or the wait times out.
+        """
+        await self.enter()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        """Free a slot and hand free slots to waiters, e.g. after the limit grew."""
+        self.active -= 1
+        self._wake()
+
+    def on_success(self, latency: float) -> None:
+        """Feed a successful call's latency to the adaptive limiter, if any."""
+        if self.limiter is not None:
+            # Count this call too; it has already released its slot
+            self.limiter.on_success(latency, self.active + self.queued + 1)
+            self._wake()
+
+    def on_overload(self) -> None:
+        """Tell the adaptive limiter, if any, that the upstream is struggling."""
+        if self.limiter is not None:
+            self.limiter.on_overload()
+
+    async def _wait_for_slot(self) -> None:
+        """Queue until ``_wake`` hands this call a slot."""
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise BulkheadFullError(f"Too many pending {self.name} requests, try again later")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.peak_queued = max(self.peak_queued, len(self._waiters))
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as the wait ended; pass it on
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                self.timeouts += 1
+                raise BulkheadFullError(
+                    f"Timed out waiting for a {self.name} connection, try again later"
+                )
+            raise
+
+    def _wake(self) -> None:
+        """Grant free slots to waiters in arrival order."""
+        while self._waiters and self.active < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        """Return concurrency and queue-depth counters."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "limit": self.limit,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "limiter": self.limiter.stats() if self.limiter is not None else None,
+        }
+
+
+def http_pool_stats(http_client: httpx.AsyncClient | None) -> dict[str, Any]:
+    """Return connection statistics for an httpx client's pool."""
+    stats: dict[str, Any] = {
+        "open": http_client is not None and not http_client.is_closed,
+        "connections": 0,
+        "idle_connections": 0,
+        "active_connections": 0,
+        "pending_requests": 0,
+    }
+    if not stats["open"]:
+        return stats
+
+    # httpx does not expose pool state publicly; read it from the httpcore pool
+    pool = getattr(http_client._transport, "_pool", None)
+    if pool is None:
+        return stats
+
+    connections = list(pool.connections)
+    idle = sum(1 for connection in connections if connection.is_idle())
+    stats["connections"] = len(connections)
+    stats["idle_connections"] = idle
+    stats["active_connections"] = len(connections) - idle
+    stats["pending_requests"] = len(getattr(pool, "_requests", []))
+    return stats
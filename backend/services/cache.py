@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.api.constants import (
+    ABIN_TREE_CACHE_ENDPOINT,
+    API_FAMILY_PREFIXES,
+    API_INFO_ENDPOINTS,
+    AbinEndpoints,
+    GrundataEndpoints,
+    RasterEndpoints,
+    api_family,
+)
+from backend.core.config import Settings
+from backend.core.logging import get_logger
+from backend.services.disk_cache import DiskCache
+from backend.services.encoding import COMPRESSION_ENCODINGS, compress_body, compression_levels
+from backend.services.geometry import canonicalize_statistics_body
+from backend.services.keys import make_etag, request_key
+
+logger = get_logger(__name__)
+
+DEFAULT_REGION = "default"
+GEOMETRY_REGION = "geometry"
+
+
+@dataclass
+class CacheEntry:
+    """Cached upstream response body, ready to send.
+
+    Besides the identity body it holds precompressed variants per
+    Content-Encoding and a strong ETag, so a hit needs no serialization,
+    compression or hashing.
+    """
+
+    endpoint: str
+    content: bytes
+    expires_at: float  # time.monotonic() timestamp
+    # Until then an expired entry may still be served while it is refreshed
+    stale_until: float | None = None
+    stored_at: float = field(default_factory=time.monotonic)
+    variants: dict[str, bytes] = field(default_factory=dict)  # Content-Encoding -> body
+    etag: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.etag:
+            self.etag = make_etag(self.content)
+
+    @property
+    def size(self) -> int:
+        """Size of the cached body and its variants in bytes."""
+        return len(self.content) + sum(len(variant) for variant in self.variants.values())
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Check if the entry is still within its TTL."""
+        return (now if now is not None else time.monotonic()) < self.expires_at
+
+    def is_servable(self, now: float | None = None) -> bool:
+        """Check if the entry is fresh or within its stale-while-revalidate bound."""
+        now = now if now is not None else time.monotonic()
+        return now < max(self.expires_at, self.stale_until or 0.0)
+
+    def json(self) -> Any:
+        """Decode the cached body."""
+        return json.loads(self.content)
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """Caching policy for one upstream endpoint template."""
+
+    method: str
+    pattern: re.Pattern[str]
+    ttl: float
+    region: str = DEFAULT_REGION
+    # Key the request body by canonical geometry instead of the raw WKT text
+    canonical_geometry: bool = False
+    # How long past the TTL an entry may be served while it is refreshed
+    max_stale: float = 0.0
+    # Namespace keys by the family's upstream API version
+    versioned: bool = True
+
+    @classmethod
+    def for_endpoint(
+        cls,
+        method: str,
+        template: str,
+        ttl: float,
+        region: str = DEFAULT_REGION,
+        canonical_geometry: bool = False,
+        max_stale: float = 0.0,
+        versioned: bool = True,
+    ) -> CacheRule:
+        """Build a rule matching an endpoint template such as '/abin/v2/lan/{lankod}'."""
+        regex = re.sub(r"\\\{[^}]+\\\}", "[^/]+", re.escape(template))
+        return cls(
+            method.upper(),
+            re.compile(f"^{regex}$"),
+            ttl,
+            region,
+            canonical_geometry,
+            max_stale,
+            versioned,
+        )
+
+    def matches(self, method: str, endpoint: str) -> bool:
+        """Check if the rule applies to a request."""
+        return method.upper() == self.method and self.pattern.match(endpoint) is not None
+
+
+class LRUByteCache:
+    """In-memory LRU cache bounded by the total size of stored bodies."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, allow_expired: bool = False) -> CacheEntry | None:
+        """Get a fresh or still servable stale entry, dropping it once past both.
+
+        With ``allow_expired`` any stored entry is returned, for use as a
+        last resort while the upstream is unavailable.
+        """
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and not allow_expired and not entry.is_servable(now):
+            self.delete(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if entry.is_fresh(now):
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> bool:
+        """Store an entry, evicting least recently used entries to make room."""
+        if entry.size > self.max_bytes:
+            return False
+
+        self.delete(key)
+        while self._entries and self._bytes + entry.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+        self._entries[key] = entry
+        self._bytes += entry.size
+        return True
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def invalidate(self, endpoint_prefix: str | None = None) -> int:
+        """Remove entries whose endpoint starts with prefix, or all entries."""
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if endpoint_prefix is None or entry.endpoint.startswith(endpoint_prefix)
+        ]
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def build_cache_rules(settings: Settings) -> list[CacheRule]:
+    """Caching policy for upstream endpoints whose data rarely changes."""
+    summary_ttl = settings.cache_abin_ttl_seconds
+    metadata_ttl = settings.cache_abin_metadata_ttl_seconds
+    geometry_ttl = settings.cache_abin_geometry_ttl_seconds
+    api_info_ttl = settings.cache_api_info_ttl_seconds
+    max_stale = (
+        settings.cache_max_stale_seconds if settings.cache_stale_while_revalidate else 0.0
+    )
+
+    # Metadata first: '/abin/v2/landsdel/metadata' also matches the landsdel template
+    rules = [
+        (AbinEndpoints.LANDSDEL_METADATA, metadata_ttl),
+        (AbinEndpoints.LAN_METADATA, metadata_ttl),
+        (AbinEndpoints.AFO_METADATA, metadata_ttl),
+        (AbinEndpoints.STRATUM_METADATA, metadata_ttl),
+        (AbinEndpoints.API_INFO, api_info_ttl),
+        (RasterEndpoints.API_INFO, api_info_ttl),
+        (GrundataEndpoints.API_INFO, api_info_ttl),
+        (GrundataEndpoints.VALID_DATES, settings.cache_valid_dates_ttl_seconds),
+        (AbinEndpoints.HELALANDET, summary_ttl),
+        (AbinEndpoints.LANDSDEL, summary_ttl),
+        (AbinEndpoints.LAN, summary_ttl),
+        (AbinEndpoints.AFO, summary_ttl),
+        (AbinEndpoints.STRATUM, summary_ttl),
+        # May include summaries, so it is kept no longer than they are
+        (ABIN_TREE_CACHE_ENDPOINT, summary_ttl),
+    ]
+    geometry_rules = [
+        AbinEndpoints.HELALANDET_GEOMETRI,
+        AbinEndpoints.LANDSDEL_GEOMETRI,
+        AbinEndpoints.LAN_GEOMETRI,
+        AbinEndpoints.AFO_GEOMETRI,
+        AbinEndpoints.STRATUM_GEOMETRI,
+    ]
+    statistics_rules = [
+        GrundataEndpoints.BIOMASSA,
+        GrundataEndpoints.BIOMASSA_HISTOGRAM,
+        GrundataEndpoints.VOLYM,
+        GrundataEndpoints.VOLYM_HISTOGRAM,
+        GrundataEndpoints.GRUNDYTA,
+        GrundataEndpoints.GRUNDYTA_HISTOGRAM,
+        GrundataEndpoints.MEDELHOJD,
+        GrundataEndpoints.MEDELHOJD_HISTOGRAM,
+        GrundataEndpoints.MEDELDIAMETER,
+        GrundataEndpoints.MEDELDIAMETER_HISTOGRAM,
+    ]
+    return (
+        [
+            CacheRule.for_endpoint(
+                "GET",
+                template,
+                ttl,
+                max_stale=max_stale,
+                # api-info is what versions are read from
+                versioned=template not in API_INFO_ENDPOINTS.values(),
+            )
+            for template, ttl in rules
+        ]
+        + [
+            CacheRule.for_endpoint(
+                "GET", template, geometry_ttl, GEOMETRY_REGION, max_stale=max_stale
+            )
+            for template in geometry_rules
+        ]
+        + [
+            CacheRule.for_endpoint(
+                "POST",
+                template,
+                settings.cache_grunddata_ttl_seconds,
+                canonical_geometry=True,
+            )
+            for template in statistics_rules
+        ]
+    )
+
+
+class ResponseCache:
+    """TTL cache for upstream responses with separate size budgets per region.
+
+    Large geometry payloads get their own region so they cannot evict the
+    small, frequently used metadata entries. An optional disk tier sits
+    beneath the memory regions so entries survive restarts.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        rules: list[CacheRule] | None = None,
+        disk: DiskCache | None = None,
+    ) -> None:
+        self.rules = rules if rules is not None else build_cache_rules(settings)
+        self.geometry_precision = settings.cache_geometry_precision
+        self.regions = {
+            DEFAULT_REGION: LRUByteCache(settings.cache_max_bytes),
+            GEOMETRY_REGION: LRUByteCache(settings.cache_geometry_max_bytes),
+        }
+        self.disk = disk
+        self._disk_writes: set[asyncio.Task[None]] = set()
+        # Encodings each entry is precompressed in when stored
+        self.compression_levels = (
+            compression_levels(settings) if settings.compression_enabled else {}
+        )
+        self.compression_min_size = settings.compression_min_size
+        # Upstream API version per family; keys are namespaced by it
+        self.versions: dict[str, str] = {}
+
+    async def start(self) -> None:
+        """Open the disk tier, if any."""
+        if self.disk is not None:
+            await self.disk.start()
+
+    async def close(self) -> None:
+        """Finish pending disk writes and close the disk tier."""
+        if self._disk_writes:
+            await asyncio.gather(*self._disk_writes, return_exceptions=True)
+        if self.disk is not None:
+            await self.disk.close()
+
+    def key_for(
+        self,
+        rule: CacheRule | None,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> str:
+        """Build the cache key for a request under its rule."""
+        if rule is not None and rule.canonical_geometry and json_data is not None:
+            json_data = canonicalize_statistics_body(json_data, self.geometry_precision)
+        key = request_key(method, endpoint, params, json_data)
+        version = self.versions.get(api_family(endpoint)) if rule and rule.versioned else None
+        return f"{version} {key}" if version else key
+
+    async def set_version(self, family: str, version: str) -> bool:
+        """Record a family's upstream API version, returning whether it replaced another.
+
+        New keys are namespaced by the version, so responses cached for an
+        older version are never served again; they are dropped to free space.
+        """
+        previous = self.versions.get(family)
+        self.versions[family] = version
+        if previous is None or previous == version:
+            return False
+
+        removed = await self.invalidate(API_FAMILY_PREFIXES[family])
+        logger.info(
+            f"{family} API version changed from {previous} to {version}, "
+            f"dropped {removed} cached responses"
+        )
+        return True
+
+    def max_entry_bytes(self, rule: CacheRule) -> int:
+        """Largest body that fits in the rule's region."""
+        return self.regions[rule.region].max_bytes
+
+    def rule_for(self, method: str, endpoint: str) -> CacheRule | None:
+        """Find the caching rule for a request, or None if it is not cacheable."""
+        for rule in self.rules:
+            if rule.matches(method, endpoint):
+                return rule
+        return None
+
+    async def get(
+        self, rule: CacheRule, key: str, endpoint: str, allow_expired: bool = False
+    ) -> CacheEntry | None:
+        """Get a servable cached response from memory, falling back to disk.
+
+        The entry may be stale; callers check ``is_fresh`` and revalidate.
+        ``allow_expired`` also returns entries past their stale bound.
+        """
+        region = self.regions[rule.region]
+        entry = region.get(key, allow_expired)
+        if entry is not None or self.disk is None:
+            return entry
+
+        try:
+            found = await self.disk.get(key, allow_expired)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+        if found is None:
+            return None
+
+        # Promote to memory, converting wall-clock times to monotonic time
+        content, expires_at, stale_until = found
+        offset = time.monotonic() - time.time()
+        entry = CacheEntry(
+            endpoint=endpoint,
+            content=content,
+            expires_at=expires_at + offset,
+            stale_until=stale_until + offset,
+            variants=await self._precompress(content),
+        )
+        region.set(key, entry)
+        return entry
+
+    async def set(self, rule: CacheRule, key: str, endpoint: str, content: bytes) -> CacheEntry:
+        """Cache a response body for the rule's TTL, returning the new entry.
+
+        The entry is returned even if it is too large to keep in memory. The
+        disk write runs in the background so it never delays the response.
+        """
+        variants = await self._precompress(content)
+        now = time.monotonic()
+        entry = CacheEntry(
+            endpoint=endpoint,
+            content=content,
+            expires_at=now + rule.ttl,
+            stale_until=now + rule.ttl + rule.max_stale,
+            variants=variants,
+        )
+        self.regions[rule.region].set(key, entry)
+
+        if self.disk is not None:
+            task = asyncio.create_task(self._write_disk(key, endpoint, content, rule))
+            self._disk_writes.add(task)
+            task.add_done_callback(self._disk_writes.discard)
+        return entry
+
+    async def _precompress(self, content: bytes) -> dict[str, bytes]:
+        """Compress a body in every response encoding, off the event loop.
+
+        Variants that would not be smaller than the body are left out.
+        """
+        if not self.compression_levels or len(content) < self.compression_min_size:
+            return {}
+
+        def compress_all() -> dict[str, bytes]:
+            variants = {}
+            for encoding in COMPRESSION_ENCODINGS:
+                if encoding in self.compression_levels:
+                    variant = compress_body(content, encoding, self.compression_levels[encoding])
+                    if len(variant) < len(content):
+                        variants[encoding] = variant
+            return variants
+
+        return await asyncio.to_thread(compress_all)
+
+    async def _write_disk(self, key: str, endpoint: str, content: bytes, rule: CacheRule) -> None:
+        """Persist an entry, logging instead of failing the request on errors."""
+        expires_at = time.time() + rule.ttl
+        try:
+            await self.disk.set(key, endpoint, content, expires_at, expires_at + rule.max_stale)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache write failed: {e}")
+
+    async def invalidate(self, endpoint_prefix: str | None = None) -> int:
+        """Remove cached responses for endpoints starting with prefix, or everything."""
+        removed = sum(region.invalidate(endpoint_prefix) for region in self.regions.values())
+        if self.disk is not None:
+            removed += await self.disk.invalidate(endpoint_prefix)
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters per region."""
+        stats: dict[str, Any] = {name: region.stats() for name, region in self.regions.items()}
+        if self.disk is not None:
+            stats["disk"] = self.disk.stats()
+        return stats
+
+
+def create_response_cache(settings: Settings) -> ResponseCache | None:
+    """Create the configured response cache, or None when caching is disabled."""
+    if not settings.cache_enabled:
+        return None
+
+    disk = None
+    if settings.disk_cache_path:
+        disk = DiskCache(
+            settings.disk_cache_path,
+            max_bytes=settings.disk_cache_max_bytes,
+            compaction_interval=settings.disk_cache_compaction_interval_seconds,
+            compression_level=settings.disk_cache_compression_level,
+        )
+    return ResponseCache(settings, disk=disk)
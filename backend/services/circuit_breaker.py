@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any
+
+from backend.core.config import Settings
+from backend.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker for one upstream API, tripped by errors or slow calls.
+
+    Outcomes are kept for a rolling window. Once at least ``minimum_calls``
+    were seen and the failure or slow-call ratio crosses its threshold, the
+    breaker opens and rejects calls for ``open_seconds``. It then lets a few
+    probe calls through (half-open): a successful probe closes it again, a
+    failed one reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: float = 30.0,
+        minimum_calls: int = 10,
+        failure_ratio: float = 0.5,
+        slow_call_seconds: float = 10.0,
+        slow_call_ratio: float = 0.8,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 1,
+    ) -> None:
+        self.name = name
+        self.window = window
+        self.minimum_calls = minimum_calls
+        self.failure_ratio = failure_ratio
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_ratio = slow_call_ratio
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        # (time.monotonic(), failed, slow) per completed call
+        self._outcomes: deque[tuple[float, bool, bool]] = deque()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the open period ends."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info(f"Circuit breaker {self.name} half-open, probing upstream")
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets probe calls through."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Check if a call may go upstream, reserving a probe slot when half-open."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes < self.half_open_calls:
+            self._probes += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def release(self) -> None:
+        """Give back a probe slot taken by a call that never completed."""
+        if self._state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def record_success(self, duration: float) -> None:
+        """Record a completed call; slow calls count toward the slow-call ratio."""
+        slow = duration >= self.slow_call_seconds
+        if self._state == HALF_OPEN:
+            if slow:
+                self._trip()
+            else:
+                self._close()
+            return
+        self._record(failed=False, slow=slow)
+
+    def record_failure(self) -> None:
+        """Record an upstream failure (5xx, 429 or transport error)."""
+        if self._state == HALF_OPEN:
+            self._trip()
+            return
+        self._record(failed=True, slow=False)
+
+    def stats(self) -> dict[str, Any]:
+        """Return breaker state and counters."""
+        self._prune(time.monotonic())
+        calls = len(self._outcomes)
+        return {
+            "state": self.state,
+            "calls": calls,
+            "failures": sum(1 for _, failed, _ in self._outcomes if failed),
+            "slow_calls": sum(1 for _, _, slow in self._outcomes if slow),
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+            "retry_after": round(self.retry_after(), 1),
+        }
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        """Add an outcome and trip the breaker if a threshold is crossed."""
+        now = time.monotonic()
+        self._outcomes.append((now, failed, slow))
+        self._prune(now)
+        if self._state != CLOSED:
+            return
+
+        calls = len(self._outcomes)
+        if calls < self.minimum_calls:
+            return
+        failures = sum(1 for _, failed, _ in self._outcomes if failed)
+        slow_calls = sum(1 for _, _, slow in self._outcomes if slow)
+        if failures / calls >= self.failure_ratio or slow_calls / calls >= self.slow_call_ratio:
+            self._trip()
+
+    def _prune(self, now: float) -> None:
+        """Drop outcomes older than the window."""
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            self._outcomes.popleft()
+
+    def _trip(self) -> None:
+        """Open the breaker."""
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.times_opened += 1
+        logger.warning(
+            f"Circuit breaker {self.name} opened for {self.open_seconds:.0f}s"
+        )
+
+    def _close(self) -> None:
+        """Close the breaker after a successful probe."""
+        self._state = CLOSED
+        self._outcomes.clear()
+        logger.info(f"Circuit breaker {self.name} closed")
+
+
+def create_circuit_breakers(settings: Settings, names: list[str]) -> dict[str, CircuitBreaker]:
+    """Create one breaker per API family, or none when disabled."""
+    if not settings.circuit_breaker_enabled:
+        return {}
+    return {
+        name: CircuitBreaker(
+            name,
+            window=settings.circuit_breaker_window_seconds,
+            minimum_calls=settings.circuit_breaker_minimum_calls,
+            failure_ratio=settings.circuit_breaker_failure_ratio,
+            slow_call_seconds=settings.circuit_breaker_slow_call_seconds,
+            slow_call_ratio=settings.circuit_breaker_slow_call_ratio,
+            open_seconds=settings.circuit_breaker_open_seconds,
+            half_open_calls=settings.circuit_breaker_half_open_calls,
+        )
+        for name in names
+    }
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+import zstandard
+
+from backend.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Bump when the table layout changes; older cache files are discarded
+_SCHEMA_VERSION = 2
+_SCHEMA = """
+DROP TABLE IF EXISTS responses;
+CREATE TABLE responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    content BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    stale_until REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX responses_accessed_at ON responses (accessed_at);
+CREATE INDEX responses_stale_until ON responses (stale_until);
+"""
+
+
+class DiskCache:
+    """SQLite-backed, zstd-compressed cache tier that survives restarts.
+
+    Expiry times are wall-clock epoch seconds so they stay meaningful across
+    processes and restarts. Blocking SQLite calls run in worker threads.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int,
+        compaction_interval: float = 600.0,
+        compression_level: int = 3,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.compaction_interval = compaction_interval
+        self._compressor = zstandard.ZstdCompressor(level=compression_level)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._compaction_task: asyncio.Task[None] | None = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (call with the lock held)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+            # Must precede table creation; lets compaction release pages cheaply
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL lets several workers read while one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            self._conn = conn
+        return self._conn
+
+    async def start(self) -> None:
+        """Open the database and start background compaction."""
+        await asyncio.to_thread(self._locked, self._connect)
+        if self._compaction_task is None or self._compaction_task.done():
+            self._compaction_task = asyncio.create_task(self._compaction_loop())
+
+    async def close(self) -> None:
+        """Stop compaction and close the database."""
+        if self._compaction_task is not None:
+            self._compaction_task.cancel()
+            try:
+                await self._compaction_task
+            except asyncio.CancelledError:
+                pass
+            self._compaction_task = None
+
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def get(
+        self, key: str, allow_expired: bool = False
+    ) -> tuple[bytes, float, float] | None:
+        """Get a servable body with its wall-clock expiry and stale bound.
+
+        With ``allow_expired`` rows past their stale bound are returned too,
+        until compaction removes them.
+        """
+        row = await asyncio.to_thread(self._locked, self._get, key, allow_expired)
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        compressed, expires_at, stale_until = row
+        return self._decompressor.decompress(compressed), expires_at, stale_until
+
+    async def set(
+        self,
+        key: str,
+        endpoint: str,
+        content: bytes,
+        expires_at: float,
+        stale_until: float | None = None,
+    ) -> None:
+        """Store a body until the wall-clock expiry, servable stale until stale_until."""
+        compressed = await asyncio.to_thread(self._compressor.compress, content)
+        await asyncio.to_thread(
+            self._locked,
+            self._set,
+            key,
+            endpoint,
+            compressed,
+            expires_at,
+            max(expires_at, stale_until or 0.0),
+        )
+
+    async def invalidate(self, endpoint_prefix: str | None = None) -> int:
+        """Remove entries whose endpoint starts with prefix, or all entries."""
+        return await asyncio.to_thread(self._locked, self._invalidate, endpoint_prefix)
+
+    async def compact(self) -> int:
+        """Drop expired entries and evict least recently used ones over the size cap."""
+        removed = await asyncio.to_thread(self._locked, self._compact)
+        if removed:
+            logger.info(f"Disk cache compaction removed {removed} entries")
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters."""
+        return {
+            "path": str(self.path),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    async def _compaction_loop(self) -> None:
+        """Compact periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.compaction_interval)
+            try:
+                await self.compact()
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache compaction failed: {e}")
+
+    def _locked(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a database operation while holding the connection lock."""
+        with self._lock:
+            return fn(*args)
+
+    def _get(self, key: str, allow_expired: bool) -> tuple[bytes, float, float] | None:
+        """Read a servable row and record the access."""
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT content, expires_at, stale_until FROM responses "
+            "WHERE key = ? AND stale_until > ?",
+            (key, float("-inf") if allow_expired else now),
+        ).fetchone()
+        if row is not None:
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+        return row
+
+    def _set(
+        self, key: str, endpoint: str, compressed: bytes, expires_at: float, stale_until: float
+    ) -> None:
+        """Insert or replace a row."""
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, endpoint, content, size, expires_at, stale_until, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, endpoint, compressed, len(compressed), expires_at, stale_until, time.time()),
+        )
+        conn.commit()
+
+    def _invalidate(self, endpoint_prefix: str | None) -> int:
+        """Delete rows by endpoint prefix."""
+        conn = self._connect()
+        if endpoint_prefix is None:
+            cursor = conn.execute("DELETE FROM responses")
+        else:
+            cursor = conn.execute(
+                "DELETE FROM responses WHERE substr(endpoint, 1, ?) = ?",
+                (len(endpoint_prefix), endpoint_prefix),
+            )
+        conn.commit()
+        return cursor.rowcount
+
+    def _compact(self) -> int:
+        """Delete rows past their stale bound, then least recently accessed rows above the cap."""
+        conn = self._connect()
+        removed = conn.execute(
+            "DELETE FROM responses WHERE stale_until <= ?", (time.time(),)
+        ).rowcount
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > self.max_bytes:
+            excess = total - self.max_bytes
+            freed = 0
+            victims = []
+            for key, size in conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at"
+            ):
+                victims.append((key,))
+                freed += size
+                if freed >= excess:
+                    break
+            conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+            self.evictions += len(victims)
+            removed += len(victims)
+
+        conn.commit()
+        if removed:
+            # Return freed pages to the filesystem
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+        return removed
@@ -0,0 +1,166 @@
+"""Content-Encoding helpers shared by passthrough responses and the cache."""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+import zstandard
+
+from backend.core.config import Settings
+
+try:
+    import brotli
+except ImportError:  # Optional: brotli is only used when installed
+    brotli = None
+
+IDENTITY = "identity"
+
+_DECODE_ERRORS: tuple[type[Exception], ...] = (zlib.error, zstandard.ZstdError)
+if brotli is not None:
+    _DECODE_ERRORS += (brotli.error,)
+
+# Encodings we can decode, so upstream bodies in them can still be cached
+DECODABLE_ENCODINGS = frozenset(
+    {"gzip", "deflate", "zstd"} | ({"br"} if brotli is not None else set())
+)
+
+# Encodings we compress responses with, most preferred first
+COMPRESSION_ENCODINGS: tuple[str, ...] = (("br",) if brotli is not None else ()) + (
+    "zstd",
+    "gzip",
+)
+
+
+def parse_accept_encoding(header: str | None) -> dict[str, float]:
+    """Parse an Accept-Encoding header into encoding -> quality."""
+    accepted: dict[str, float] = {}
+    if not header:
+        return accepted
+
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def upstream_accept_encoding(client_header: str | None) -> str:
+    """Accept-Encoding to send upstream so its body can be relayed unchanged.
+
+    Only encodings the client accepts and we can decode for caching are
+    requested.
+    """
+    accepted = parse_accept_encoding(client_header)
+    wildcard = accepted.get("*", 0.0)
+    encodings = [
+        encoding
+        for encoding in sorted(DECODABLE_ENCODINGS)
+        if accepted.get(encoding, wildcard) > 0
+    ]
+    return ", ".join(encodings) if encodings else IDENTITY
+
+
+def negotiate_encoding(
+    header: str | None, available: tuple[str, ...] = COMPRESSION_ENCODINGS
+) -> str | None:
+    """Pick the encoding to compress a response with, or None to send it as is.
+
+    The client's highest q-value wins; ties go to the earlier entry in
+    ``available``.
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class StreamCompressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str, level: int) -> None:
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._compressor: Any = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        elif encoding == "br" and brotli is not None:
+            self._compressor = brotli.Compressor(quality=level)
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk, returning whatever output is ready."""
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Return all output for the data so far, so the client can decode it now."""
+        if self.encoding == "br":
+            return self._compressor.flush()
+        if self.encoding == "zstd":
+            return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """Return the remaining output and end the stream."""
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def compress_body(content: bytes, encoding: str, level: int) -> bytes:
+    """Compress a complete body in the given Content-Encoding."""
+    compressor = StreamCompressor(encoding, level)
+    return compressor.compress(content) + compressor.finish()
+
+
+def compression_levels(settings: Settings) -> dict[str, int]:
+    """Compression level per response encoding from settings."""
+    return {
+        "br": settings.compression_brotli_quality,
+        "zstd": settings.compression_zstd_level,
+        "gzip": settings.compression_gzip_level,
+    }
+
+
+def decode_body(content: bytes, encoding: str | None) -> bytes:
+    """Decode a complete body in the given Content-Encoding.
+
+    Raises:
+        ValueError: If the encoding is unsupported or the body is corrupt.
+    """
+    encoding = (encoding or IDENTITY).strip().lower()
+    try:
+        if encoding == IDENTITY:
+            return content
+        if encoding == "gzip":
+            return zlib.decompress(content, zlib.MAX_WBITS | 16)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(content)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib header
+                return zlib.decompress(content, -zlib.MAX_WBITS)
+        if encoding == "zstd":
+            return zstandard.ZstdDecompressor().decompressobj().decompress(content)
+        if encoding == "br" and brotli is not None:
+            return brotli.decompress(content)
+    except _DECODE_ERRORS as e:
+        raise ValueError(f"Corrupt {encoding} body: {e}") from e
+    raise ValueError(f"Unsupported content encoding: {encoding}")
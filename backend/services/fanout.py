@@ -0,0 +1,123 @@
+"""Concurrent upstream calls merged into one JSON document."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from backend.core.exceptions import (
+    APIError,
+    AuthenticationError,
+    CircuitOpenError,
+    SkogsstyrelsenError,
+)
+from backend.services.skogsstyrelsen_client import RawBody
+
+Call = Callable[[], Awaitable[RawBody]]
+
+
+def error_type(error: SkogsstyrelsenError) -> str:
+    """Name an error the way the error handler middleware reports it."""
+    if isinstance(error, AuthenticationError):
+        return "authentication_error"
+    if isinstance(error, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(error, APIError):
+        return "api_error"
+    return "skogsstyrelsen_error"
+
+
+def error_dict(error: SkogsstyrelsenError) -> dict[str, Any]:
+    """Describe an upstream error for a per-call entry of a merged document."""
+    return {
+        "type": error_type(error),
+        "detail": error.message,
+        "status_code": error.status_code,
+    }
+
+
+def dumps(value: Any) -> bytes:
+    """Compact JSON for the parts of a document the gateway writes itself."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@dataclass
+class FanoutResult:
+    """Outcome of one call in a fan-out: its body, or the error it failed with."""
+
+    name: str
+    duration: float
+    body: RawBody | None = None
+    error: SkogsstyrelsenError | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the call succeeded."""
+        return self.error is None
+
+    @property
+    def duration_ms(self) -> float:
+        """Call duration in milliseconds."""
+        return round(self.duration * 1000, 1)
+
+    def to_json(self) -> bytes:
+        """Serialize the outcome, splicing the upstream body in without decoding it."""
+        head: dict[str, Any] = {
+            "status": "ok" if self.ok else "error",
+            "duration_ms": self.duration_ms,
+        }
+        if self.body is not None:
+            return dumps(head)[:-1] + b',"data":' + self.body.content + b"}"
+        head["error"] = error_dict(self.error)
+        return dumps(head)
+
+
+async def _timed(name: str, call: Call) -> FanoutResult:
+    """Run one call, recording its duration and any upstream error."""
+    started = time.monotonic()
+    try:
+        body = await call()
+    except SkogsstyrelsenError as e:
+        return FanoutResult(name, time.monotonic() - started, error=e)
+    return FanoutResult(name, time.monotonic() - started, body=body)
+
+
+async def fan_out(calls: Mapping[str, Call]) -> list[FanoutResult]:
+    """Run named calls concurrently, returning their outcomes in the given order.
+
+    Upstream errors are captured per call so one failing endpoint does not
+    discard the others. If every call fails, the first error is raised
+    instead, so it maps to the status it would have had on its own.
+    """
+    results = list(await asyncio.gather(*(_timed(name, call) for name, call in calls.items())))
+    if results and not any(result.ok for result in results):
+        raise results[0].error
+    return results
+
+
+def merge_results(
+    results: list[FanoutResult],
+    key: str,
+    duration: float,
+    fields: dict[str, Any] | None = None,
+) -> bytes:
+    """Merge fan-out outcomes into one document keyed by call name.
+
+    The document lists which calls succeeded and failed next to the
+    per-call results under ``key``, plus the total duration. Any extra
+    ``fields`` come first.
+    """
+    entries = b",".join(dumps(result.name) + b":" + result.to_json() for result in results)
+    summary = dumps(
+        {
+            "succeeded": [result.name for result in results if result.ok],
+            "failed": [result.name for result in results if not result.ok],
+            "duration_ms": round(duration * 1000, 1),
+        }
+    )
+    head = dumps(fields)[1:-1] + b"," if fields else b""
+    return b"{" + head + dumps(key) + b":{" + entries + b"}," + summary[1:]
@@ -0,0 +1,152 @@
+"""Canonical forms of WKT geometries for use in cache keys."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Any
+
+Point = tuple[float, float]
+Ring = list[Point]
+Polygon = list[Ring]
+
+_TYPE_RE = re.compile(
+    r"^\s*(MULTIPOLYGON|POLYGON)\s*(Z|M|ZM)?\s*(\(.*\))\s*$", re.IGNORECASE | re.DOTALL
+)
+_TOKEN_RE = re.compile(r"\(|\)|,|[^\s(),]+")
+
+
+class GeometryParseError(ValueError):
+    """WKT string could not be parsed."""
+
+
+def _parse_nested(text: str) -> list[Any]:
+    """Parse parenthesized WKT coordinate lists into nested Python lists."""
+    tokens = _TOKEN_RE.findall(text)
+    stack: list[list[Any]] = [[]]
+    numbers: list[float] = []
+
+    def flush() -> None:
+        if numbers:
+            if len(numbers) < 2:
+                raise GeometryParseError("Coordinate needs at least two values")
+            # Only x/y take part in the canonical form
+            stack[-1].append((numbers[0], numbers[1]))
+            numbers.clear()
+
+    for token in tokens:
+        if token == "(":
+            stack.append([])
+        elif token == ")":
+            flush()
+            if len(stack) < 2:
+                raise GeometryParseError("Unbalanced parentheses")
+            closed = stack.pop()
+            stack[-1].append(closed)
+        elif token == ",":
+            flush()
+        else:
+            try:
+                numbers.append(float(token))
+            except ValueError as e:
+                raise GeometryParseError(f"Invalid coordinate value: {token}") from e
+
+    if len(stack) != 1 or len(stack[0]) != 1 or numbers:
+        raise GeometryParseError("Unbalanced parentheses")
+    return stack[0][0]
+
+
+def _signed_area(ring: Ring) -> float:
+    """Shoelace area, positive for counter-clockwise rings."""
+    return sum(
+        x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1])
+    ) / 2.0
+
+
+def _normalize_ring(ring: Ring, precision: int, counter_clockwise: bool) -> Ring:
+    """Round, deduplicate, orient and rotate a ring to a canonical start vertex."""
+    points: Ring = []
+    for x, y in ring:
+        point = (round(x, precision) + 0.0, round(y, precision) + 0.0)
+        if not points or points[-1] != point:
+            points.append(point)
+    if len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+    if len(points) < 3:
+        raise GeometryParseError("Ring needs at least three distinct vertices")
+
+    if (_signed_area(points) > 0) != counter_clockwise:
+        points.reverse()
+
+    start = points.index(min(points))
+    return points[start:] + points[:start]
+
+
+def _normalize_polygon(rings: list[Ring], precision: int) -> Polygon:
+    """Exterior ring counter-clockwise first, holes clockwise in sorted order."""
+    if not rings:
+        raise GeometryParseError("Polygon needs at least one ring")
+    for ring in rings:
+        if not isinstance(ring, list) or not all(isinstance(point, tuple) for point in ring):
+            raise GeometryParseError("Polygon rings must be coordinate lists")
+    exterior = _normalize_ring(rings[0], precision, counter_clockwise=True)
+    holes = sorted(_normalize_ring(ring, precision, counter_clockwise=False) for ring in rings[1:])
+    return [exterior, *holes]
+
+
+def _format_polygon(polygon: Polygon) -> str:
+    """Write a normalized polygon as WKT ring text with closed rings."""
+    rings = []
+    for ring in polygon:
+        closed = ring + ring[:1]
+        rings.append("(" + ",".join(f"{x!r} {y!r}" for x, y in closed) + ")")
+    return "(" + ",".join(rings) + ")"
+
+
+def canonical_wkt(wkt: str, precision: int = 2) -> str:
+    """Return a canonical WKT for a POLYGON or MULTIPOLYGON.
+
+    Equivalent inputs map to the same string regardless of whitespace,
+    keyword case, ring start vertex, ring orientation, polygon or hole order,
+    and float noise below ``precision`` decimals. Single-part multipolygons
+    are written as polygons.
+
+    Raises:
+        GeometryParseError: If the WKT is not a polygon or multipolygon.
+    """
+    match = _TYPE_RE.match(wkt)
+    if match is None:
+        raise GeometryParseError("Expected POLYGON or MULTIPOLYGON WKT")
+
+    geometry_type = match.group(1).upper()
+    nested = _parse_nested(match.group(3))
+    raw_polygons = nested if geometry_type == "MULTIPOLYGON" else [nested]
+    if not all(isinstance(rings, list) for rings in raw_polygons):
+        raise GeometryParseError("Multipolygon members must be polygons")
+    polygons = sorted(_normalize_polygon(rings, precision) for rings in raw_polygons)
+
+    if len(polygons) == 1:
+        return "POLYGON " + _format_polygon(polygons[0])
+    return "MULTIPOLYGON (" + ",".join(_format_polygon(p) for p in polygons) + ")"
+
+
+def geometry_hash(wkt: str, precision: int = 2) -> str:
+    """Hash a geometry by its canonical form, falling back to the raw text."""
+    try:
+        text = canonical_wkt(wkt, precision)
+    except GeometryParseError:
+        text = wkt.strip()
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def canonicalize_statistics_body(body: dict[str, Any], precision: int = 2) -> dict[str, Any]:
+    """Replace the geometry in a statistics request body with its canonical hash.
+
+    Land types are treated as a set, so their order does not affect the key.
+    """
+    canonical = dict(body)
+    if isinstance(canonical.get("geometri"), str):
+        canonical["geometri"] = "sha256:" + geometry_hash(canonical["geometri"], precision)
+    if isinstance(canonical.get("marktyp"), list):
+        canonical["marktyp"] = sorted(set(canonical["marktyp"]))
+    return canonical
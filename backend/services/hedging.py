@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict, deque
+from typing import Any
+
+
+class LatencyTracker:
+    """Rolling latency percentiles per request kind.
+
+    Keeps the last ``window`` samples for each key and at most ``max_keys``
+    keys, dropping the least recently used ones.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20, max_keys: int = 1024) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self.max_keys = max_keys
+        self._samples: OrderedDict[str, deque[float]] = OrderedDict()
+
+    def record(self, key: str, latency: float) -> None:
+        """Add a latency sample in seconds."""
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+            if len(self._samples) > self.max_keys:
+                self._samples.popitem(last=False)
+        else:
+            self._samples.move_to_end(key)
+        samples.append(latency)
+
+    def percentile(self, key: str, q: float) -> float | None:
+        """Return the q-quantile (0..1) for a key, or None with too few samples."""
+        samples = self._samples.get(key)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+    def stats(self) -> dict[str, Any]:
+        """Return tracker size."""
+        return {"tracked": len(self._samples)}
@@ -0,0 +1,504 @@
+"""Batch statistics run as background jobs, with items and results persisted in SQLite."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypeVar
+
+from backend.api.constants import GRUNDDATA_METRICS
+from backend.core.config import Settings
+from backend.core.logging import get_logger
+from backend.services.batch import BatchRunner, ItemTooLarge
+from backend.services.fanout import dumps
+from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Items written per transaction on submit, and read per query when processing
+PAGE_SIZE = 500
+
+# Bump when the table layout changes; older job databases are discarded
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+DROP TABLE IF EXISTS jobs;
+DROP TABLE IF EXISTS items;
+CREATE TABLE jobs (
+    id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    status TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX jobs_status ON jobs (status, updated_at);
+CREATE TABLE items (
+    job_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    payload BLOB,
+    result BLOB,
+    PRIMARY KEY (job_id, idx)
+);
+"""
+
+# Job states: receiving the body, waiting for a worker, being processed, finished
+RECEIVING = "receiving"
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# Item state before its result is stored; afterwards it is the result's status
+PENDING = "pending"
+
+
+class JobTooLarge(ValueError):
+    """A submitted job has more items than allowed."""
+
+
+@dataclass
+class Job:
+    """A batch job's state and progress."""
+
+    id: str
+    status: str
+    metrics: list[str]
+    total: int
+    done: int
+    failed: int
+    error: str | None
+    created_at: float
+    updated_at: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Describe the job for API responses."""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "metrics": self.metrics,
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "progress": round(self.done / self.total, 4) if self.total else 0.0,
+            "error": self.error,
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
+        }
+
+
+def _isoformat(timestamp: float) -> str:
+    """UTC ISO 8601 time for an epoch timestamp."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class JobStore:
+    """SQLite store for jobs, their items and per-item result lines.
+
+    Items are stored as submitted and replaced by their result line once
+    computed, so a job interrupted by a restart resumes with only the items
+    it had not finished. Blocking SQLite calls run in worker threads.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (call with the lock held)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            self._conn = conn
+        return self._conn
+
+    async def start(self) -> None:
+        """Open the database."""
+        await asyncio.to_thread(self._locked, self._connect)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def create(self, metrics: Sequence[str], idempotency_key: str | None) -> tuple[Job, bool]:
+        """Create a job in the receiving state, or return the job holding the key.
+
+        The flag is True if the job was created.
+        """
+        return await asyncio.to_thread(self._locked, self._create, list(metrics), idempotency_key)
+
+    async def get(self, job_id: str) -> Job | None:
+        """Get a job by id."""
+        return await asyncio.to_thread(self._locked, self._get, job_id)
+
+    async def add_items(self, job_id: str, start: int, payloads: list[bytes | None]) -> None:
+        """Store items numbered from ``start``; a None payload marks an oversized item."""
+        await asyncio.to_thread(self._locked, self._add_items, job_id, start, payloads)
+
+    async def set_status(self, job_id: str, status: str, error: str | None = None) -> None:
+        """Move a job to another state."""
+        await asyncio.to_thread(self._locked, self._set_status, job_id, status, error)
+
+    async def delete(self, job_id: str) -> None:
+        """Delete a job and its items."""
+        await asyncio.to_thread(self._locked, self._delete, [job_id])
+
+    async def pending_items(
+        self, job_id: str, after: int, limit: int
+    ) -> list[tuple[int, bytes | None]]:
+        """Items still to be computed, by index, starting after index ``after``."""
+        return await asyncio.to_thread(self._locked, self._pending_items, job_id, after, limit)
+
+    async def save_result(self, job_id: str, index: int, status: str, line: bytes) -> None:
+        """Store an item's result line, dropping its payload, and count it."""
+        await asyncio.to_thread(self._locked, self._save_result, job_id, index, status, line)
+
+    async def results(
+        self, job_id: str, limit: int, offset: int = 0, after: int = -1
+    ) -> list[tuple[int, bytes]]:
+        """Result lines by index, from ``offset`` among those after index ``after``."""
+        return await asyncio.to_thread(
+            self._locked, self._results, job_id, limit, offset, after
+        )
+
+    async def recover(self) -> list[str]:
+        """Prepare jobs left over by a previous process, returning those to resume.
+
+        Jobs still being received are deleted, since their client got an
+        error; interrupted jobs are queued again in submission order.
+        """
+        return await asyncio.to_thread(self._locked, self._recover)
+
+    async def purge(self, finished_before: float) -> int:
+        """Delete jobs that finished before the wall-clock time."""
+        return await asyncio.to_thread(self._locked, self._purge, finished_before)
+
+    def _locked(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a database operation while holding the connection lock."""
+        with self._lock:
+            return fn(*args)
+
+    def _create(self, metrics: list[str], idempotency_key: str | None) -> tuple[Job, bool]:
+        """Insert a job row unless its idempotency key is taken."""
+        conn = self._connect()
+        if idempotency_key is not None:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE idempotency_key = ?", (idempotency_key,)
+            ).fetchone()
+            if row is not None:
+                return self._get(row[0]), False
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        try:
+            conn.execute(
+                "INSERT INTO jobs (id, idempotency_key, status, metrics, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, idempotency_key, RECEIVING, json.dumps(metrics), now, now),
+            )
+        except sqlite3.IntegrityError:
+            # Another process sharing the database took the key in between
+            return self._create(metrics, idempotency_key)
+        conn.commit()
+        return self._get(job_id), True
+
+    def _get(self, job_id: str) -> Job | None:
+        """Read a job row."""
+        row = self._connect().execute(
+            "SELECT id, status, metrics, total, done, failed, error, created_at, updated_at "
+            "FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        job_id, status, metrics, *rest = row
+        return Job(job_id, status, json.loads(metrics), *rest)
+
+    def _add_items(self, job_id: str, start: int, payloads: list[bytes | None]) -> None:
+        """Insert pending items and add them to the job's total."""
+        conn = self._connect()
+        conn.executemany(
+            "INSERT INTO items (job_id, idx, status, payload) VALUES (?, ?, ?, ?)",
+            ((job_id, start + i, PENDING, payload) for i, payload in enumerate(payloads)),
+        )
+        conn.execute(
+            "UPDATE jobs SET total = total + ?, updated_at = ? WHERE id = ?",
+            (len(payloads), time.time(), job_id),
+        )
+        conn.commit()
+
+    def _set_status(self, job_id: str, status: str, error: str | None) -> None:
+        """Update a job's state."""
+        conn = self._connect()
+        conn.execute(
+            "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+            (status, error, time.time(), job_id),
+        )
+        conn.commit()
+
+    def _delete(self, job_ids: list[str]) -> None:
+        """Delete jobs and their items."""
+        conn = self._connect()
+        rows = [(job_id,) for job_id in job_ids]
+        conn.executemany("DELETE FROM items WHERE job_id = ?", rows)
+        conn.executemany("DELETE FROM jobs WHERE id = ?", rows)
+        conn.commit()
+
+    def _pending_items(
+        self, job_id: str, after: int, limit: int
+    ) -> list[tuple[int, bytes | None]]:
+        """Read a page of pending items."""
+        return self._connect().execute(
+            "SELECT idx, payload FROM items WHERE job_id = ? AND idx > ? AND status = ? "
+            "ORDER BY idx LIMIT ?",
+            (job_id, after, PENDING, limit),
+        ).fetchall()
+
+    def _save_result(self, job_id: str, index: int, status: str, line: bytes) -> None:
+        """Replace an item's payload by its result and update the job's counters."""
+        conn = self._connect()
+        conn.execute(
+            "UPDATE items SET status = ?, payload = NULL, result = ? WHERE job_id = ? AND idx = ?",
+            (status, line, job_id, index),
+        )
+        conn.execute(
+            "UPDATE jobs SET done = done + 1, failed = failed + ?, updated_at = ? WHERE id = ?",
+            (status == "error", time.time(), job_id),
+        )
+        conn.commit()
+
+    def _results(
+        self, job_id: str, limit: int, offset: int, after: int
+    ) -> list[tuple[int, bytes]]:
+        """Read a page of result lines."""
+        return self._connect().execute(
+            "SELECT idx, result FROM items WHERE job_id = ? AND idx > ? AND status != ? "
+            "ORDER BY idx LIMIT ? OFFSET ?",
+            (job_id, after, PENDING, limit, offset),
+        ).fetchall()
+
+    def _recover(self) -> list[str]:
+        """Drop half-received jobs and requeue interrupted ones."""
+        conn = self._connect()
+        receiving = [
+            row[0] for row in conn.execute("SELECT id FROM jobs WHERE status = ?", (RECEIVING,))
+        ]
+        self._delete(receiving)
+        conn.execute("UPDATE jobs SET status = ? WHERE status = ?", (QUEUED, RUNNING))
+        conn.commit()
+        return [
+            row[0]
+            for row in conn.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created_at", (QUEUED,)
+            )
+        ]
+
+    def _purge(self, finished_before: float) -> int:
+        """Delete finished jobs last updated before the given time."""
+        conn = self._connect()
+        expired = [
+            row[0]
+            for row in conn.execute(
+                "SELECT id FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (COMPLETED, FAILED, finished_before),
+            )
+        ]
+        self._delete(expired)
+        return len(expired)
+
+
+class JobQueue:
+    """Run submitted batches in the background, ``workers`` jobs at a time.
+
+    Each job computes its items like ``/api/grunddata/batch``, with at most
+    ``concurrency`` items in flight, and stores every result line as it
+    completes. Jobs survive restarts: interrupted ones are resumed when the
+    queue starts, and finished ones are kept for ``retention`` seconds.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        client: SkogsstyrelsenClient,
+        workers: int = 2,
+        concurrency: int = 8,
+        max_items: int = 100_000,
+        retention: float = 7 * 24 * 3600,
+    ) -> None:
+        self.store = store
+        self.client = client
+        self.workers = workers
+        self.concurrency = concurrency
+        self.max_items = max_items
+        self.retention = retention
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task[None]] = []
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        """Open the store, queue interrupted jobs and start the workers."""
+        await self.store.start()
+        purged = await self.store.purge(time.time() - self.retention)
+        if purged:
+            logger.info(f"Purged {purged} expired jobs")
+        resumed = await self.store.recover()
+        if resumed:
+            logger.info(f"Resuming {len(resumed)} interrupted jobs")
+        for job_id in resumed:
+            self._queue.put_nowait(job_id)
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work_loop()) for _ in range(self.workers)]
+
+    async def close(self) -> None:
+        """Stop the workers, leaving unfinished jobs to resume on the next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.store.close()
+
+    async def submit(
+        self,
+        items: AsyncIterable[Any] | Iterable[Any],
+        metrics: Sequence[str] = tuple(GRUNDDATA_METRICS),
+        idempotency_key: str | None = None,
+    ) -> tuple[Job, bool]:
+        """Store a batch's items and queue it, returning the job and whether it is new.
+
+        Items are taken like ``BatchRunner.run``. A submission whose
+        idempotency key is already taken returns that job without reading
+        ``items``. Raises ``JobTooLarge`` past ``max_items``; the partly
+        stored job is then deleted, as it is on any other error.
+        """
+        job, created = await self.store.create(metrics, idempotency_key)
+        if not created:
+            return job, False
+
+        try:
+            total = 0
+            page: list[bytes | None] = []
+            async for item in _aiter(items):
+                if total + len(page) >= self.max_items:
+                    raise JobTooLarge(f"Jobs are limited to {self.max_items} items")
+                page.append(_payload(item))
+                if len(page) == PAGE_SIZE:
+                    await self.store.add_items(job.id, total, page)
+                    total += len(page)
+                    page = []
+            if page:
+                await self.store.add_items(job.id, total, page)
+            await self.store.set_status(job.id, QUEUED)
+        except Exception:
+            # Jobs cut short by a shutdown are dropped by recover() instead
+            await self.store.delete(job.id)
+            raise
+
+        self._queue.put_nowait(job.id)
+        return await self.store.get(job.id), True
+
+    async def _work_loop(self) -> None:
+        """Process queued jobs one at a time until cancelled."""
+        while True:
+            job_id = await self._queue.get()
+            self.running += 1
+            try:
+                await self._process(job_id)
+                self.completed += 1
+            except Exception as e:
+                # Keep the worker alive; the job is reported as failed
+                self.failed += 1
+                logger.exception(f"Job {job_id} failed")
+                try:
+                    await self.store.set_status(job_id, FAILED, str(e))
+                except sqlite3.Error:
+                    logger.warning(f"Could not mark job {job_id} as failed")
+            finally:
+                self.running -= 1
+
+    async def _process(self, job_id: str) -> None:
+        """Compute a job's pending items, storing each result as it completes."""
+        job = await self.store.get(job_id)
+        if job is None or job.status not in (QUEUED, RUNNING):
+            return
+        await self.store.set_status(job_id, RUNNING)
+        runner = BatchRunner(self.client, job.metrics, self.concurrency)
+        async for index, status, line in runner.run_numbered(self._pending(job_id)):
+            await self.store.save_result(job_id, index, status, line)
+        await self.store.set_status(job_id, COMPLETED)
+        await self.store.purge(time.time() - self.retention)
+
+    async def _pending(self, job_id: str) -> AsyncIterator[tuple[int, Any]]:
+        """Numbered pending items of a job, read a page at a time."""
+        after = -1
+        while page := await self.store.pending_items(job_id, after, PAGE_SIZE):
+            for index, payload in page:
+                yield index, ItemTooLarge() if payload is None else payload
+            after = page[-1][0]
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue counters."""
+        return {
+            "path": str(self.store.path),
+            "workers": self.workers,
+            "queued": self._queue.qsize(),
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+async def _aiter(items: AsyncIterable[T] | Iterable[T]) -> AsyncIterator[T]:
+    """Iterate sync or async items asynchronously."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _payload(item: Any) -> bytes | None:
+    """Stored form of a submitted item: NDJSON lines as is, decoded values re-encoded."""
+    if isinstance(item, ItemTooLarge):
+        return None
+    if isinstance(item, bytes):
+        return item
+    return dumps(item)
+
+
+def create_job_queue(settings: Settings, client: SkogsstyrelsenClient) -> JobQueue | None:
+    """Create the job queue from settings, or None when no database path is set."""
+    if not settings.jobs_db_path:
+        return None
+    return JobQueue(
+        JobStore(settings.jobs_db_path),
+        client,
+        workers=settings.jobs_workers,
+        concurrency=settings.jobs_item_concurrency,
+        max_items=settings.jobs_max_items,
+        retention=settings.jobs_retention_seconds,
+    )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize a value to JSON with a stable key order and no whitespace."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def request_key(
+    method: str,
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+    json_data: dict[str, Any] | None = None,
+) -> str:
+    """Build a key identifying an upstream request.
+
+    Params and body are canonicalized so requests that differ only in key
+    order map to the same key. The body is hashed to keep keys small even
+    for large WKT geometries.
+    """
+    digest = hashlib.sha256()
+    digest.update(canonical_json(params or {}).encode())
+    digest.update(b"\0")
+    digest.update(canonical_json(json_data).encode())
+    return f"{method.upper()} {endpoint} {digest.hexdigest()}"
+
+
+def make_etag(content: bytes) -> str:
+    """Build a strong ETag for a response body."""
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any
+
+from backend.core.config import Settings
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit driven by upstream latency and overload signals.
+
+    The limit grows by about one per window of successful calls while the
+    limit is actually being used, and shrinks multiplicatively on 429s, 5xx,
+    transport errors or when smoothed latency climbs past ``latency_tolerance``
+    times the no-load baseline. The baseline tracks the fastest recent calls and
+    drifts up slowly so a permanently slower upstream is not punished forever.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        backoff_ratio: float = 0.9,
+        latency_tolerance: float = 2.0,
+        baseline_drift: float = 0.01,
+        smoothing: float = 0.2,
+    ) -> None:
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.baseline_drift = baseline_drift
+        self.smoothing = smoothing
+        self._limit = float(min(max(initial_limit, self.min_limit), max_limit))
+        self.baseline: float | None = None
+        self.smoothed: float | None = None
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    def on_success(self, latency: float, demand: int) -> None:
+        """Adjust the limit after a successful call that took ``latency`` seconds.
+
+        ``demand`` is the number of calls in flight or waiting for a slot.
+        """
+        if self.baseline is None or latency < self.baseline:
+            self.baseline = latency
+        else:
+            self.baseline += (latency - self.baseline) * self.baseline_drift
+
+        if self.smoothed is None:
+            self.smoothed = latency
+        else:
+            self.smoothed += (latency - self.smoothed) * self.smoothing
+
+        if self.smoothed > self.baseline * self.latency_tolerance:
+            self._decrease()
+        elif demand * 2 >= self._limit:
+            # Only grow when demand is near the limit, otherwise it says nothing
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self.increases += 1
+
+    def on_overload(self) -> None:
+        """Back off after the upstream signalled overload or failed."""
+        self._decrease()
+
+    def _decrease(self) -> None:
+        """Shrink the limit multiplicatively."""
+        self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+        self.decreases += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return the current limit and adjustment counters."""
+        return {
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "baseline_latency": round(self.baseline, 4) if self.baseline is not None else None,
+            "smoothed_latency": round(self.smoothed, 4) if self.smoothed is not None else None,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+def create_limiter(settings: Settings, max_limit: int) -> AdaptiveLimiter | None:
+    """Create an adaptive limiter capped at the pool size, or None when disabled."""
+    if not settings.adaptive_concurrency_enabled:
+        return None
+    return AdaptiveLimiter(
+        initial_limit=settings.adaptive_concurrency_initial_limit,
+        min_limit=settings.adaptive_concurrency_min_limit,
+        max_limit=max_limit,
+        backoff_ratio=settings.adaptive_concurrency_backoff_ratio,
+        latency_tolerance=settings.adaptive_concurrency_latency_tolerance,
+    )
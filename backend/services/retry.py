@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+# 429 and gateway errors are the usual transient failures; other 5xx are retried too
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """Delay before retrying after the given zero-based attempt.
+
+        Returns None when the server asks us to wait longer than max_delay.
+        """
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class RetryBudget:
+    """Token bucket capping retries to a fraction of requests.
+
+    Every request deposits ``ratio`` tokens and every retry spends one, so
+    retries can add at most ``ratio`` extra load during an outage. A small
+    time-based reserve keeps retries possible at low traffic.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, window: float = 10.0) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = max(1.0, min_per_second * window)
+        self._balance = self.capacity
+        self._updated = time.monotonic()
+        self.retries = 0
+        self.exhausted = 0
+
+    def _refill(self) -> None:
+        """Add the time-based reserve accrued since the last update."""
+        now = time.monotonic()
+        self._balance = min(
+            self.capacity, self._balance + (now - self._updated) * self.min_per_second
+        )
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a request."""
+        self._refill()
+        self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, if available."""
+        self._refill()
+        if self._balance < 1.0:
+            self.exhausted += 1
+            return False
+        self._balance -= 1.0
+        self.retries += 1
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Return retry counters."""
+        self._refill()
+        return {
+            "retries": self.retries,
+            "budget_exhausted": self.exhausted,
+            "budget_balance": round(self._balance, 2),
+        }
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution.
+
+    The first caller for a key starts the call; callers arriving while it is
+    in flight await the same task and receive the same result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self.calls = 0
+        self.executions = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn for key, or join the call already in flight for key."""
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        # Shield so one cancelled caller does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Drop a finished call so the next caller starts a fresh one."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark failures as retrieved when every caller has gone away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        """Return coalescing counters."""
+        coalesced = self.calls - self.executions
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": coalesced,
+            "coalescing_ratio": coalesced / self.calls if self.calls else 0.0,
+            "in_flight": len(self._in_flight),
+        }
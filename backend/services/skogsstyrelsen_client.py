@@ -1,16 +1,100 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
 
+from backend.api.constants import API_FAMILY_PREFIXES, ApiFamily, api_family
 from backend.core.config import Settings
-from backend.core.exceptions import APIError
+from backend.core.exceptions import (
+    APIError,
+    BulkheadFullError,
+    CircuitOpenError,
+    SkogsstyrelsenError,
+)
 from backend.core.logging import get_logger
 from backend.services.auth import SkogsstyrelsenAuth
+from backend.services.bulkhead import Bulkhead, http_pool_stats
+from backend.services.cache import CacheEntry, CacheRule, create_response_cache
+from backend.services.circuit_breaker import OPEN, CircuitBreaker, create_circuit_breakers
+from backend.services.encoding import (
+    decode_body,
+    negotiate_encoding,
+    upstream_accept_encoding,
+)
+from backend.services.hedging import LatencyTracker
+from backend.services.keys import make_etag, request_key
+from backend.services.limiter import create_limiter
+from backend.services.retry import (
+    RETRYABLE_STATUS_CODES,
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+from backend.services.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
+IDEMPOTENT_POST_FAMILIES = frozenset({ApiFamily.RASTER, ApiFamily.GRUNDDATA})
+
+# Pool for endpoints outside the known API families
+DEFAULT_POOL = "default"
+
+
+@dataclass
+class RawResponse:
+    """Upstream response body relayed as received, without decoding."""
+
+    chunks: AsyncIterator[bytes]
+    media_type: str = "application/json"
+    content_encoding: str | None = None
+    content_length: int | None = None
+    etag: str | None = None
+    # Releases the upstream connection if the body is never consumed
+    close: Callable[[], Awaitable[None]] | None = None
+
+    @classmethod
+    def from_bytes(
+        cls,
+        content: bytes,
+        media_type: str = "application/json",
+        content_encoding: str | None = None,
+        etag: str | None = None,
+    ) -> RawResponse:
+        """Wrap an already available body, such as a cache entry."""
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield content
+
+        return cls(
+            chunks(),
+            media_type=media_type,
+            content_encoding=content_encoding,
+            content_length=len(content),
+            etag=etag,
+        )
+
+
+@dataclass
+class RawBody:
+    """Complete JSON body with its ETag, and precompressed variants when cached."""
+
+    content: bytes
+    variants: dict[str, bytes] = field(default_factory=dict)  # Content-Encoding -> body
+    etag: str | None = None
+
+    @classmethod
+    def from_response(cls, response: CacheEntry | httpx.Response) -> RawBody:
+        """Take the body of a cache entry or an upstream response."""
+        if isinstance(response, CacheEntry):
+            return cls(response.content, response.variants, response.etag)
+        return cls(response.content, etag=make_etag(response.content))
+
 
 class SkogsstyrelsenClient:
     """Client for interacting with Skogsstyrelsen APIs with connection pooling."""
@@ -18,25 +102,125 @@ class SkogsstyrelsenClient:
     def __init__(self, auth: SkogsstyrelsenAuth, settings: Settings) -> None:
         self.auth = auth
         self.settings = settings
-        self._http_client: httpx.AsyncClient | None = None
+        # One connection pool and bulkhead per API family
+        self._http_clients: dict[str, httpx.AsyncClient] = {}
+        self._pool_sizes = {
+            ApiFamily.RASTER: (settings.raster_max_connections, settings.raster_max_queue),
+            ApiFamily.GRUNDDATA: (
+                settings.grunddata_max_connections,
+                settings.grunddata_max_queue,
+            ),
+            ApiFamily.ABIN: (settings.abin_max_connections, settings.abin_max_queue),
+            DEFAULT_POOL: (settings.http_max_connections, settings.http_max_connections),
+        }
+        self.bulkheads = {
+            pool: Bulkhead(
+                pool,
+                connections,
+                queue,
+                settings.bulkhead_queue_timeout_seconds,
+                limiter=create_limiter(settings, connections),
+            )
+            for pool, (connections, queue) in self._pool_sizes.items()
+        }
+        # Relays of streamed bodies, holding connections beyond the bulkhead's
+        self.stream_bulkheads = {
+            pool: Bulkhead(
+                f"{pool} stream",
+                settings.stream_max_relays,
+                queue,
+                settings.bulkhead_queue_timeout_seconds,
+            )
+            for pool, (_, queue) in self._pool_sizes.items()
+        }
+        self._singleflight = SingleFlight()
+        self.cache = create_response_cache(settings)
+        self._revalidating: dict[str, asyncio.Task[None]] = {}
+        self._retry_policy = RetryPolicy(
+            max_attempts=settings.retry_max_attempts,
+            base_delay=settings.retry_backoff_base_seconds,
+            max_delay=settings.retry_backoff_max_seconds,
+        )
+        self._retry_budget = RetryBudget(
+            ratio=settings.retry_budget_ratio,
+            min_per_second=settings.retry_budget_min_per_second,
+        )
+        self._latencies = LatencyTracker(min_samples=settings.hedge_min_samples)
+        self._hedge_budget = RetryBudget(ratio=settings.hedge_budget_ratio, min_per_second=0.0)
+        self._hedge_wins = 0
+        self.circuit_breakers = create_circuit_breakers(settings, list(API_FAMILY_PREFIXES))
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create reusable HTTP client with connection pooling."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(
+    async def _get_client(self, pool: str = DEFAULT_POOL) -> httpx.AsyncClient:
+        """Get or create the reusable HTTP client for a connection pool."""
+        http_client = self._http_clients.get(pool)
+        if http_client is None or http_client.is_closed:
+            connections, _ = self._pool_sizes[pool]
+            max_connections = connections + self.settings.stream_max_relays
+            http_client = httpx.AsyncClient(
                 timeout=self.settings.request_timeout,
                 limits=httpx.Limits(
-                    max_connections=self.settings.http_max_connections,
-                    max_keepalive_connections=self.settings.http_max_keepalive_connections,
+                    max_connections=max_connections,
+                    max_keepalive_connections=min(
+                        connections, self.settings.http_max_keepalive_connections
+                    ),
                 ),
             )
-        return self._http_client
+            self._http_clients[pool] = http_client
+        return http_client
+
+    async def start(self) -> None:
+        """Open the HTTP clients so the pools are ready before the first request."""
+        for pool in self._pool_sizes:
+            await self._get_client(pool)
+        if self.cache is not None:
+            await self.cache.start()
 
     async def close(self) -> None:
-        """Close HTTP client and release connections."""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
-            self._http_client = None
+        """Close HTTP clients and release connections."""
+        for task in list(self._revalidating.values()):
+            task.cancel()
+        if self._revalidating:
+            await asyncio.gather(*self._revalidating.values(), return_exceptions=True)
+        if self.cache is not None:
+            await self.cache.close()
+        for http_client in self._http_clients.values():
+            if not http_client.is_closed:
+                await http_client.aclose()
+        self._http_clients.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return upstream client metrics."""
+        return {
+            "pools": {pool: self.pool_stats(pool) for pool in self._pool_sizes},
+            "auth_pool": self.auth.pool_stats(),
+            "coalescing": self._singleflight.stats(),
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "retries": self._retry_budget.stats(),
+            "hedging": {
+                "enabled": self.settings.hedging_enabled,
+                "hedges": self._hedge_budget.retries,
+                "hedge_wins": self._hedge_wins,
+                "budget_exhausted": self._hedge_budget.exhausted,
+            },
+            "circuit_breakers": {
+                name: breaker.stats() for name, breaker in self.circuit_breakers.items()
+            },
+        }
+
+    async def invalidate_cache(self, endpoint_prefix: str | None = None) -> int:
+        """Drop cached responses for endpoints starting with prefix, or all of them."""
+        if self.cache is None:
+            return 0
+        removed = await self.cache.invalidate(endpoint_prefix)
+        logger.info(f"Invalidated {removed} cached responses ({endpoint_prefix or 'all'})")
+        return removed
+
+    def pool_stats(self, pool: str = DEFAULT_POOL) -> dict[str, Any]:
+        """Return connection pool and queue statistics for one pool."""
+        stats = http_pool_stats(self._http_clients.get(pool))
+        stats["bulkhead"] = self.bulkheads[pool].stats()
+        stats["streams"] = self.stream_bulkheads[pool].stats()
+        return stats
 
     async def _request(
         self,
@@ -45,35 +229,429 @@ class SkogsstyrelsenClient:
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make authenticated request to Skogsstyrelsen API."""
-        token = await self.auth.get_token()
-        headers = self.auth.get_auth_header(token)
+        """Make request and decode the JSON body."""
+        response = await self._response(method, endpoint, params, json_data)
+        return response.json()
 
-        url = f"{self.settings.skogsstyrelsen_base_url}{endpoint}"
-        logger.debug(f"Making {method} request to {url}")
+    async def _response(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> CacheEntry | httpx.Response:
+        """Make request, serving cacheable endpoints from the response cache.
+
+        Identical in-flight requests share one upstream call. Statistics
+        requests are keyed by canonical geometry, so equivalent polygons share
+        cache entries and in-flight calls. Expired entries within their
+        stale bound are served immediately while one background refresh runs.
+        While the family's circuit breaker is open, any cached copy is served,
+        however old, instead of failing.
+        """
+        rule, key = self._cache_key(method, endpoint, params, json_data)
+        entry = await self._cached(rule, key, method, endpoint, params, json_data)
+        if entry is not None:
+            return entry
+
+        return await self._fetch(rule, key, method, endpoint, params, json_data)
 
+    async def stream(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        accept_encoding: str | None = None,
+    ) -> RawResponse:
+        """GET an endpoint and relay its body as received, without decoding it.
+
+        Meant for large payloads such as ``*/geometri`` WKT. The upstream is
+        asked for an encoding the caller accepts, so a compressed body is
+        relayed still compressed. Cache hits are served from the cache, and
+        a fully relayed body is stored in it. Errors are raised before any
+        bytes are relayed, like for ``get``.
+        """
+        method = "GET"
+        rule, key = self._cache_key(method, endpoint, params)
+        entry = await self._cached(rule, key, method, endpoint, params)
+        if entry is not None:
+            encoding = negotiate_encoding(accept_encoding, tuple(entry.variants))
+            return RawResponse.from_bytes(
+                entry.variants[encoding] if encoding else entry.content,
+                content_encoding=encoding,
+                etag=entry.etag,
+            )
+
+        # The connection stays checked out until the body is relayed, so it
+        # counts against the stream allowance rather than the bulkhead
+        streams = self.stream_bulkheads[api_family(endpoint) or DEFAULT_POOL]
+        await streams.enter()
         try:
-            client = await self._get_client()
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json_data,
+            response = await self._send(
+                method,
+                endpoint,
+                params,
+                stream=True,
+                headers={"Accept-Encoding": upstream_accept_encoding(accept_encoding)},
             )
-            response.raise_for_status()
-            logger.debug(f"Request successful: {method} {url}")
-            return response.json()
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"API request failed: {e.response.status_code} - {e.response.text}")
-            raise APIError(
-                f"API request failed: {e.response.text}",
-                status_code=e.response.status_code,
+        except BaseException:
+            streams.release()
+            raise
+
+        released = False
+
+        async def close() -> None:
+            nonlocal released
+            await response.aclose()
+            if not released:
+                released = True
+                streams.release()
+
+        content_length = response.headers.get("Content-Length")
+        return RawResponse(
+            chunks=self._relay(response, close, rule, key, endpoint),
+            media_type=response.headers.get("Content-Type", "application/json"),
+            content_encoding=response.headers.get("Content-Encoding"),
+            content_length=int(content_length) if content_length else None,
+            close=close,
+        )
+
+    def _cache_key(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> tuple[CacheRule | None, str]:
+        """Find the cache rule for a request and its cache and coalescing key."""
+        if self.cache is None:
+            return None, request_key(method, endpoint, params, json_data)
+        rule = self.cache.rule_for(method, endpoint)
+        return rule, self.cache.key_for(rule, method, endpoint, params, json_data)
+
+    async def _cached(
+        self,
+        rule: CacheRule | None,
+        key: str,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> CacheEntry | None:
+        """Look up a servable cache entry, refreshing it in the background if stale."""
+        if rule is None:
+            return None
+
+        breaker = self.circuit_breakers.get(api_family(endpoint))
+        circuit_open = breaker is not None and breaker.state == OPEN
+        entry = await self.cache.get(rule, key, endpoint, allow_expired=circuit_open)
+        if entry is None:
+            return None
+
+        if entry.is_fresh():
+            logger.debug(f"Cache hit: {method} {endpoint}")
+        elif circuit_open:
+            logger.warning(f"Circuit open, serving cached copy: {method} {endpoint}")
+        else:
+            logger.debug(f"Serving stale cache entry: {method} {endpoint}")
+            self._revalidate(rule, key, method, endpoint, params, json_data)
+        return entry
+
+    async def _relay(
+        self,
+        response: httpx.Response,
+        close: Callable[[], Awaitable[None]],
+        rule: CacheRule | None,
+        key: str,
+        endpoint: str,
+    ) -> AsyncIterator[bytes]:
+        """Yield the raw upstream body, storing it in the cache once complete."""
+        limit = self.cache.max_entry_bytes(rule) if rule is not None else 0
+        buffered: list[bytes] | None = [] if rule is not None else None
+        size = 0
+        try:
+            async for chunk in response.aiter_raw():
+                if buffered is not None:
+                    size += len(chunk)
+                    if size > limit:
+                        # Too large to cache; stop buffering
+                        buffered = None
+                    else:
+                        buffered.append(chunk)
+                yield chunk
+        finally:
+            await close()
+
+        if buffered is not None:
+            encoding = response.headers.get("Content-Encoding")
+            try:
+                content = await asyncio.to_thread(decode_body, b"".join(buffered), encoding)
+            except ValueError as e:
+                logger.warning(f"Not caching {endpoint}: {e}")
+                return
+            await self.cache.set(rule, key, endpoint, content)
+
+    async def _fetch(
+        self,
+        rule: CacheRule | None,
+        key: str,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> CacheEntry | httpx.Response:
+        """Fetch from upstream, coalescing identical calls and storing cacheable results."""
+
+        async def fetch() -> CacheEntry | httpx.Response:
+            response = await self._send(method, endpoint, params, json_data)
+            if rule is not None:
+                return await self.cache.set(rule, key, endpoint, response.content)
+            return response
+
+        if self.settings.coalesce_requests:
+            return await self._singleflight.do(key, fetch)
+        return await fetch()
+
+    def _revalidate(
+        self,
+        rule: CacheRule,
+        key: str,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> None:
+        """Refresh a stale entry in the background, at most once per key at a time."""
+        if key in self._revalidating:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetch(rule, key, method, endpoint, params, json_data)
+            except SkogsstyrelsenError as e:
+                logger.warning(f"Background refresh failed for {endpoint}: {e.message}")
+            finally:
+                self._revalidating.pop(key, None)
+
+        self._revalidating[key] = asyncio.create_task(refresh())
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        stream: bool = False,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Make authenticated request to Skogsstyrelsen API.
+
+        Idempotent requests are retried on transient failures with
+        exponential backoff, honoring Retry-After, within the retry budget.
+        Every attempt passes through the API family's circuit breaker. With
+        hedging enabled, an idempotent attempt slower than its rolling p95 is
+        raced against a second identical one. With ``stream`` the successful
+        response is returned unread and the caller must close it.
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call.
+        """
+        family = api_family(endpoint)
+        pool = family or DEFAULT_POOL
+        breaker = self.circuit_breakers.get(family)
+        token = await self.auth.get_token()
+        headers = {**(headers or {}), **self.auth.get_auth_header(token)}
+
+        url = f"{self.settings.skogsstyrelsen_base_url}{endpoint}"
+        self._retry_budget.deposit()
+        attempt = 0
+
+        while True:
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(
+                    f"Skogsstyrelsen {breaker.name} API is unavailable, try again later",
+                    retry_after=breaker.retry_after(),
+                )
+
+            logger.debug(f"Making {method} request to {url}")
+            latency = 0.0
+            try:
+                send = functools.partial(
+                    self._attempt, pool, method, url, headers, params, json_data, stream
+                )
+                hedge = not stream and self.settings.hedging_enabled
+                if hedge and self._is_idempotent(method, endpoint):
+                    response, latency = await self._hedged(f"{method} {endpoint}", pool, send)
+                else:
+                    response, latency = await send()
+                response.raise_for_status()
+                logger.debug(f"Request successful: {method} {url}")
+                self._record_outcome(pool, breaker, latency)
+                return response
+
+            except httpx.HTTPStatusError as e:
+                # Client errors mean the upstream is healthy; only overload and 5xx count
+                self._record_outcome(
+                    pool, breaker, latency, failed=e.response.status_code in RETRYABLE_STATUS_CODES
+                )
+                delay = self._retry_delay(method, endpoint, attempt, e.response)
+                if delay is None:
+                    logger.error(
+                        f"API request failed: {e.response.status_code} - {e.response.text}"
+                    )
+                    raise APIError(
+                        f"API request failed: {e.response.text}",
+                        status_code=e.response.status_code,
+                    )
+                reason = f"status {e.response.status_code}"
+            except httpx.RequestError as e:
+                self._record_outcome(pool, breaker, latency, failed=True)
+                delay = self._retry_delay(method, endpoint, attempt)
+                if delay is None:
+                    logger.error(f"Request error: {str(e)}")
+                    raise APIError(f"Request failed: {str(e)}")
+                reason = str(e) or type(e).__name__
+            except (asyncio.CancelledError, BulkheadFullError):
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            attempt += 1
+            logger.warning(
+                f"Retrying {method} {endpoint} in {delay:.2f}s after {reason} "
+                f"(attempt {attempt + 1}/{self._retry_policy.max_attempts})"
             )
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {str(e)}")
-            raise APIError(f"Request failed: {str(e)}")
+            await asyncio.sleep(delay)
+
+    async def _attempt(
+        self,
+        pool: str,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        stream: bool = False,
+    ) -> tuple[httpx.Response, float]:
+        """Send one request through the pool's bulkhead, returning it with its latency.
+
+        A streamed response holds its connection until the body is consumed,
+        but its bulkhead slot is released once the headers have arrived; the
+        connection is then covered by the caller's stream slot.
+        """
+        client = await self._get_client(pool)
+        async with self.bulkheads[pool].acquire():
+            # Time the upstream call only, not the wait for a slot
+            started = time.monotonic()
+            if stream:
+                request = client.build_request(
+                    method, url, headers=headers, params=params, json=json_data
+                )
+                response = await client.send(request, stream=True)
+                if response.is_error:
+                    # Error mapping reads the body, and the connection must be freed
+                    await response.aread()
+            else:
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    json=json_data,
+                )
+        return response, time.monotonic() - started
+
+    async def _hedged(
+        self,
+        latency_key: str,
+        pool: str,
+        send: Callable[[], Awaitable[tuple[httpx.Response, float]]],
+    ) -> tuple[httpx.Response, float]:
+        """Send a request, racing a second copy if the first is slower than usual.
+
+        The hedge goes out once the first attempt exceeds the rolling
+        percentile for this kind of request, if the pool has a free slot and
+        the hedge budget allows it. The first successful answer wins; the other
+        attempt is cancelled.
+        """
+        self._hedge_budget.deposit()
+        primary = asyncio.ensure_future(send())
+        tasks = {primary}
+        try:
+            delay = self._latencies.percentile(latency_key, self.settings.hedge_percentile)
+            if delay is not None:
+                delay = max(delay, self.settings.hedge_min_delay_seconds)
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                # Never queue a hedge behind real requests
+                if (
+                    not done
+                    and self.bulkheads[pool].has_free_slot()
+                    and self._hedge_budget.try_spend()
+                ):
+                    logger.debug(f"Hedging {latency_key} after {delay:.3f}s")
+                    tasks.add(asyncio.ensure_future(send()))
+
+            error: BaseException | None = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        response, latency = task.result()
+                        self._latencies.record(latency_key, latency)
+                        if task is not primary:
+                            self._hedge_wins += 1
+                        return response, latency
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _record_outcome(
+        self, pool: str, breaker: CircuitBreaker | None, latency: float, failed: bool = False
+    ) -> None:
+        """Report an attempt's outcome and latency to the limiter and circuit breaker."""
+        bulkhead = self.bulkheads[pool]
+        if failed:
+            bulkhead.on_overload()
+            if breaker is not None:
+                breaker.record_failure()
+            return
+
+        bulkhead.on_success(latency)
+        if breaker is not None:
+            breaker.record_success(latency)
+
+    @staticmethod
+    def _is_idempotent(method: str, endpoint: str) -> bool:
+        """Check if a request may be sent more than once."""
+        # GETs and the raster/grunddata POSTs are pure reads and safe to repeat
+        return method.upper() == "GET" or api_family(endpoint) in IDEMPOTENT_POST_FAMILIES
+
+    def _retry_delay(
+        self,
+        method: str,
+        endpoint: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+    ) -> float | None:
+        """Backoff before the next attempt, or None if the failure is final."""
+        if attempt + 1 >= self._retry_policy.max_attempts:
+            return None
+        if not self._is_idempotent(method, endpoint):
+            return None
+
+        retry_after = None
+        if response is not None:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return None
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+        delay = self._retry_policy.backoff(attempt, retry_after)
+        if delay is None or not self._retry_budget.try_spend():
+            return None
+        return delay
 
     async def get(
         self, endpoint: str, params: dict[str, Any] | None = None
@@ -86,3 +664,19 @@ class SkogsstyrelsenClient:
     ) -> dict[str, Any]:
         """Make POST request."""
         return await self._request("POST", endpoint, json_data=json_data)
+
+    async def refresh(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
+        """GET an endpoint from upstream, bypassing and replacing any cached copy."""
+        rule, key = self._cache_key("GET", endpoint, params)
+        response = await self._fetch(rule, key, "GET", endpoint, params)
+        return response.json()
+
+    async def get_raw(self, endpoint: str, params: dict[str, Any] | None = None) -> RawBody:
+        """Make GET request, returning the JSON body without decoding it."""
+        response = await self._response("GET", endpoint, params=params)
+        return RawBody.from_response(response)
+
+    async def post_raw(self, endpoint: str, json_data: dict[str, Any]) -> RawBody:
+        """Make POST request, returning the JSON body without decoding it."""
+        response = await self._response("POST", endpoint, json_data=json_data)
+        return RawBody.from_response(response)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from backend.core.config import Settings
+from backend.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class StoredToken:
+    """Access token shared between workers.
+
+    Expiry is wall-clock epoch seconds because monotonic clocks are not
+    comparable between processes.
+    """
+
+    access_token: str
+    expires_at: float
+
+
+class TokenStore(ABC):
+    """Token cache shared by all workers serving the application."""
+
+    @abstractmethod
+    async def load(self) -> StoredToken | None:
+        """Load the shared token, if any."""
+
+    @abstractmethod
+    async def save(self, token: StoredToken) -> None:
+        """Publish a freshly fetched token to the other workers."""
+
+    @abstractmethod
+    def lock(self) -> AbstractAsyncContextManager[None]:
+        """Hold the cross-worker refresh lock so only one worker authenticates."""
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store shared by auth instances within one process."""
+
+    def __init__(self) -> None:
+        self._token: StoredToken | None = None
+        self._lock = asyncio.Lock()
+
+    async def load(self) -> StoredToken | None:
+        """Load the shared token, if any."""
+        return self._token
+
+    async def save(self, token: StoredToken) -> None:
+        """Store the token for other auth instances."""
+        self._token = token
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        """Hold the refresh lock."""
+        async with self._lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """Token store backed by a local file guarded with an advisory lock.
+
+    Works for uvicorn workers on one host. The lock is released by the OS
+    if the holding worker dies.
+    """
+
+    def __init__(self, path: str | Path, poll_interval: float = 0.05) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.poll_interval = poll_interval
+
+    async def load(self) -> StoredToken | None:
+        """Load the shared token, ignoring a missing or corrupt file."""
+        return await asyncio.to_thread(self._read)
+
+    async def save(self, token: StoredToken) -> None:
+        """Atomically replace the shared token file."""
+        await asyncio.to_thread(self._write, token)
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        """Hold an exclusive flock on the lock file."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # Poll instead of blocking a thread so waiting stays cancellable
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(self.poll_interval)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _read(self) -> StoredToken | None:
+        """Read the token file (blocking)."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return StoredToken(
+                access_token=data["access_token"],
+                expires_at=float(data["expires_at"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable token store {self.path}: {e}")
+            return None
+
+    def _write(self, token: StoredToken) -> None:
+        """Write the token file via a temporary file (blocking)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+        try:
+            # mkstemp creates the file with 0600, keeping the token private
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"access_token": token.access_token, "expires_at": token.expires_at},
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def create_token_store(settings: Settings) -> TokenStore | None:
+    """Create the configured shared token store, or None for per-process tokens."""
+    if settings.token_store_path:
+        return FileTokenStore(settings.token_store_path)
+    return None
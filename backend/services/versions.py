@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from backend.api.constants import API_INFO_ENDPOINTS
+from backend.core.exceptions import SkogsstyrelsenError
+from backend.core.logging import get_logger
+from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
+
+logger = get_logger(__name__)
+
+
+def version_tag(info: Any) -> str | None:
+    """Identify an upstream release from its api-info body, or None if unknown."""
+    if not isinstance(info, dict):
+        return None
+    version = info.get("apiVersion")
+    released = info.get("apiReleased")
+    if not version and not released:
+        return None
+    return f"{version}@{released}"
+
+
+class ApiVersionPoller:
+    """Watch each API family's api-info and keep the cache namespaced by its version.
+
+    Cached responses then stay valid for as long as the upstream release
+    does, and are invalidated as soon as a new one is published rather than
+    when a TTL happens to run out.
+    """
+
+    def __init__(self, client: SkogsstyrelsenClient, interval: float) -> None:
+        self.client = client
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+        self._polled = asyncio.Event()
+        self.checked_at: float | None = None  # time.time() of the last poll
+        self.changes = 0
+        self.errors = 0
+
+    def start(self) -> None:
+        """Start polling in the background; the first poll runs at once."""
+        if self.client.cache is None:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def close(self) -> None:
+        """Stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def wait_polled(self, timeout: float | None = None) -> bool:
+        """Wait for the first poll, if polling is running, so keys are namespaced.
+
+        Returns False if ``timeout`` seconds passed without a completed poll.
+        """
+        if self._task is None:
+            return True
+        try:
+            await asyncio.wait_for(self._polled.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def poll(self) -> None:
+        """Check every family's version once."""
+        await asyncio.gather(*(self._check(family) for family in API_INFO_ENDPOINTS))
+        self.checked_at = time.time()
+
+    async def _poll_loop(self) -> None:
+        """Poll until cancelled."""
+        while True:
+            try:
+                await self.poll()
+            except Exception:
+                # Keep polling; a dead task would leave versions stale for good
+                self.errors += 1
+                logger.exception("API version poll failed")
+            self._polled.set()
+            await asyncio.sleep(self.interval)
+
+    async def _check(self, family: str) -> None:
+        """Fetch one family's api-info and record its version."""
+        try:
+            info = await self.client.refresh(API_INFO_ENDPOINTS[family])
+        except SkogsstyrelsenError as e:
+            self.errors += 1
+            logger.warning(f"Could not check {family} API version: {e.message}")
+            return
+        except ValueError as e:
+            # A 200 that is not JSON, such as a maintenance page
+            self.errors += 1
+            logger.warning(f"Could not check {family} API version: invalid api-info body: {e}")
+            return
+
+        version = version_tag(info)
+        if version is None:
+            self.errors += 1
+            logger.warning(f"{family} api-info has no version information")
+            return
+        if await self.client.cache.set_version(family, version):
+            self.changes += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return the known versions and poll counters."""
+        return {
+            "versions": dict(self.client.cache.versions) if self.client.cache else {},
+            "checked_at": self.checked_at,
+            "changes": self.changes,
+            "errors": self.errors,
+        }
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from backend.api.constants import API_INFO_ENDPOINTS, AbinEndpoints, GrundataEndpoints
+from backend.core.config import Settings
+from backend.core.exceptions import SkogsstyrelsenError
+from backend.core.logging import get_logger
+from backend.services.abin_tree import walk_abin_tree
+from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
+from backend.services.versions import ApiVersionPoller
+
+logger = get_logger(__name__)
+
+# Delay before another pass when the last one fell short of the ready ratio
+RETRY_SECONDS = 30.0
+
+# Longest wait for the first version poll; warming unversioned beats never warming
+VERSION_WAIT_SECONDS = 60.0
+
+
+class CacheWarmer:
+    """Preload the ABIN hierarchy and static lookups into the response cache.
+
+    Walks landsdel -> län -> ÄFO -> stratum metadata, optionally loading
+    each area's summary too, with at most ``concurrency`` upstream calls at
+    a time. Runs at startup, retrying until a pass loads ``ready_ratio`` of
+    its endpoints, and then every ``interval`` seconds; later passes only
+    fetch what has expired or been invalidated since.
+    """
+
+    def __init__(
+        self,
+        client: SkogsstyrelsenClient,
+        concurrency: int = 4,
+        interval: float = 0.0,
+        ready_ratio: float = 0.9,
+        summaries: bool = False,
+        version_poller: ApiVersionPoller | None = None,
+    ) -> None:
+        self.client = client
+        self.concurrency = concurrency
+        self.interval = interval
+        self.ready_ratio = ready_ratio
+        self.summaries = summaries
+        self.version_poller = version_poller
+        self._task: asyncio.Task[None] | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._warmed = False
+        self.runs = 0
+        self.loaded = 0
+        self.failed = 0
+        self.last_duration: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        """True once a pass loaded ``ready_ratio`` of its endpoints, or when not warming."""
+        return self._warmed or self._task is None
+
+    def start(self) -> None:
+        """Start warming in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._warm_loop())
+
+    async def close(self) -> None:
+        """Stop warming."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def warm(self) -> float:
+        """Run one warm-up pass, returning the share of endpoints loaded."""
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self.loaded = 0
+        self.failed = 0
+        started = time.monotonic()
+
+        static = [*API_INFO_ENDPOINTS.values(), GrundataEndpoints.VALID_DATES]
+        if self.summaries:
+            static.append(AbinEndpoints.HELALANDET)
+        await asyncio.gather(*(self._load(endpoint) for endpoint in static), self._walk())
+
+        self.runs += 1
+        self.last_duration = time.monotonic() - started
+        total = self.loaded + self.failed
+        ratio = self.loaded / total if total else 0.0
+        logger.info(
+            f"Cache warm-up loaded {self.loaded} of {total} endpoints "
+            f"in {self.last_duration:.1f}s"
+        )
+        return ratio
+
+    async def _warm_loop(self) -> None:
+        """Warm once, then periodically until cancelled."""
+        if self.version_poller is not None:
+            # Entries stored before versions are known would be orphaned by them
+            if not await self.version_poller.wait_polled(VERSION_WAIT_SECONDS):
+                logger.warning("API versions still unknown, warming the cache without them")
+        while True:
+            try:
+                ratio = await self.warm()
+            except Exception:
+                # Keep trying; a dead task would leave /ready failing for good
+                logger.exception("Cache warm-up pass failed")
+                ratio = 0.0
+            if ratio >= self.ready_ratio:
+                self._warmed = True
+            elif not self._warmed:
+                await asyncio.sleep(RETRY_SECONDS)
+                continue
+            if self.interval <= 0:
+                return
+            await asyncio.sleep(self.interval)
+
+    async def _load(self, endpoint: str) -> Any:
+        """GET an endpoint through the cache, returning its body or None on failure."""
+        async with self._semaphore:
+            try:
+                body = await self.client.get(endpoint)
+            except SkogsstyrelsenError as e:
+                self.failed += 1
+                logger.debug(f"Warm-up failed for {endpoint}: {e.message}")
+                return None
+            except ValueError as e:
+                # A 200 that is not JSON, such as a maintenance page
+                self.failed += 1
+                logger.debug(f"Warm-up failed for {endpoint}: invalid body: {e}")
+                return None
+        self.loaded += 1
+        return body
+
+    async def _walk(self) -> None:
+        """Load the ABIN metadata tree level by level."""
+        await walk_abin_tree(self._load, self.summaries)
+
+    def stats(self) -> dict[str, Any]:
+        """Return readiness and the last pass's counters."""
+        return {
+            "ready": self.ready,
+            "running": self._task is not None and not self._task.done(),
+            "runs": self.runs,
+            "loaded": self.loaded,
+            "failed": self.failed,
+            "last_duration": round(self.last_duration, 2) if self.last_duration else None,
+        }
+
+
+def create_cache_warmer(
+    settings: Settings,
+    client: SkogsstyrelsenClient,
+    version_poller: ApiVersionPoller | None = None,
+) -> CacheWarmer:
+    """Create the cache warmer from settings."""
+    return CacheWarmer(
+        client,
+        concurrency=settings.cache_warmup_concurrency,
+        interval=settings.cache_warmup_interval_seconds,
+        ready_ratio=settings.cache_warmup_ready_ratio,
+        summaries=settings.cache_warmup_summaries,
+        version_poller=version_poller,
+    )
@@ -0,0 +1,96 @@
+"""Serialization cost per proxy endpoint, before and after raw JSON passthrough.
+
+Before: the client decoded the upstream body, and FastAPI validated the
+returned object against the route's return annotation (or response_model)
+and serialized it again. After: the upstream bytes are returned as is.
+
+Run with ``python -m benchmarks.serialization``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import timeit
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from backend.core.responses import RawJSONResponse
+from backend.models.responses import ApiInfoResponse
+
+
+def _ring(points: int) -> str:
+    coordinates = [
+        f"{random.uniform(300000, 900000):.3f} {random.uniform(6100000, 7700000):.3f}"
+        for _ in range(points)
+    ]
+    return "(" + ", ".join(coordinates + coordinates[:1]) + ")"
+
+
+def _payloads() -> dict[str, tuple[bytes, Any]]:
+    """Representative upstream bodies with the type FastAPI validated them against."""
+    random.seed(1)
+    geometri = [
+        {
+            "omrade": f"Län {i}",
+            "inventeringsAr": 2015 + i,
+            "geometri": "MULTIPOLYGON ((" + _ring(20000) + "))",
+        }
+        for i in range(5)
+    ]
+    histogram = {
+        "histogram": [
+            {"klass": i, "klassMin": i * 10, "klassMax": (i + 1) * 10, "areal": random.random()}
+            for i in range(200)
+        ],
+        "marktyp": "Skogsmark",
+    }
+    valid_dates = [f"{year}-01-01" for year in range(2010, 2040)]
+    api_info = {
+        "apiName": "Raster",
+        "apiVersion": "1.0",
+        "apiReleased": "2024-01-01",
+        "apiDocumentation": "https://api.skogsstyrelsen.se",
+        "apiStatus": "active",
+    }
+    return {
+        "abin/lan/{lankod}/geometri": (
+            json.dumps(geometri).encode(),
+            dict[str, Any] | list[dict[str, Any]],
+        ),
+        "grunddata/volym/histogram": (json.dumps(histogram).encode(), dict[str, Any]),
+        "grunddata/valid-dates": (json.dumps(valid_dates).encode(), list[str]),
+        "raster/api-info": (json.dumps(api_info).encode(), ApiInfoResponse),
+    }
+
+
+def _time(fn: Any, number: int) -> float:
+    """Best per-call time in microseconds."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    """Print per-endpoint timings."""
+    print(f"{'endpoint':32} {'size':>10} {'before µs':>12} {'after µs':>10} {'speedup':>8}")
+    for endpoint, (body, response_type) in _payloads().items():
+        adapter = TypeAdapter(response_type)
+
+        def before(body: bytes = body, adapter: TypeAdapter[Any] = adapter) -> bytes:
+            value = adapter.validate_python(json.loads(body))
+            return adapter.dump_json(value, by_alias=True)
+
+        def after(body: bytes = body) -> bytes:
+            return RawJSONResponse(body).body
+
+        number = 20 if len(body) > 100_000 else 2000
+        before_us = _time(before, number)
+        after_us = _time(after, number)
+        print(
+            f"{endpoint:32} {len(body):>10} {before_us:>12.1f} {after_us:>10.1f} "
+            f"{before_us / after_us:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
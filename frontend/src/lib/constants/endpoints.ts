@@ -11,6 +11,8 @@ export const ENDPOINTS = {
    */
   grunddata: {
     validDates: '/api/grunddata/valid-dates',
+    metrics: '/api/grunddata/metrics',
+    histograms: '/api/grunddata/histograms',
     biomassa: '/api/grunddata/biomassa',
     biomassaHistogram: '/api/grunddata/biomassa/histogram',
     volym: '/api/grunddata/volym',
@@ -31,6 +33,7 @@ export const ENDPOINTS = {
   abin: {
     helalandet: '/api/abin/helalandet',
     helalandetGeometri: '/api/abin/helalandet/geometri',
+    tree: '/api/abin/tree',
     landsdelMetadata: '/api/abin/landsdel/metadata',
     landsdel: (landsdelkod: string) => `/api/abin/landsdel/${landsdelkod}`,
     landsdelGeometri: (landsdelkod: string) => `/api/abin/landsdel/${landsdelkod}/geometri`,
@@ -14,6 +14,14 @@ export async function getHelalandetGeometri() {
   return get('/api/abin/helalandet/geometri');
 }
 
+/**
+ * Get the whole landsdel → län → ÄFO → stratum hierarchy in one request,
+ * optionally with each area's summary.
+ */
+export async function getTree(summaries = false) {
+  return get(`/api/abin/tree${summaries ? '?summaries=true' : ''}`);
+}
+
 /**
  * Get metadata for all regions (landsdel).
  */
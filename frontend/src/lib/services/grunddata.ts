@@ -12,6 +12,36 @@ export interface HistogramRequest extends StatistikRequest {
   antalKlasser?: number;
 }
 
+export interface HistogramClasses {
+  klassBredd?: number;
+  antalKlasser?: number;
+}
+
+export interface MultiHistogramRequest extends StatistikRequest {
+  klasser?: Record<string, HistogramClasses>;
+}
+
+export interface MetricResult {
+  status: 'ok' | 'error';
+  duration_ms: number;
+  data?: any;
+  error?: { type: string; detail: string; status_code: number | null };
+}
+
+export interface MetricsResponse {
+  metrics: Record<string, MetricResult>;
+  succeeded: string[];
+  failed: string[];
+  duration_ms: number;
+}
+
+export interface HistogramsResponse {
+  histograms: Record<string, MetricResult>;
+  succeeded: string[];
+  failed: string[];
+  duration_ms: number;
+}
+
 export interface FramskrivningRequest extends StatistikRequest {
   datum?: string;
 }
@@ -23,6 +53,20 @@ export async function getValidProjectionDates(): Promise<string[]> {
   return get<string[]>('/api/grunddata/valid-dates');
 }
 
+/**
+ * Calculate biomass, volume, basal area, mean height and mean diameter in one request.
+ */
+export async function getMetrics(request: StatistikRequest): Promise<MetricsResponse> {
+  return post<MetricsResponse>('/api/grunddata/metrics', request);
+}
+
+/**
+ * Get all five distribution histograms in one request, with class layout per metric.
+ */
+export async function getHistograms(request: MultiHistogramRequest): Promise<HistogramsResponse> {
+  return post<HistogramsResponse>('/api/grunddata/histograms', request);
+}
+
 /**
  * Calculate biomass (ton dry substance/ha) for area.
  */
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.services.skogsstyrelsen_client import RawBody, RawResponse
+
 
 def mock_get_api_client():
     """Mock dependency for get_api_client."""
     from unittest.mock import AsyncMock, MagicMock
 
     mock_client = MagicMock()
-    mock_client.get = AsyncMock()
-    mock_client.post = AsyncMock()
+    mock_client.get_raw = AsyncMock()
+    mock_client.post_raw = AsyncMock()
     return mock_client
 
 
@@ -26,9 +29,9 @@ def test_get_helalandet(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/helalandet")
 
@@ -37,6 +40,41 @@ def test_get_helalandet(client: TestClient):
     assert data["omrade"] == "Hela landet"
 
 
+@pytest.mark.unit
+def test_get_helalandet_conditional_request(client: TestClient):
+    """Test ABIN responses carry an ETag and Cache-Control and answer 304 on a match."""
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get_raw",
+        new_callable=AsyncMock,
+        return_value=RawBody(b'{"omrade": "Hela landet"}', etag='"v1"'),
+    ):
+        response = client.get("/api/abin/helalandet")
+        not_modified = client.get("/api/abin/helalandet", headers={"If-None-Match": '"v1"'})
+        changed = client.get("/api/abin/helalandet", headers={"If-None-Match": '"v0"'})
+
+    assert response.headers["ETag"] == '"v1"'
+    assert response.headers["Cache-Control"].startswith("public, max-age=")
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == '"v1"'
+    assert not_modified.headers["Cache-Control"] == response.headers["Cache-Control"]
+    assert changed.status_code == 200
+
+
+@pytest.mark.unit
+def test_get_geometri_conditional_request(client: TestClient):
+    """Test cached geometries are answered with 304 when the ETag matches."""
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.stream",
+        new_callable=AsyncMock,
+        side_effect=lambda *args, **kwargs: RawResponse.from_bytes(b"{}", etag='"g1"'),
+    ):
+        response = client.get("/api/abin/lan/01/geometri", headers={"If-None-Match": 'W/"g1"'})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"g1"'
+
+
 @pytest.mark.unit
 def test_get_helalandet_geometri(client: TestClient):
     """Test GET /api/abin/helalandet/geometri endpoint."""
@@ -47,9 +85,9 @@ def test_get_helalandet_geometri(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.stream",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawResponse.from_bytes(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/helalandet/geometri")
 
@@ -70,7 +108,7 @@ def test_get_landsdel_metadata(client: TestClient):
     ]
 
     mock_client = mock_get_api_client()
-    mock_client.get.return_value = mock_response
+    mock_client.get_raw.return_value = RawBody(json.dumps(mock_response).encode())
 
     app.dependency_overrides[get_api_client] = lambda: mock_client
 
@@ -94,9 +132,9 @@ def test_get_landsdel(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/landsdel/1")
 
@@ -115,9 +153,9 @@ def test_get_lan(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/lan/01")
 
@@ -137,9 +175,9 @@ def test_get_lan_geometri(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.stream",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawResponse.from_bytes(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/lan/01/geometri")
 
@@ -160,7 +198,7 @@ def test_get_lan_metadata(client: TestClient):
     ]
 
     mock_client = mock_get_api_client()
-    mock_client.get.return_value = mock_response
+    mock_client.get_raw.return_value = RawBody(json.dumps(mock_response).encode())
 
     app.dependency_overrides[get_api_client] = lambda: mock_client
 
@@ -184,9 +222,9 @@ def test_get_afo(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/lan/01/afo/101")
 
@@ -204,9 +242,9 @@ def test_get_afo_geometri(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.stream",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawResponse.from_bytes(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/lan/01/afo/101/geometri")
 
@@ -227,7 +265,7 @@ def test_get_afo_metadata(client: TestClient):
     ]
 
     mock_client = mock_get_api_client()
-    mock_client.get.return_value = mock_response
+    mock_client.get_raw.return_value = RawBody(json.dumps(mock_response).encode())
 
     app.dependency_overrides[get_api_client] = lambda: mock_client
 
@@ -250,9 +288,9 @@ def test_get_stratum(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/lan/01/afo/101/stratum/1")
 
@@ -270,9 +308,9 @@ def test_get_stratum_geometri(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.stream",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawResponse.from_bytes(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/lan/01/afo/101/stratum/1/geometri")
 
@@ -293,7 +331,7 @@ def test_get_stratum_metadata(client: TestClient):
     ]
 
     mock_client = mock_get_api_client()
-    mock_client.get.return_value = mock_response
+    mock_client.get_raw.return_value = RawBody(json.dumps(mock_response).encode())
 
     app.dependency_overrides[get_api_client] = lambda: mock_client
 
@@ -316,12 +354,47 @@ def test_get_abin_api_info(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/abin/api-info")
 
     assert response.status_code == 200
     data = response.json()
     assert "apiName" in data
+
+
+@pytest.mark.unit
+def test_get_tree(client: TestClient):
+    """Test GET /api/abin/tree assembles the hierarchy and answers 304 on a match."""
+    metadata = {
+        "/abin/v2/landsdel/metadata": [{"namn": "Norra Norrland", "kod": "1"}],
+        "/abin/v2/landsdel/1/lan/metadata": [{"namn": "Norrbotten", "kod": "25"}],
+        "/abin/v2/landsdel/1/lan/25/afo/metadata": [{"namn": "Norra", "kod": "251"}],
+        "/abin/v2/landsdel/1/lan/25/afo/251/stratum/metadata": [{"namn": "Kust", "kod": "1"}],
+    }
+
+    async def fake_get(endpoint: str):
+        return metadata.get(endpoint, {"omrade": endpoint})
+
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        new_callable=AsyncMock,
+        side_effect=fake_get,
+    ) as mock_get:
+        response = client.get("/api/abin/tree")
+        calls = mock_get.await_count
+        cached = client.get("/api/abin/tree", headers={"If-None-Match": response.headers["ETag"]})
+        with_summaries = client.get("/api/abin/tree?summaries=true")
+
+    assert response.status_code == 200
+    lan = response.json()["landsdel"][0]["lan"][0]
+    assert lan["afo"][0]["stratum"] == [{"namn": "Kust", "kod": "1"}]
+    assert "summary" not in lan
+    assert calls == len(metadata)
+    assert cached.status_code == 304
+    assert with_summaries.json()["helalandet"] == {"omrade": "/abin/v2/helalandet"}
+    assert with_summaries.json()["landsdel"][0]["lan"][0]["summary"] == {
+        "omrade": "/abin/v2/lan/25"
+    }
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.api.constants import GrundataEndpoints
+from backend.core.exceptions import APIError
+from backend.services.skogsstyrelsen_client import RawBody
+
 
 @pytest.mark.unit
 def test_get_valid_projection_dates(client: TestClient):
@@ -12,9 +17,9 @@ def test_get_valid_projection_dates(client: TestClient):
     mock_response = ["2024-01-01", "2025-01-01", "2026-01-01"]
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.get("/api/grunddata/valid-dates")
 
@@ -45,9 +50,9 @@ def test_get_biomassa(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.post("/api/grunddata/biomassa", json=request_data)
 
@@ -76,9 +81,9 @@ def test_get_volym(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.post("/api/grunddata/volym", json=request_data)
 
@@ -108,9 +113,9 @@ def test_get_biomassa_histogram(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.post("/api/grunddata/biomassa/histogram", json=request_data)
 
@@ -133,9 +138,9 @@ def test_get_grundyta(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.post("/api/grunddata/grundyta", json=request_data)
 
@@ -156,9 +161,9 @@ def test_get_medelhojd(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.post("/api/grunddata/medelhojd", json=request_data)
 
@@ -177,9 +182,9 @@ def test_get_medeldiameter(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.post("/api/grunddata/medeldiameter", json=request_data)
 
@@ -201,9 +206,9 @@ def test_get_volym_framskriven(client: TestClient):
     }
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.post("/api/grunddata/volym-framskriven", json=request_data)
 
@@ -224,3 +229,191 @@ def test_grunddata_validation_error(client: TestClient):
     response = client.post("/api/grunddata/biomassa", json=request_data)
 
     assert response.status_code == 422  # Validation error
+
+
+@pytest.mark.unit
+def test_get_metrics(client: TestClient):
+    """Test POST /api/grunddata/metrics fans out once per metric with the same body."""
+    request_data = {
+        "geometri": "POLYGON ((485486 7018193, 486179 7018193, 486179 7018896, 485486 7018896, 485486 7018193))",
+        "marktyp": ["ProduktivSkogsmark"],
+        "pixelstorlek": 2,
+    }
+
+    async def post_raw(endpoint: str, json_data: dict) -> RawBody:
+        if endpoint == GrundataEndpoints.MEDELDIAMETER:
+            raise APIError("Upstream timeout", status_code=504)
+        return RawBody(json.dumps({"endpoint": endpoint}).encode())
+
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
+        new_callable=AsyncMock,
+        side_effect=post_raw,
+    ) as mock_post:
+        response = client.post("/api/grunddata/metrics", json=request_data)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == ["biomassa", "volym", "grundyta", "medelhojd"]
+    assert data["failed"] == ["medeldiameter"]
+    assert data["metrics"]["volym"]["data"] == {"endpoint": GrundataEndpoints.VOLYM}
+    assert data["metrics"]["medeldiameter"]["error"]["status_code"] == 504
+    assert mock_post.await_count == 5
+    assert all(call.kwargs["json_data"] == request_data for call in mock_post.await_args_list)
+
+
+@pytest.mark.unit
+def test_get_metrics_all_failed(client: TestClient):
+    """Test the upstream error status is kept when every metric fails."""
+    request_data = {"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"}
+
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
+        new_callable=AsyncMock,
+        side_effect=APIError("Invalid geometry", status_code=400),
+    ):
+        response = client.post("/api/grunddata/metrics", json=request_data)
+
+    assert response.status_code == 400
+    assert response.json()["type"] == "api_error"
+
+
+@pytest.mark.unit
+def test_get_histograms(client: TestClient):
+    """Test POST /api/grunddata/histograms applies each metric's class layout."""
+    request_data = {
+        "geometri": "POLYGON ((485486 7018193, 486179 7018193, 486179 7018896, 485486 7018896, 485486 7018193))",
+        "pixelstorlek": 2,
+        "klasser": {
+            "biomassa": {"klassBredd": 100, "antalKlasser": 20},
+            "grundyta": {"klassBredd": 5},
+        },
+    }
+
+    async def post_raw(endpoint: str, json_data: dict) -> RawBody:
+        return RawBody(json.dumps(json_data).encode())
+
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
+        new_callable=AsyncMock,
+        side_effect=post_raw,
+    ) as mock_post:
+        response = client.post("/api/grunddata/histograms", json=request_data)
+
+    assert response.status_code == 200
+    histograms = response.json()["histograms"]
+    assert mock_post.await_count == 5
+    assert histograms["biomassa"]["data"]["klassBredd"] == 100
+    assert histograms["biomassa"]["data"]["antalKlasser"] == 20
+    assert histograms["grundyta"]["data"]["klassBredd"] == 5
+    assert "klassBredd" not in histograms["volym"]["data"]
+    assert all("klasser" not in entry["data"] for entry in histograms.values())
+    assert histograms["volym"]["data"]["geometri"] == request_data["geometri"]
+
+
+@pytest.mark.unit
+def test_get_histograms_rejects_unknown_metric(client: TestClient):
+    """Test class layouts are only accepted for known metrics."""
+    request_data = {
+        "geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))",
+        "klasser": {"hojd": {"klassBredd": 5}},
+    }
+
+    response = client.post("/api/grunddata/histograms", json=request_data)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.unit
+def test_get_batch_ndjson(client: TestClient):
+    """Test POST /api/grunddata/batch streams one NDJSON line per area."""
+    body = "\n".join(
+        [
+            json.dumps({"id": 1, "geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"}),
+            "not json",
+            json.dumps({"id": 3, "geometri": "POLYGON ((0 0, 2 0, 2 2, 0 0))"}),
+        ]
+    )
+
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
+        new_callable=AsyncMock,
+        return_value=RawBody(b'{"medel": 1.0}'),
+    ) as mock_post:
+        response = client.post(
+            "/api/grunddata/batch?metrics=volym&metrics=medelhojd",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    lines = {line["index"]: line for line in map(json.loads, response.text.splitlines())}
+    assert lines[0]["status"] == "ok"
+    assert set(lines[0]["metrics"]) == {"volym", "medelhojd"}
+    assert lines[1]["error"]["type"] == "validation_error"
+    assert lines[2]["id"] == 3
+    assert mock_post.await_count == 4
+
+
+@pytest.mark.unit
+def test_get_batch_json_array(client: TestClient):
+    """Test a JSON array body is accepted and a non-array rejected."""
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
+        new_callable=AsyncMock,
+        return_value=RawBody(b"{}"),
+    ):
+        response = client.post(
+            "/api/grunddata/batch", json=[{"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"}]
+        )
+
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 1
+    assert json.loads(response.text)["succeeded"] == [
+        "biomassa",
+        "volym",
+        "grundyta",
+        "medelhojd",
+        "medeldiameter",
+    ]
+
+    response = client.post("/api/grunddata/batch", json={"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"})
+    assert response.status_code == 422
+
+
+@pytest.mark.unit
+def test_get_batch_ndjson_compressed(client: TestClient):
+    """Test a gzip-accepting client gets the NDJSON stream compressed."""
+    body = "\n".join(
+        json.dumps({"id": index, "geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"})
+        for index in range(20)
+    )
+
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
+        new_callable=AsyncMock,
+        return_value=RawBody(b'{"medel": 1.0}'),
+    ):
+        response = client.post(
+            "/api/grunddata/batch?metrics=volym",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson", "Accept-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["id"] for line in lines) == list(range(20))
+
+
+@pytest.mark.unit
+def test_get_batch_json_array_too_large(client: TestClient):
+    """Test an oversized JSON array body is rejected with 413."""
+    from backend.core.config import get_settings
+
+    items = [{"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"}] * 10
+    with patch.object(get_settings(), "batch_max_json_bytes", 100):
+        response = client.post("/api/grunddata/batch", json=items)
+
+    assert response.status_code == 413
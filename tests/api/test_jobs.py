@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core.config import get_settings
+from backend.main import app
+from backend.services.skogsstyrelsen_client import RawBody
+
+POLYGON = "POLYGON ((0 0, 1 0, 1 1, 0 0))"
+
+
+@pytest.fixture
+def jobs_client(
+    app_env: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[TestClient, None, None]:
+    """Create a test client with background jobs stored in a temporary database."""
+    monkeypatch.setenv("JOBS_DB_PATH", str(tmp_path / "jobs.sqlite3"))
+    get_settings.cache_clear()
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
+        new_callable=AsyncMock,
+        return_value=RawBody(b'{"medel": 1.0}'),
+    ):
+        with TestClient(app) as test_client:
+            yield test_client
+    monkeypatch.delenv("JOBS_DB_PATH")
+    get_settings.cache_clear()
+
+
+def wait_finished(client: TestClient, job_id: str, timeout: float = 5.0) -> dict:
+    """Poll a job until it has completed or failed."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/jobs/{job_id}").json()
+        if job["status"] in ("completed", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+@pytest.mark.unit
+def test_submit_job_and_page_results(jobs_client: TestClient):
+    """Test an NDJSON job is accepted, processed and its results paginated."""
+    body = "\n".join(json.dumps({"id": index, "geometri": POLYGON}) for index in range(5))
+
+    response = jobs_client.post(
+        "/api/jobs?metrics=volym",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["total"] == 5
+    assert response.headers["Location"] == f"/api/jobs/{job['id']}"
+
+    job = wait_finished(jobs_client, job["id"])
+    assert job["status"] == "completed"
+    assert job["progress"] == 1.0
+
+    page = jobs_client.get(f"/api/jobs/{job['id']}/results?offset=2&limit=2").json()
+    assert page["job"]["done"] == 5
+    assert [result["id"] for result in page["results"]] == [2, 3]
+    assert page["results"][0]["metrics"]["volym"]["data"] == {"medel": 1.0}
+
+
+@pytest.mark.unit
+def test_download_job_results(jobs_client: TestClient):
+    """Test all results download as NDJSON in item order."""
+    items = [{"id": index, "geometri": POLYGON} for index in range(3)]
+    job = jobs_client.post("/api/jobs", json=items).json()
+    wait_finished(jobs_client, job["id"])
+
+    response = jobs_client.get(f"/api/jobs/{job['id']}/download")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    assert "attachment" in response.headers["Content-Disposition"]
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [0, 1, 2]
+
+
+@pytest.mark.unit
+def test_submit_job_idempotency_key(jobs_client: TestClient):
+    """Test resubmitting with the same Idempotency-Key returns the first job."""
+    headers = {"Idempotency-Key": "lan-07"}
+    first = jobs_client.post("/api/jobs", json=[{"geometri": POLYGON}], headers=headers)
+    second = jobs_client.post("/api/jobs", json=[{"geometri": POLYGON}] * 2, headers=headers)
+
+    assert first.status_code == 202
+    assert second.status_code == 200
+    assert second.json()["id"] == first.json()["id"]
+    assert second.json()["total"] == 1
+
+
+@pytest.mark.unit
+def test_submit_job_too_many_items(jobs_client: TestClient):
+    """Test a job over the item limit is rejected with 413."""
+    with patch.object(jobs_client.app.state.job_queue, "max_items", 1):
+        response = jobs_client.post("/api/jobs", json=[{"geometri": POLYGON}] * 2)
+
+    assert response.status_code == 413
+
+
+@pytest.mark.unit
+def test_unknown_job(jobs_client: TestClient):
+    """Test unknown job ids return 404."""
+    assert jobs_client.get("/api/jobs/missing").status_code == 404
+    assert jobs_client.get("/api/jobs/missing/results").status_code == 404
+
+
+@pytest.mark.unit
+def test_jobs_disabled(client: TestClient):
+    """Test job routes return 503 when no job database is configured."""
+    response = client.post("/api/jobs", json=[{"geometri": POLYGON}])
+
+    assert response.status_code == 503
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.services.skogsstyrelsen_client import RawBody
+
 
 def mock_get_api_client():
     """Mock dependency for get_api_client."""
     mock_client = MagicMock()
-    mock_client.get = AsyncMock()
-    mock_client.post = AsyncMock()
+    mock_client.get_raw = AsyncMock()
+    mock_client.post_raw = AsyncMock()
     return mock_client
 
 
@@ -29,7 +32,7 @@ def test_get_raster_api_info(client: TestClient):
     }
 
     mock_client = mock_get_api_client()
-    mock_client.get.return_value = mock_response
+    mock_client.get_raw.return_value = RawBody(json.dumps(mock_response).encode())
 
     app.dependency_overrides[get_api_client] = lambda: mock_client
 
@@ -55,9 +58,9 @@ def test_scl_histogram_date_summary(client: TestClient):
     mock_response = {"dates": [{"datum": "2023-06-01", "braData": 0.95}]}
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.post("/api/raster/scl/histogram-date-summary", json=request_data)
 
@@ -78,9 +81,9 @@ def test_scl_histogram_by_bkid(client: TestClient):
     mock_response = {"histogram": [{"class": 1, "count": 100}]}
 
     with patch(
-        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post",
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.post_raw",
         new_callable=AsyncMock,
-        return_value=mock_response,
+        return_value=RawBody(json.dumps(mock_response).encode()),
     ):
         response = client.post("/api/raster/scl/histogram-by-bkid", json=request_data)
 
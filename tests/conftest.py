@@ -8,7 +8,7 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
-from backend.core.config import Settings
+from backend.core.config import Settings, get_settings
 from backend.main import app
 from backend.services.auth import SkogsstyrelsenAuth
 from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
@@ -40,12 +40,20 @@ def mock_api_client(mock_auth: SkogsstyrelsenAuth, test_settings: Settings) -> S
 
 
 @pytest.fixture
-def client() -> Generator[TestClient, None, None]:
-    """Create FastAPI test client."""
+def app_env() -> None:
+    """Configure the application settings used by the lifespan handler."""
     # Override settings to use test credentials
     os.environ["SKOGSSTYRELSEN_CLIENT_ID"] = "test_client_id"
     os.environ["SKOGSSTYRELSEN_CLIENT_SECRET"] = "test_client_secret"
+    # Never contact the real auth server from the background renewal task
+    os.environ["TOKEN_BACKGROUND_RENEWAL"] = "false"
+    os.environ["API_VERSION_POLLING"] = "false"
+    get_settings.cache_clear()
+
 
+@pytest.fixture
+def client(app_env: None) -> Generator[TestClient, None, None]:
+    """Create FastAPI test client."""
     # Clear any existing overrides
     app.dependency_overrides.clear()
 
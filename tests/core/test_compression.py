@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import gzip
+import json
+import zlib
+
+import zstandard
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.core.compression import (
+    CompressedVariantCache,
+    CompressionMiddleware,
+    is_compressible,
+)
+from backend.services.encoding import compress_body, decode_body, negotiate_encoding
+
+LEVELS = {"zstd": 3, "gzip": 6}
+LARGE_BODY = json.dumps({"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))" * 200}).encode()
+
+
+def create_app(variants: CompressedVariantCache | None = None) -> FastAPI:
+    """Build a small app behind the compression middleware."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, levels=LEVELS, min_size=100, variants=variants)
+
+    @app.get("/large")
+    def large() -> Response:
+        return Response(LARGE_BODY, media_type="application/json")
+
+    @app.get("/small")
+    def small() -> Response:
+        return Response(b'{"ok": true}', media_type="application/json")
+
+    @app.get("/encoded")
+    def encoded() -> Response:
+        return Response(
+            gzip.compress(LARGE_BODY),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        async def chunks():
+            for _ in range(3):
+                yield LARGE_BODY
+
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    return app
+
+
+@pytest.mark.unit
+def test_negotiate_encoding_prefers_quality_then_order():
+    """Test the client's q-values win and ties follow our preference."""
+    assert negotiate_encoding("gzip, zstd", ("zstd", "gzip")) == "zstd"
+    assert negotiate_encoding("gzip, zstd;q=0.5", ("zstd", "gzip")) == "gzip"
+    assert negotiate_encoding("*", ("zstd", "gzip")) == "zstd"
+    assert negotiate_encoding("identity", ("zstd", "gzip")) is None
+    assert negotiate_encoding(None, ("zstd", "gzip")) is None
+
+
+@pytest.mark.unit
+def test_is_compressible():
+    """Test only text-like media types are compressed."""
+    assert is_compressible("application/json")
+    assert is_compressible("text/plain; charset=utf-8")
+    assert not is_compressible("image/png")
+
+
+@pytest.mark.unit
+def test_compresses_large_bodies():
+    """Test large JSON bodies are compressed with the negotiated encoding."""
+    with TestClient(create_app()) as client:
+        gzipped = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        zstd = client.get("/large", headers={"Accept-Encoding": "zstd, gzip"})
+
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.headers["Vary"] == "Accept-Encoding"
+    assert int(gzipped.headers["Content-Length"]) < len(LARGE_BODY)
+    assert gzipped.content == LARGE_BODY
+    assert zstd.headers["Content-Encoding"] == "zstd"
+    assert zstd.content == LARGE_BODY
+
+
+@pytest.mark.unit
+def test_skips_small_encoded_and_unaccepted_bodies():
+    """Test small, already encoded or unaccepted responses are sent unchanged."""
+    with TestClient(create_app()) as client:
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        encoded = client.get("/encoded", headers={"Accept-Encoding": "zstd"})
+        identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "Content-Encoding" not in small.headers
+    assert encoded.headers["Content-Encoding"] == "gzip"
+    assert encoded.content == LARGE_BODY
+    assert "Content-Encoding" not in identity.headers
+    assert identity.content == LARGE_BODY
+
+
+@pytest.mark.unit
+def test_compresses_streamed_bodies():
+    """Test streamed bodies are compressed incrementally without a length."""
+    with TestClient(create_app()) as client:
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert response.content == LARGE_BODY * 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+async def test_flushes_incremental_streams_per_chunk(encoding: str):
+    """Test each NDJSON chunk can be decoded as soon as it is sent."""
+    lines = [json.dumps({"index": index, "geometri": "POLYGON"}).encode() + b"\n" for index in range(3)]
+
+    async def app(scope, receive, send):
+        headers = [(b"content-type", b"application/x-ndjson")]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for line in lines:
+            await send({"type": "http.response.body", "body": line, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", encoding.encode())]}
+    await CompressionMiddleware(app, levels=LEVELS, min_size=100)(scope, None, send)
+
+    if encoding == "gzip":
+        decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    else:
+        decoder = zstandard.ZstdDecompressor().decompressobj()
+    chunks = [message["body"] for message in sent[1:-1]]
+    assert [decoder.decompress(chunk) for chunk in chunks] == lines
+
+
+@pytest.mark.unit
+def test_reuses_compressed_variants():
+    """Test repeated bodies are compressed once per encoding."""
+    variants = CompressedVariantCache(max_bytes=1024 * 1024)
+    with TestClient(create_app(variants)) as client:
+        for _ in range(3):
+            client.get("/large", headers={"Accept-Encoding": "gzip"})
+        client.get("/large", headers={"Accept-Encoding": "zstd"})
+
+    stats = variants.stats()
+    assert stats["entries"] == 2
+    assert stats["misses"] == 2
+    assert stats["hits"] == 2
+
+
+@pytest.mark.unit
+def test_variant_cache_evicts_least_recently_used():
+    """Test the variant cache stays within its byte budget."""
+    variants = CompressedVariantCache(max_bytes=10)
+    first = variants.key_for("gzip", b"first")
+    second = variants.key_for("gzip", b"second")
+
+    variants.set(first, b"123456")
+    variants.set(second, b"123456")
+
+    assert variants.get(first) is None
+    assert variants.get(second) == b"123456"
+    assert variants.stats()["bytes"] == 6
+
+
+@pytest.mark.unit
+def test_compress_body_roundtrips():
+    """Test one-shot compression decodes back to the original body."""
+    for encoding in ("gzip", "zstd"):
+        assert decode_body(compress_body(LARGE_BODY, encoding, 3), encoding) == LARGE_BODY
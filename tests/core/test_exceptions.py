@@ -5,6 +5,7 @@ import pytest
 from backend.core.exceptions import (
     APIError,
     AuthenticationError,
+    CircuitOpenError,
     ConfigurationError,
     SkogsstyrelsenError,
 )
@@ -62,3 +63,13 @@ def test_exception_inheritance():
     assert issubclass(AuthenticationError, SkogsstyrelsenError)
     assert issubclass(APIError, SkogsstyrelsenError)
     assert issubclass(ConfigurationError, SkogsstyrelsenError)
+
+
+@pytest.mark.unit
+def test_circuit_open_error():
+    """Test CircuitOpenError is a 503 API error carrying a retry hint."""
+    error = CircuitOpenError("Upstream unavailable", retry_after=5.0)
+
+    assert isinstance(error, APIError)
+    assert error.status_code == 503
+    assert error.retry_after == 5.0
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from backend.core.config import Settings
+from backend.core.http_cache import (
+    CacheControlMiddleware,
+    build_cache_control_rules,
+    etag_matches,
+)
+
+
+@pytest.mark.unit
+def test_etag_matches():
+    """Test If-None-Match lists, weak validators and wildcards."""
+    assert etag_matches('"a"', '"a"')
+    assert etag_matches('"x", W/"a"', '"a"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches('"b"', '"a"')
+    assert not etag_matches(None, '"a"')
+
+
+@pytest.mark.unit
+def test_cache_control_per_route_family(test_settings: Settings):
+    """Test each cacheable family gets its own max-age and others get none."""
+    app = FastAPI()
+    app.add_middleware(CacheControlMiddleware, rules=build_cache_control_rules(test_settings))
+
+    @app.get("/api/{family}/api-info")
+    @app.get("/api/abin/lan/{lankod}")
+    @app.get("/api/grunddata/valid-dates")
+    @app.get("/health")
+    def ok() -> Response:
+        return Response(b"{}")
+
+    @app.post("/api/abin/lan/{lankod}")
+    def post() -> Response:
+        return Response(b"{}")
+
+    with TestClient(app) as client:
+        api_info = client.get("/api/raster/api-info")
+        valid_dates = client.get("/api/grunddata/valid-dates")
+        abin = client.get("/api/abin/lan/01")
+        health = client.get("/health")
+        posted = client.post("/api/abin/lan/01")
+
+    swr = test_settings.http_cache_stale_while_revalidate_seconds
+    assert api_info.headers["Cache-Control"] == (
+        f"public, max-age={test_settings.http_cache_api_info_max_age_seconds}, "
+        f"stale-while-revalidate={swr}"
+    )
+    assert f"max-age={test_settings.http_cache_valid_dates_max_age_seconds}" in (
+        valid_dates.headers["Cache-Control"]
+    )
+    assert f"max-age={test_settings.http_cache_abin_max_age_seconds}" in (
+        abin.headers["Cache-Control"]
+    )
+    assert "Cache-Control" not in health.headers
+    assert "Cache-Control" not in posted.headers
+
+
+@pytest.mark.unit
+def test_cache_control_disabled_family(test_settings: Settings):
+    """Test a max-age of 0 sends no Cache-Control for that family."""
+    test_settings.http_cache_abin_max_age_seconds = 0
+
+    rules = build_cache_control_rules(test_settings)
+
+    assert not any(rule.pattern.match("/api/abin/helalandet") for rule in rules)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.core.responses import RawJSONResponse, passthrough_response
+from backend.services.skogsstyrelsen_client import RawBody, RawResponse
+
+
+async def body_chunks():
+    """Yield a compressed body in two chunks."""
+    yield b"\x1f\x8b"
+    yield b"rest"
+
+
+@pytest.mark.unit
+async def test_passthrough_response_keeps_encoding():
+    """Test upstream encoding and length are relayed as headers."""
+    raw = RawResponse(body_chunks(), content_encoding="gzip", content_length=6)
+
+    response = passthrough_response(raw)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Content-Length"] == "6"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.media_type == "application/json"
+
+
+@pytest.mark.unit
+async def test_passthrough_response_identity():
+    """Test identity bodies get no Content-Encoding header."""
+    response = passthrough_response(RawResponse.from_bytes(b"{}"))
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Content-Length"] == "2"
+
+
+@pytest.mark.unit
+def test_raw_json_response_picks_precompressed_variant():
+    """Test cached bodies are sent in an accepted precompressed encoding with their ETag."""
+    body = b'{"omrade": "Hela landet"}'
+    raw_body = RawBody(body, {"gzip": gzip.compress(body)}, etag='"abc"')
+    app = FastAPI()
+
+    @app.get("/body")
+    def get_body() -> RawJSONResponse:
+        return RawJSONResponse(raw_body)
+
+    with TestClient(app) as client:
+        gzipped = client.get("/body", headers={"Accept-Encoding": "gzip"})
+        identity = client.get("/body", headers={"Accept-Encoding": "identity"})
+
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.headers["Content-Length"] == str(len(raw_body.variants["gzip"]))
+    assert gzipped.content == body
+    assert "Content-Encoding" not in identity.headers
+    assert identity.content == body
+    for response in (gzipped, identity):
+        assert response.headers["ETag"] == '"abc"'
+        assert response.headers["Vary"] == "Accept-Encoding"
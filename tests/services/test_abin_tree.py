@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.api.constants import AbinEndpoints
+from backend.core.exceptions import APIError
+from backend.services.abin_tree import AbinTree, metadata_entries, walk_abin_tree
+from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
+
+TREE = {
+    AbinEndpoints.LANDSDEL_METADATA: [{"namn": "Norra Norrland", "kod": "1"}],
+    "/abin/v2/landsdel/1/lan/metadata": [{"namn": "Norrbotten", "kod": "25"}],
+    "/abin/v2/landsdel/1/lan/25/afo/metadata": [
+        {"namn": "Norra", "kod": "251"},
+        {"namn": "Södra", "kod": "252"},
+    ],
+    "/abin/v2/landsdel/1/lan/25/afo/251/stratum/metadata": [{"namn": "Kust", "kod": "1"}],
+    "/abin/v2/landsdel/1/lan/25/afo/252/stratum/metadata": [],
+}
+
+
+async def fake_get(endpoint: str):
+    """Serve the metadata tree, and each other endpoint's path as its summary."""
+    return TREE.get(endpoint, {"endpoint": endpoint})
+
+
+@pytest.mark.unit
+def test_metadata_entries():
+    """Test entries are read from metadata lists and junk is ignored."""
+    assert metadata_entries([{"kod": "01"}, {"kod": None}, "x"]) == [{"kod": "01"}]
+    assert metadata_entries({"kod": "01"}) == []
+
+
+@pytest.mark.unit
+async def test_walk_abin_tree_nests_levels():
+    """Test each level's entries are nested under their parent."""
+    tree = await walk_abin_tree(fake_get)
+
+    assert tree == [
+        {
+            "namn": "Norra Norrland",
+            "kod": "1",
+            "lan": [
+                {
+                    "namn": "Norrbotten",
+                    "kod": "25",
+                    "afo": [
+                        {"namn": "Norra", "kod": "251", "stratum": [{"namn": "Kust", "kod": "1"}]},
+                        {"namn": "Södra", "kod": "252", "stratum": []},
+                    ],
+                }
+            ],
+        }
+    ]
+
+
+@pytest.mark.unit
+async def test_walk_abin_tree_with_summaries():
+    """Test every area carries its own summary when summaries are requested."""
+    tree = await walk_abin_tree(fake_get, summaries=True)
+
+    landsdel = tree[0]
+    lan = landsdel["lan"][0]
+    afo = lan["afo"][0]
+    assert landsdel["summary"] == {"endpoint": "/abin/v2/landsdel/1"}
+    assert lan["summary"] == {"endpoint": "/abin/v2/lan/25"}
+    assert afo["summary"] == {"endpoint": "/abin/v2/lan/25/afo/251"}
+    assert afo["stratum"][0]["summary"] == {"endpoint": "/abin/v2/lan/25/afo/251/stratum/1"}
+
+
+@pytest.mark.unit
+async def test_abin_tree_bounds_concurrency(mock_api_client: SkogsstyrelsenClient):
+    """Test the build never has more than ``concurrency`` upstream calls in flight."""
+    in_flight = peak = 0
+
+    async def slow_get(endpoint: str):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await fake_get(endpoint)
+
+    mock_api_client.get = AsyncMock(side_effect=slow_get)
+
+    tree = json.loads(await AbinTree(mock_api_client, concurrency=2).build(summaries=True))
+
+    assert peak == 2
+    assert tree["helalandet"] == {"endpoint": AbinEndpoints.HELALANDET}
+    assert tree["landsdel"][0]["lan"][0]["kod"] == "25"
+
+
+@pytest.mark.unit
+async def test_abin_tree_is_cached(mock_api_client: SkogsstyrelsenClient):
+    """Test the assembled tree is served from the response cache per variant."""
+    mock_api_client.get = AsyncMock(side_effect=fake_get)
+    tree = AbinTree(mock_api_client)
+
+    first = await tree.get()
+    calls = mock_api_client.get.await_count
+    second = await tree.get()
+
+    assert second.content == first.content
+    assert second.etag == first.etag
+    assert mock_api_client.get.await_count == calls
+    assert tree.builds == 1
+
+    with_summaries = await tree.get(summaries=True)
+    assert "summary" in json.loads(with_summaries.content)["landsdel"][0]
+    assert tree.builds == 2
+
+
+@pytest.mark.unit
+async def test_abin_tree_failure_is_not_cached(mock_api_client: SkogsstyrelsenClient):
+    """Test an upstream error fails the build and the next request retries it."""
+
+    async def failing_get(endpoint: str):
+        if endpoint == "/abin/v2/landsdel/1/lan/25/afo/metadata":
+            raise APIError("Upstream timeout", status_code=504)
+        return await fake_get(endpoint)
+
+    mock_api_client.get = AsyncMock(side_effect=failing_get)
+    tree = AbinTree(mock_api_client)
+
+    with pytest.raises(APIError):
+        await tree.get()
+
+    mock_api_client.get.side_effect = fake_get
+    body = json.loads((await tree.get()).content)
+    assert len(body["landsdel"][0]["lan"][0]["afo"]) == 2
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -46,8 +47,8 @@ async def test_get_token_fetches_new_token(test_settings: Settings):
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+    with patch.object(auth, "_get_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(
             return_value=mock_response
         )
 
@@ -63,7 +64,7 @@ async def test_get_token_returns_cached_token(test_settings: Settings):
     """Test get_token returns cached token if still valid."""
     auth = SkogsstyrelsenAuth(test_settings)
     auth._access_token = "cached_token"
-    auth._token_expiry = datetime.now() + timedelta(minutes=30)
+    auth._token_expiry = time.monotonic() + 30 * 60
 
     # Should not make HTTP request
     token = await auth.get_token()
@@ -76,7 +77,7 @@ async def test_get_token_refreshes_expired_token(test_settings: Settings):
     """Test get_token refreshes token when expired."""
     auth = SkogsstyrelsenAuth(test_settings)
     auth._access_token = "old_token"
-    auth._token_expiry = datetime.now() - timedelta(minutes=1)  # Expired
+    auth._token_expiry = time.monotonic() - 60  # Expired
 
     mock_response = MagicMock()
     mock_response.json.return_value = {
@@ -85,8 +86,8 @@ async def test_get_token_refreshes_expired_token(test_settings: Settings):
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+    with patch.object(auth, "_get_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(
             return_value=mock_response
         )
 
@@ -104,8 +105,8 @@ async def test_get_token_handles_http_error(test_settings: Settings):
     mock_response.status_code = 401
     mock_response.text = "Invalid credentials"
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+    with patch.object(auth, "_get_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(
             side_effect=httpx.HTTPStatusError(
                 "Auth failed", request=MagicMock(), response=mock_response
             )
@@ -122,8 +123,8 @@ async def test_get_token_handles_network_error(test_settings: Settings):
     """Test get_token handles network errors properly."""
     auth = SkogsstyrelsenAuth(test_settings)
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+    with patch.object(auth, "_get_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(
             side_effect=httpx.RequestError("Network error")
         )
 
@@ -154,7 +155,7 @@ def test_is_token_valid_expired(test_settings: Settings):
     """Test _is_token_valid returns False when token is expired."""
     auth = SkogsstyrelsenAuth(test_settings)
     auth._access_token = "token"
-    auth._token_expiry = datetime.now() - timedelta(minutes=1)
+    auth._token_expiry = time.monotonic() - 60
 
     assert auth._is_token_valid() is False
 
@@ -164,7 +165,7 @@ def test_is_token_valid_near_expiry(test_settings: Settings):
     """Test _is_token_valid returns False when token expires within 5 minutes."""
     auth = SkogsstyrelsenAuth(test_settings)
     auth._access_token = "token"
-    auth._token_expiry = datetime.now() + timedelta(minutes=3)  # Within 5 min buffer
+    auth._token_expiry = time.monotonic() + 3 * 60  # Within 5 min buffer
 
     assert auth._is_token_valid() is False
 
@@ -174,6 +175,99 @@ def test_is_token_valid_success(test_settings: Settings):
     """Test _is_token_valid returns True when token is valid."""
     auth = SkogsstyrelsenAuth(test_settings)
     auth._access_token = "token"
-    auth._token_expiry = datetime.now() + timedelta(minutes=30)
+    auth._token_expiry = time.monotonic() + 30 * 60
 
     assert auth._is_token_valid() is True
+
+
+def mock_token_response(token: str, expires_in: int = 3600) -> MagicMock:
+    """Create a mock auth server response."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"access_token": token, "expires_in": expires_in}
+    mock_response.raise_for_status = MagicMock()
+    return mock_response
+
+
+@pytest.mark.unit
+async def test_concurrent_get_token_shares_single_refresh(test_settings: Settings):
+    """Test concurrent callers share one in-flight token fetch."""
+    auth = SkogsstyrelsenAuth(test_settings)
+
+    async def slow_post(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return mock_token_response("shared_token")
+
+    with patch.object(auth, "_get_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(side_effect=slow_post)
+
+        tokens = await asyncio.gather(*(auth.get_token() for _ in range(20)))
+
+    assert tokens == ["shared_token"] * 20
+    mock_client.return_value.post.assert_called_once()
+    assert auth._refresh_task is None
+
+
+@pytest.mark.unit
+async def test_concurrent_get_token_shares_failure(test_settings: Settings):
+    """Test concurrent callers all see the error from the shared fetch."""
+    auth = SkogsstyrelsenAuth(test_settings)
+
+    with patch.object(auth, "_get_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(
+            side_effect=httpx.RequestError("Network error")
+        )
+
+        results = await asyncio.gather(
+            *(auth.get_token() for _ in range(5)), return_exceptions=True
+        )
+
+    assert all(isinstance(result, AuthenticationError) for result in results)
+    mock_client.return_value.post.assert_called_once()
+
+
+@pytest.mark.unit
+async def test_background_renewal_refreshes_before_buffer(test_settings: Settings):
+    """Test background renewal replaces the token before requests see it expire."""
+    auth = SkogsstyrelsenAuth(test_settings)
+    auth._access_token = "old_token"
+    # Inside the renewal lead but still valid for get_token
+    auth._token_expiry = (
+        time.monotonic() + test_settings.token_refresh_buffer_minutes * 60 + 1
+    )
+
+    with patch.object(auth, "_get_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(
+            return_value=mock_token_response("renewed_token")
+        )
+
+        auth.start()
+        await asyncio.sleep(0.01)
+        await auth.close()
+
+    assert auth._access_token == "renewed_token"
+    assert auth._is_token_valid() is True
+
+
+@pytest.mark.unit
+def test_seconds_until_renewal(test_settings: Settings):
+    """Test renewal is scheduled ahead of the refresh buffer."""
+    auth = SkogsstyrelsenAuth(test_settings)
+    assert auth._seconds_until_renewal() == 0.0
+
+    auth._access_token = "token"
+    auth._token_expiry = time.monotonic() + 3600
+    lead = test_settings.token_refresh_buffer_minutes * 60 + test_settings.token_renewal_lead_seconds
+
+    assert 3600 - lead - 1 < auth._seconds_until_renewal() <= 3600 - lead
+
+
+@pytest.mark.unit
+async def test_auth_reuses_pooled_client(test_settings: Settings):
+    """Test auth keeps one HTTP client between token fetches."""
+    auth = SkogsstyrelsenAuth(test_settings)
+
+    http_client = await auth._get_client()
+    assert await auth._get_client() is http_client
+
+    await auth.close()
+    assert http_client.is_closed
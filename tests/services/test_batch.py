@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.api.constants import GrundataEndpoints
+from backend.core.exceptions import APIError
+from backend.services.batch import BatchRunner, ItemTooLarge, bounded_as_completed, ndjson_lines
+from backend.services.skogsstyrelsen_client import RawBody
+
+POLYGON = "POLYGON ((0 0, 1 0, 1 1, 0 0))"
+
+
+async def chunked(*chunks: bytes):
+    """Async byte stream made of the given chunks."""
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(iterator) -> list:
+    """Drain an async iterator into a list."""
+    return [item async for item in iterator]
+
+
+@pytest.mark.unit
+async def test_ndjson_lines_split_across_chunks():
+    """Test lines are reassembled across chunk boundaries and blank lines skipped."""
+    lines = await collect(ndjson_lines(chunked(b'{"a":', b'1}\n\n{"b"', b":2}"), 100))
+
+    assert lines == [b'{"a":1}', b'{"b":2}']
+
+
+@pytest.mark.unit
+async def test_ndjson_lines_reports_oversized_lines():
+    """Test oversized lines are skipped but keep their place in the batch."""
+    lines = await collect(ndjson_lines(chunked(b"x" * 7, b"xx\n{}\n", b"y" * 9), 8))
+
+    assert isinstance(lines[0], ItemTooLarge)
+    assert lines[1] == b"{}"
+    assert isinstance(lines[2], ItemTooLarge)
+    # The limit itself is allowed
+    assert await collect(ndjson_lines(chunked(b"z" * 8 + b"\n"), 8)) == [b"z" * 8]
+
+
+@pytest.mark.unit
+async def test_bounded_as_completed_limits_concurrency_and_yields_when_done():
+    """Test no more than the limit run at once and fast items come out first."""
+    running = 0
+    peak = 0
+
+    async def worker(delay: float) -> float:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delay)
+        running -= 1
+        return delay
+
+    results = await collect(bounded_as_completed(chunked(0.05, 0.01, 0.02, 0.0), worker, 2))
+
+    assert peak == 2
+    assert sorted(results) == [0.0, 0.01, 0.02, 0.05]
+    assert results[0] == 0.01
+
+
+@pytest.mark.unit
+async def test_batch_runner_reports_each_item(mock_api_client):
+    """Test each area gets a line with its own status and errors."""
+
+    async def post_raw(endpoint: str, json_data: dict) -> RawBody:
+        if json_data["geometri"] == "broken":
+            raise APIError("Invalid geometry", status_code=400)
+        if endpoint == GrundataEndpoints.GRUNDYTA:
+            raise APIError("Upstream timeout", status_code=504)
+        return RawBody(b'{"medel": 1.0}')
+
+    mock_api_client.post_raw = AsyncMock(side_effect=post_raw)
+    runner = BatchRunner(mock_api_client, ["volym", "grundyta"], concurrency=2)
+    items = [
+        {"id": "a", "geometri": POLYGON},
+        {"id": "b", "geometri": POLYGON, "metrics": ["volym"]},
+        {"id": "c", "geometri": "broken"},
+        {"id": "d"},
+    ]
+
+    lines = [json.loads(line) for line in await collect(runner.run(items))]
+    by_index = {line["index"]: line for line in lines}
+
+    assert len(lines) == 4
+    assert by_index[0]["status"] == "partial"
+    assert by_index[0]["failed"] == ["grundyta"]
+    assert by_index[1]["status"] == "ok"
+    assert by_index[1]["metrics"]["volym"]["data"] == {"medel": 1.0}
+    assert by_index[2]["status"] == "error"
+    assert by_index[2]["error"]["status_code"] == 400
+    assert by_index[3]["id"] == "d"
+    assert by_index[3]["error"]["type"] == "validation_error"
+    assert mock_api_client.post_raw.await_count == 5
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.core.exceptions import BulkheadFullError
+from backend.services.bulkhead import Bulkhead, http_pool_stats
+from backend.services.limiter import AdaptiveLimiter
+
+
+@pytest.mark.unit
+async def test_bulkhead_queues_then_rejects():
+    """Test calls over the cap queue up to the limit and are rejected beyond it."""
+    bulkhead = Bulkhead("grunddata", max_concurrent=1, max_queue=1, queue_timeout=5.0)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with bulkhead.acquire():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    assert bulkhead.stats()["active"] == 1
+    assert bulkhead.stats()["queued"] == 1
+
+    with pytest.raises(BulkheadFullError):
+        async with bulkhead.acquire():
+            pass
+
+    release.set()
+    await asyncio.gather(holder, waiter)
+    stats = bulkhead.stats()
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+    assert stats["peak_queued"] == 1
+    assert stats["rejected"] == 1
+
+
+@pytest.mark.unit
+async def test_bulkhead_queue_wait_times_out():
+    """Test queued calls give up after the queue timeout."""
+    bulkhead = Bulkhead("abin", max_concurrent=1, max_queue=5, queue_timeout=0.01)
+
+    async with bulkhead.acquire():
+        with pytest.raises(BulkheadFullError) as exc_info:
+            async with bulkhead.acquire():
+                pass
+
+    assert exc_info.value.status_code == 503
+    assert bulkhead.stats()["timeouts"] == 1
+    assert bulkhead.stats()["queued"] == 0
+
+
+@pytest.mark.unit
+def test_http_pool_stats_without_client():
+    """Test pool stats report a closed pool when no client exists."""
+    stats = http_pool_stats(None)
+
+    assert stats["open"] is False
+    assert stats["connections"] == 0
+
+
+@pytest.mark.unit
+async def test_bulkhead_follows_adaptive_limit():
+    """Test calls queue at the adaptive limit and proceed once it grows."""
+    limiter = AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=4)
+    bulkhead = Bulkhead("raster", 4, max_queue=10, queue_timeout=5.0, limiter=limiter)
+    release = asyncio.Event()
+    entered = []
+
+    async def hold(name: str) -> None:
+        async with bulkhead.acquire():
+            entered.append(name)
+            await release.wait()
+
+    first = asyncio.create_task(hold("first"))
+    second = asyncio.create_task(hold("second"))
+    await asyncio.sleep(0)
+    assert entered == ["first"]
+    assert bulkhead.stats()["queued"] == 1
+
+    # A fast success under demand raises the limit and admits the waiter
+    bulkhead.on_success(0.01)
+    await asyncio.sleep(0.01)
+    assert entered == ["first", "second"]
+    assert bulkhead.stats()["limit"] == 2
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert bulkhead.stats()["active"] == 0
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from backend.api.constants import AbinEndpoints
+from backend.core.config import Settings
+from backend.services.cache import (
+    DEFAULT_REGION,
+    GEOMETRY_REGION,
+    CacheEntry,
+    CacheRule,
+    LRUByteCache,
+    ResponseCache,
+    create_response_cache,
+)
+from backend.services.disk_cache import DiskCache
+from backend.services.encoding import decode_body
+from backend.services.keys import make_etag
+
+
+def make_entry(content: bytes, ttl: float = 60.0, endpoint: str = "/x") -> CacheEntry:
+    """Create a cache entry expiring after ttl seconds."""
+    return CacheEntry(endpoint=endpoint, content=content, expires_at=time.monotonic() + ttl)
+
+
+@pytest.mark.unit
+def test_lru_evicts_least_recently_used_by_size():
+    """Test LRU evicts old entries once the byte budget is exceeded."""
+    cache = LRUByteCache(max_bytes=10)
+    cache.set("a", make_entry(b"aaaa"))
+    cache.set("b", make_entry(b"bbbb"))
+    cache.get("a")  # a becomes most recently used
+
+    cache.set("c", make_entry(b"cccc"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.unit
+def test_lru_rejects_entries_larger_than_budget():
+    """Test an entry bigger than the whole budget is not stored."""
+    cache = LRUByteCache(max_bytes=4)
+    cache.set("a", make_entry(b"aaaa"))
+
+    assert cache.set("b", make_entry(b"bbbbb")) is False
+    assert cache.get("a") is not None
+
+
+@pytest.mark.unit
+def test_lru_drops_expired_entries():
+    """Test expired entries are treated as misses."""
+    cache = LRUByteCache(max_bytes=100)
+    cache.set("a", make_entry(b"a", ttl=-1))
+
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.unit
+def test_lru_serves_stale_entries_within_bound():
+    """Test expired entries are returned until their stale bound passes."""
+    cache = LRUByteCache(max_bytes=100)
+    now = time.monotonic()
+    cache.set("stale", CacheEntry("/x", b"a", expires_at=now - 1, stale_until=now + 60))
+    cache.set("gone", CacheEntry("/x", b"b", expires_at=now - 2, stale_until=now - 1))
+
+    entry = cache.get("stale")
+    assert entry is not None and not entry.is_fresh()
+    assert cache.get("gone") is None
+    assert cache.stats()["stale_hits"] == 1
+
+
+@pytest.mark.unit
+def test_lru_invalidate_by_prefix():
+    """Test invalidation removes only matching endpoints."""
+    cache = LRUByteCache(max_bytes=100)
+    cache.set("a", make_entry(b"a", endpoint="/abin/v2/lan/01"))
+    cache.set("b", make_entry(b"b", endpoint="/abin/v2/landsdel/1"))
+
+    assert cache.invalidate("/abin/v2/lan/") == 1
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.invalidate() == 1
+
+
+@pytest.mark.unit
+def test_rule_matches_endpoint_template():
+    """Test rules match formatted endpoints only."""
+    rule = CacheRule.for_endpoint("GET", AbinEndpoints.LAN, 60)
+
+    assert rule.matches("GET", "/abin/v2/lan/01")
+    assert not rule.matches("POST", "/abin/v2/lan/01")
+    assert not rule.matches("GET", "/abin/v2/lan/01/geometri")
+
+
+@pytest.mark.unit
+def test_response_cache_rules(test_settings: Settings):
+    """Test per-endpoint TTLs and the separate geometry region."""
+    cache = ResponseCache(test_settings)
+
+    metadata = cache.rule_for("GET", "/abin/v2/landsdel/metadata")
+    assert metadata.ttl == test_settings.cache_abin_metadata_ttl_seconds
+    assert metadata.region == DEFAULT_REGION
+
+    summary = cache.rule_for("GET", "/abin/v2/lan/01/afo/5")
+    assert summary.ttl == test_settings.cache_abin_ttl_seconds
+
+    geometry = cache.rule_for("GET", "/abin/v2/lan/01/afo/5/geometri")
+    assert geometry.region == GEOMETRY_REGION
+
+    statistics = cache.rule_for("POST", "/skogligagrunddata/v1/Volym/Histogram")
+    assert statistics.canonical_geometry is True
+
+    assert metadata.max_stale == test_settings.cache_max_stale_seconds
+    assert cache.rule_for("GET", "/skogligagrunddata/v1/VolymFramskriven/GiltigaDatum") is not None
+    assert cache.rule_for("GET", "/raster/v1/api-info") is not None
+    assert cache.rule_for("POST", "/skogligagrunddata/v1/VolymFramskriven") is None
+    assert cache.rule_for("POST", "/raster/v1/scl/histogramdatesummary") is None
+
+
+@pytest.mark.unit
+async def test_response_cache_set_and_get(test_settings: Settings):
+    """Test cached bodies are decoded on read."""
+    cache = ResponseCache(test_settings)
+    rule = cache.rule_for("GET", "/abin/v2/helalandet")
+
+    await cache.set(rule, "key", "/abin/v2/helalandet", b'{"omrade": "Hela landet"}')
+
+    entry = await cache.get(rule, "key", "/abin/v2/helalandet")
+    assert entry.json() == {"omrade": "Hela landet"}
+    assert await cache.invalidate("/abin/") == 1
+    assert await cache.get(rule, "key", "/abin/v2/helalandet") is None
+
+
+@pytest.mark.unit
+async def test_response_cache_precompresses_entries(test_settings: Settings):
+    """Test stored entries carry ready-to-send encoded variants and an ETag."""
+    cache = ResponseCache(test_settings)
+    endpoint = "/abin/v2/lan/01/geometri"
+    rule = cache.rule_for("GET", endpoint)
+    body = json.dumps({"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))" * 100}).encode()
+
+    entry = await cache.set(rule, "key", endpoint, body)
+
+    assert entry.variants.keys() >= {"gzip", "zstd"}
+    assert decode_body(entry.variants["gzip"], "gzip") == body
+    assert entry.etag == make_etag(body)
+    assert entry.size == len(body) + sum(len(v) for v in entry.variants.values())
+
+    small = await cache.set(rule, "small", endpoint, b"{}")
+    assert small.variants == {}
+
+
+@pytest.mark.unit
+async def test_response_cache_survives_restart_via_disk(test_settings: Settings, tmp_path: Path):
+    """Test a new cache instance is warm from the disk tier."""
+    endpoint = "/abin/v2/lan/01/geometri"
+    first = ResponseCache(test_settings, disk=DiskCache(tmp_path / "cache.sqlite3", 10**6))
+    await first.start()
+    rule = first.rule_for("GET", endpoint)
+    await first.set(rule, "key", endpoint, b'{"geometri": "MULTIPOLYGON (...)"}')
+    await first.close()
+
+    second = ResponseCache(test_settings, disk=DiskCache(tmp_path / "cache.sqlite3", 10**6))
+    await second.start()
+    try:
+        entry = await second.get(rule, "key", endpoint)
+        assert entry.json() == {"geometri": "MULTIPOLYGON (...)"}
+        assert second.regions[GEOMETRY_REGION].stats()["entries"] == 1
+    finally:
+        await second.close()
+
+
+@pytest.mark.unit
+def test_create_response_cache(test_settings: Settings, tmp_path: Path):
+    """Test the disk tier is only used when a path is configured."""
+    assert create_response_cache(test_settings).disk is None
+
+    test_settings.disk_cache_path = str(tmp_path / "cache.sqlite3")
+    assert isinstance(create_response_cache(test_settings).disk, DiskCache)
+
+    test_settings.cache_enabled = False
+    assert create_response_cache(test_settings) is None
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def make_breaker(**overrides) -> CircuitBreaker:
+    """Create a breaker that trips quickly."""
+    options = {"minimum_calls": 4, "failure_ratio": 0.5, "open_seconds": 30.0}
+    options.update(overrides)
+    return CircuitBreaker("grunddata", **options)
+
+
+@pytest.mark.unit
+def test_breaker_opens_when_failure_ratio_is_crossed():
+    """Test the breaker trips only after the minimum number of calls."""
+    breaker = make_breaker()
+
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_success(0.1)
+    assert breaker.state == OPEN
+    assert breaker.allow() is False
+    assert breaker.stats()["rejected"] == 1
+    assert breaker.retry_after() > 0
+
+
+@pytest.mark.unit
+def test_breaker_opens_on_slow_calls():
+    """Test latency alone can trip the breaker."""
+    breaker = make_breaker(slow_call_seconds=1.0, slow_call_ratio=0.75)
+
+    for _ in range(4):
+        breaker.record_success(2.0)
+
+    assert breaker.state == OPEN
+
+
+@pytest.mark.unit
+def test_breaker_half_open_probe_closes_or_reopens():
+    """Test one probe is let through after the open period."""
+    breaker = make_breaker(open_seconds=10.0)
+    for _ in range(4):
+        breaker.record_failure()
+    assert breaker.state == OPEN
+
+    later = time.monotonic() + 11
+    with patch("backend.services.circuit_breaker.time.monotonic", return_value=later):
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow() is True
+        assert breaker.allow() is False  # only one probe at a time
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+    with patch("backend.services.circuit_breaker.time.monotonic", return_value=later + 11):
+        assert breaker.allow() is True
+        breaker.record_success(0.1)
+        assert breaker.state == CLOSED
+        assert breaker.stats()["times_opened"] == 2
+
+
+@pytest.mark.unit
+def test_breaker_release_returns_probe_slot():
+    """Test a cancelled probe does not leave the breaker stuck half-open."""
+    breaker = make_breaker(open_seconds=0.0)
+    for _ in range(4):
+        breaker.record_failure()
+
+    assert breaker.allow() is True
+    breaker.release()
+    assert breaker.allow() is True
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
 from backend.core.config import Settings
-from backend.core.exceptions import APIError
+from backend.core.exceptions import APIError, BulkheadFullError, CircuitOpenError
 from backend.services.auth import SkogsstyrelsenAuth
 from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
 
@@ -194,3 +198,615 @@ async def test_client_passes_json_correctly(
 
         call_kwargs = mock_request.call_args[1]
         assert call_kwargs["json"] == {"test": "data"}
+
+
+@pytest.mark.unit
+async def test_client_pool_stats_before_start(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test pool stats report a closed pool before the client starts."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    stats = client.pool_stats("abin")
+
+    assert stats["open"] is False
+    assert stats["bulkhead"]["max_concurrent"] == test_settings.abin_max_connections
+    assert stats["bulkhead"]["queued"] == 0
+
+
+@pytest.mark.unit
+async def test_client_start_and_close_reuse_pool(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test client keeps one pool open between start and close."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    await client.start()
+    http_client = await client._get_client("abin")
+    assert await client._get_client("abin") is http_client
+    assert await client._get_client("grunddata") is not http_client
+    assert client.pool_stats("abin")["open"] is True
+
+    await client.close()
+    assert http_client.is_closed
+    assert client.pool_stats("abin")["open"] is False
+
+
+@pytest.mark.unit
+async def test_client_coalesces_identical_requests(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test identical concurrent requests share one upstream call."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"data": "test"}
+    mock_response.raise_for_status = MagicMock()
+
+    async def slow_request(**kwargs):
+        await asyncio.sleep(0.01)
+        return mock_response
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(side_effect=slow_request)
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        results = await asyncio.gather(
+            client.post("/test/endpoint", {"a": 1, "b": 2}),
+            client.post("/test/endpoint", {"b": 2, "a": 1}),
+            client.post("/test/other", {"a": 1, "b": 2}),
+        )
+
+    assert results == [{"data": "test"}] * 3
+    assert mock_http_client.request.call_count == 2
+    assert client.stats()["coalescing"]["coalesced"] == 1
+
+
+@pytest.mark.unit
+async def test_client_caches_abin_responses(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test cacheable endpoints are fetched upstream once."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    mock_response = MagicMock()
+    mock_response.content = b'[{"landsdelkod": "1"}]'
+    mock_response.json.return_value = [{"landsdelkod": "1"}]
+    mock_response.raise_for_status = MagicMock()
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(return_value=mock_response)
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        first = await client.get("/abin/v2/landsdel/metadata")
+        second = await client.get("/abin/v2/landsdel/metadata")
+
+        assert first == second == [{"landsdelkod": "1"}]
+        mock_http_client.request.assert_called_once()
+
+        assert await client.invalidate_cache("/abin/") == 1
+        await client.get("/abin/v2/landsdel/metadata")
+
+    assert mock_http_client.request.call_count == 2
+
+
+@pytest.mark.unit
+async def test_client_get_raw_returns_body_without_decoding(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test raw reads return upstream bytes, from the cache on repeat calls."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    mock_response = MagicMock()
+    mock_response.content = b'[{"landsdelkod": "1"}]'
+    mock_response.raise_for_status = MagicMock()
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(return_value=mock_response)
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        first = await client.get_raw("/abin/v2/landsdel/metadata")
+        second = await client.get_raw("/abin/v2/landsdel/metadata")
+
+    assert first.content == second.content == b'[{"landsdelkod": "1"}]'
+    assert first.etag == second.etag
+    mock_http_client.request.assert_called_once()
+    mock_response.json.assert_not_called()
+
+
+@pytest.mark.unit
+async def test_client_refresh_bypasses_cache(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test refresh always goes upstream and replaces the cached copy."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    mock_response = MagicMock()
+    mock_response.content = b'{"apiVersion": "2.0"}'
+    mock_response.raise_for_status = MagicMock()
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(return_value=mock_response)
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        await client.get("/abin/v2/api-info")
+        assert await client.refresh("/abin/v2/api-info") == {"apiVersion": "2.0"}
+
+    assert mock_http_client.request.call_count == 2
+
+
+@pytest.mark.unit
+async def test_client_caches_statistics_by_canonical_geometry(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test equivalent polygons share one cached statistics response."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    mock_response = MagicMock()
+    mock_response.content = b'{"data": {}}'
+    mock_response.json.return_value = {"data": {}}
+    mock_response.raise_for_status = MagicMock()
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(return_value=mock_response)
+
+    polygon = "POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0))"
+    rotated = "POLYGON((10 10,0 10,0 0,10 0,10 10))"
+    endpoint = "/skogligagrunddata/v1/Volym"
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        await client.post(endpoint, {"geometri": polygon, "omdrev": 2})
+        await client.post(endpoint, {"omdrev": 2, "geometri": rotated})
+        mock_http_client.request.assert_called_once()
+
+        await client.post(endpoint, {"geometri": polygon, "omdrev": 3})
+
+    assert mock_http_client.request.call_count == 2
+
+
+@pytest.mark.unit
+async def test_client_serves_stale_entry_and_refreshes_once(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test expired entries are served immediately while one refresh runs."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    endpoint = "/skogligagrunddata/v1/VolymFramskriven/GiltigaDatum"
+    rule = client.cache.rule_for("GET", endpoint)
+    key = client.cache.key_for(rule, "GET", endpoint)
+    await client.cache.set(rule, key, endpoint, b'["2024-01-01"]')
+    entry = client.cache.regions[rule.region]._entries[key]
+    entry.expires_at = time.monotonic() - 1
+
+    mock_response = MagicMock()
+    mock_response.content = b'["2025-01-01"]'
+    mock_response.json.return_value = ["2025-01-01"]
+    mock_response.raise_for_status = MagicMock()
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(return_value=mock_response)
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        stale = await asyncio.gather(client.get(endpoint), client.get(endpoint))
+        assert stale == [["2024-01-01"], ["2024-01-01"]]
+
+        await asyncio.gather(*client._revalidating.values())
+        assert await client.get(endpoint) == ["2025-01-01"]
+
+    mock_http_client.request.assert_called_once()
+
+
+def status_error(status_code: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    """Create an HTTP status error for a mock upstream response."""
+    mock_response = MagicMock()
+    mock_response.status_code = status_code
+    mock_response.text = "Upstream error"
+    mock_response.headers = headers or {}
+    return httpx.HTTPStatusError("Error", request=MagicMock(), response=mock_response)
+
+
+@pytest.mark.unit
+async def test_client_retries_transient_errors(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test idempotent requests are retried after 5xx and network errors."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    mock_response = MagicMock()
+    mock_response.content = b'{"data": "test"}'
+    mock_response.raise_for_status = MagicMock()
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(
+        side_effect=[status_error(503), httpx.ConnectError("reset"), mock_response]
+    )
+
+    with patch.object(client, "_get_client", return_value=mock_http_client), patch(
+        "backend.services.skogsstyrelsen_client.asyncio.sleep", new=AsyncMock()
+    ) as mock_sleep:
+        result = await client.post("/skogligagrunddata/v1/Volym", {"geometri": "x"})
+
+    assert result == {"data": "test"}
+    assert mock_http_client.request.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert client.stats()["retries"]["retries"] == 2
+
+
+@pytest.mark.unit
+async def test_client_honors_retry_after(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test Retry-After sets the delay before the next attempt."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {}
+    mock_response.raise_for_status = MagicMock()
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(
+        side_effect=[status_error(429, {"Retry-After": "2"}), mock_response]
+    )
+
+    with patch.object(client, "_get_client", return_value=mock_http_client), patch(
+        "backend.services.skogsstyrelsen_client.asyncio.sleep", new=AsyncMock()
+    ) as mock_sleep:
+        await client.get("/test/endpoint")
+
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@pytest.mark.unit
+async def test_client_does_not_retry_client_errors_or_unsafe_posts(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test 4xx responses and POSTs outside the read-only families fail at once."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(side_effect=status_error(404))
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        with pytest.raises(APIError):
+            await client.get("/test/endpoint")
+        assert mock_http_client.request.call_count == 1
+
+        mock_http_client.request = AsyncMock(side_effect=status_error(503))
+        with pytest.raises(APIError) as exc_info:
+            await client.post("/test/endpoint", {"key": "value"})
+        assert exc_info.value.status_code == 503
+        assert mock_http_client.request.call_count == 1
+
+
+@pytest.mark.unit
+async def test_client_stops_retrying_after_max_attempts(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test persistent failures give up after the configured attempts."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(side_effect=status_error(502))
+
+    with patch.object(client, "_get_client", return_value=mock_http_client), patch(
+        "backend.services.skogsstyrelsen_client.asyncio.sleep", new=AsyncMock()
+    ):
+        with pytest.raises(APIError) as exc_info:
+            await client.get("/test/endpoint")
+
+    assert exc_info.value.status_code == 502
+    assert mock_http_client.request.call_count == test_settings.retry_max_attempts
+
+
+@pytest.mark.unit
+async def test_client_circuit_breaker_fails_fast(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test an open breaker rejects calls without contacting the upstream."""
+    settings = test_settings.model_copy(
+        update={"circuit_breaker_minimum_calls": 2, "retry_max_attempts": 1}
+    )
+    client = SkogsstyrelsenClient(mock_auth, settings)
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(side_effect=status_error(503))
+    body = {"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"}
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        for _ in range(2):
+            with pytest.raises(APIError):
+                await client.post("/skogligagrunddata/v1/Volym", body)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await client.post("/skogligagrunddata/v1/Volym", body)
+
+    assert exc_info.value.status_code == 503
+    assert mock_http_client.request.call_count == 2
+    assert client.stats()["circuit_breakers"]["grunddata"]["state"] == "open"
+    # Other families are unaffected
+    assert client.stats()["circuit_breakers"]["abin"]["state"] == "closed"
+
+
+@pytest.mark.unit
+async def test_client_serves_expired_cache_while_circuit_open(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test cached data is served past its stale bound while the breaker is open."""
+    settings = test_settings.model_copy(update={"cache_stale_while_revalidate": False})
+    client = SkogsstyrelsenClient(mock_auth, settings)
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"lan": []}
+    mock_response.content = b'{"lan": []}'
+    mock_response.raise_for_status = MagicMock()
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(return_value=mock_response)
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        await client.get("/abin/v2/lan/metadata")
+
+    rule = client.cache.rule_for("GET", "/abin/v2/lan/metadata")
+    key = client.cache.key_for(rule, "GET", "/abin/v2/lan/metadata")
+    entry = client.cache.regions[rule.region]._entries[key]
+    entry.expires_at = entry.stale_until = time.monotonic() - 1
+    for _ in range(settings.circuit_breaker_minimum_calls):
+        client.circuit_breakers["abin"].record_failure()
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        result = await client.get("/abin/v2/lan/metadata")
+
+    assert result == {"lan": []}
+    assert mock_http_client.request.call_count == 1
+
+
+@pytest.mark.unit
+async def test_client_bulkheads_isolate_api_families(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test a saturated grunddata pool does not block ABIN requests."""
+    settings = test_settings.model_copy(
+        update={"grunddata_max_connections": 1, "grunddata_max_queue": 0}
+    )
+    client = SkogsstyrelsenClient(mock_auth, settings)
+    release = asyncio.Event()
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"data": "test"}
+    mock_response.content = b'{"data": "test"}'
+    mock_response.raise_for_status = MagicMock()
+
+    async def mock_request(**kwargs):
+        if "skogligagrunddata" in kwargs["url"]:
+            await release.wait()
+        return mock_response
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = mock_request
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        slow = asyncio.create_task(
+            client.post(
+                "/skogligagrunddata/v1/Volym", {"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"}
+            )
+        )
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(BulkheadFullError):
+            await client.post(
+                "/skogligagrunddata/v1/Biomassa", {"geometri": "POLYGON ((0 0, 2 0, 2 2, 0 0))"}
+            )
+        assert await client.get("/abin/v2/helalandet") == {"data": "test"}
+
+        release.set()
+        await slow
+
+    assert client.pool_stats("grunddata")["bulkhead"]["rejected"] == 1
+
+
+@pytest.mark.unit
+async def test_client_hedges_slow_reads(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test a read slower than its p95 is hedged and the faster answer wins."""
+    settings = test_settings.model_copy(
+        update={
+            "hedging_enabled": True,
+            "hedge_min_samples": 1,
+            "hedge_min_delay_seconds": 0.0,
+            "hedge_budget_ratio": 1.0,
+            "cache_enabled": False,
+        }
+    )
+    client = SkogsstyrelsenClient(mock_auth, settings)
+    client._latencies.record("GET /abin/v2/helalandet/geometri", 0.01)
+
+    slow_response = MagicMock()
+    slow_response.json.return_value = {"from": "slow"}
+    fast_response = MagicMock()
+    fast_response.json.return_value = {"from": "hedge"}
+    cancelled = asyncio.Event()
+    calls = 0
+
+    async def mock_request(**kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return slow_response
+        return fast_response
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = mock_request
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        result = await client.get("/abin/v2/helalandet/geometri")
+
+    assert result == {"from": "hedge"}
+    assert cancelled.is_set()
+    assert client.stats()["hedging"]["hedges"] == 1
+    assert client.stats()["hedging"]["hedge_wins"] == 1
+    assert client.pool_stats("abin")["bulkhead"]["active"] == 0
+
+
+@pytest.mark.unit
+async def test_client_does_not_hedge_unsafe_requests(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test POSTs outside the read-only families are never duplicated."""
+    settings = test_settings.model_copy(
+        update={"hedging_enabled": True, "hedge_min_samples": 1, "hedge_budget_ratio": 1.0}
+    )
+    client = SkogsstyrelsenClient(mock_auth, settings)
+    client._latencies.record("POST /test/endpoint", 0.001)
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {}
+
+    async def mock_request(**kwargs):
+        await asyncio.sleep(0.05)
+        return mock_response
+
+    mock_http_client = MagicMock()
+    mock_http_client.request = AsyncMock(side_effect=mock_request)
+
+    with patch.object(client, "_get_client", return_value=mock_http_client):
+        await client.post("/test/endpoint", {"key": "value"})
+
+    assert mock_http_client.request.call_count == 1
+    assert client.stats()["hedging"]["hedges"] == 0
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    """Upstream body delivered in several network reads."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@pytest.mark.unit
+async def test_client_stream_relays_raw_body_and_caches_it(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test streamed bodies keep their encoding and are cached decoded."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    body = json.dumps({"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"}).encode()
+    compressed = gzip.compress(body)
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        return httpx.Response(
+            200,
+            stream=ChunkedStream([compressed[:10], compressed[10:]]),
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+        )
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(client, "_get_client", return_value=http_client):
+        raw = await client.stream("/abin/v2/lan/01/geometri", accept_encoding="gzip, br")
+        relayed = b"".join([chunk async for chunk in raw.chunks])
+
+        assert relayed == compressed
+        assert raw.content_encoding == "gzip"
+        assert seen_headers[0]["Accept-Encoding"] == "gzip"
+        assert seen_headers[0]["Authorization"] == "Bearer mock_access_token"
+
+        cached = await client.stream("/abin/v2/lan/01/geometri")
+        assert b"".join([chunk async for chunk in cached.chunks]) == body
+        assert cached.content_encoding is None
+        assert cached.etag is not None
+
+    assert len(seen_headers) == 1
+    await http_client.aclose()
+
+
+@pytest.mark.unit
+async def test_client_stream_holds_stream_slot_until_relayed(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test a relay counts against the stream allowance, not the bulkhead, until closed."""
+    settings = test_settings.model_copy(update={"stream_max_relays": 1, "abin_max_queue": 0})
+    client = SkogsstyrelsenClient(mock_auth, settings)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=ChunkedStream([b'{"a":', b"1}"]))
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(client, "_get_client", return_value=http_client):
+        raw = await client.stream("/abin/v2/lan/01/geometri")
+        assert client.bulkheads["abin"].active == 0
+        assert client.pool_stats("abin")["streams"]["active"] == 1
+
+        with pytest.raises(BulkheadFullError):
+            await client.stream("/abin/v2/lan/02/geometri")
+
+        assert b"".join([chunk async for chunk in raw.chunks]) == b'{"a":1}'
+        await raw.close()
+        assert client.stream_bulkheads["abin"].active == 0
+
+        # The freed slot admits the next relay
+        again = await client.stream("/abin/v2/lan/03/geometri")
+        await again.close()
+        assert client.stream_bulkheads["abin"].active == 0
+    await http_client.aclose()
+
+
+@pytest.mark.unit
+async def test_client_pools_have_room_for_streams(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test each pool's connection limit covers its bulkhead and its relays."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    http_client = await client._get_client("abin")
+
+    pool = http_client._transport._pool
+    expected = test_settings.abin_max_connections + test_settings.stream_max_relays
+    assert pool._max_connections == expected
+    await client.close()
+
+
+@pytest.mark.unit
+async def test_client_stream_serves_precompressed_cache_variant(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test cache hits are relayed in a precompressed encoding the caller accepts."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    endpoint = "/abin/v2/lan/01/geometri"
+    body = json.dumps({"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))" * 100}).encode()
+    rule, key = client._cache_key("GET", endpoint)
+    entry = await client.cache.set(rule, key, endpoint, body)
+
+    raw = await client.stream(endpoint, accept_encoding="gzip")
+
+    assert raw.content_encoding == "gzip"
+    assert raw.etag == entry.etag
+    assert gzip.decompress(b"".join([chunk async for chunk in raw.chunks])) == body
+
+
+@pytest.mark.unit
+async def test_client_stream_raises_mapped_errors(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test upstream errors surface before any bytes are relayed."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, text="Not found")
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(client, "_get_client", return_value=http_client):
+        with pytest.raises(APIError) as exc_info:
+            await client.stream("/abin/v2/lan/99/geometri")
+
+    assert exc_info.value.status_code == 404
+    assert "Not found" in exc_info.value.message
+    await http_client.aclose()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from backend.services.disk_cache import DiskCache
+
+
+@pytest.fixture
+async def disk_cache(tmp_path: Path):
+    """Create an open disk cache in a temporary directory."""
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=10**6)
+    await cache.start()
+    yield cache
+    await cache.close()
+
+
+@pytest.mark.unit
+async def test_disk_cache_round_trip(disk_cache: DiskCache):
+    """Test bodies are compressed on write and restored on read."""
+    body = b'{"geometri": "' + b"1 2, " * 1000 + b'"}'
+    expires_at = time.time() + 60
+
+    await disk_cache.set("key", "/abin/v2/helalandet/geometri", body, expires_at)
+
+    content, stored_expiry, stale_until = await disk_cache.get("key")
+    assert content == body
+    assert stored_expiry == stale_until == expires_at
+    assert disk_cache.stats()["hits"] == 1
+
+
+@pytest.mark.unit
+async def test_disk_cache_ignores_expired_entries(disk_cache: DiskCache):
+    """Test expired rows are misses and removed by compaction."""
+    await disk_cache.set("old", "/abin/v2/helalandet", b"{}", time.time() - 1)
+
+    assert await disk_cache.get("old") is None
+    assert await disk_cache.compact() == 1
+
+
+@pytest.mark.unit
+async def test_disk_cache_serves_stale_rows_within_bound(disk_cache: DiskCache):
+    """Test rows past their expiry stay readable until their stale bound."""
+    now = time.time()
+    await disk_cache.set("key", "/abin/v2/helalandet", b"{}", now - 1, now + 60)
+
+    _, expires_at, stale_until = await disk_cache.get("key")
+    assert expires_at < now < stale_until
+    assert await disk_cache.compact() == 0
+
+
+@pytest.mark.unit
+async def test_disk_cache_compaction_enforces_size_cap(tmp_path: Path):
+    """Test compaction evicts least recently accessed rows above the cap."""
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=1)
+    await cache.start()
+    try:
+        expires_at = time.time() + 60
+        await cache.set("a", "/x", b"a" * 100, expires_at)
+        await cache.set("b", "/x", b"b" * 100, expires_at)
+
+        assert await cache.compact() == 2
+        assert await cache.get("a") is None
+        assert cache.stats()["evictions"] == 2
+    finally:
+        await cache.close()
+
+
+@pytest.mark.unit
+async def test_disk_cache_invalidate_by_prefix(disk_cache: DiskCache):
+    """Test invalidation matches endpoint prefixes literally."""
+    expires_at = time.time() + 60
+    await disk_cache.set("a", "/abin/v2/lan/01", b"{}", expires_at)
+    await disk_cache.set("b", "/abin/v2/landsdel/1", b"{}", expires_at)
+
+    assert await disk_cache.invalidate("/abin/v2/lan/") == 1
+    assert await disk_cache.get("b") is not None
+    assert await disk_cache.invalidate() == 1
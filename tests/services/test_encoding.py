@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import gzip
+import zlib
+
+import pytest
+import zstandard
+
+from backend.services.encoding import (
+    decode_body,
+    parse_accept_encoding,
+    upstream_accept_encoding,
+)
+
+
+@pytest.mark.unit
+def test_parse_accept_encoding_qualities():
+    """Test encodings and q-values are parsed."""
+    assert parse_accept_encoding("gzip, br;q=0.8, *;q=0") == {"gzip": 1.0, "br": 0.8, "*": 0.0}
+    assert parse_accept_encoding(None) == {}
+
+
+@pytest.mark.unit
+def test_upstream_accept_encoding_filters_to_decodable():
+    """Test only encodings the caller accepts and we can decode are requested."""
+    assert upstream_accept_encoding("gzip, compress") == "gzip"
+    assert upstream_accept_encoding("gzip;q=0, zstd") == "zstd"
+    assert upstream_accept_encoding(None) == "identity"
+
+
+@pytest.mark.unit
+def test_decode_body_roundtrips():
+    """Test supported encodings decode to the original body."""
+    body = b'{"geometri": "POLYGON ((0 0, 1 0, 1 1, 0 0))"}'
+
+    assert decode_body(body, None) == body
+    assert decode_body(gzip.compress(body), "gzip") == body
+    assert decode_body(zlib.compress(body), "deflate") == body
+    assert decode_body(zstandard.ZstdCompressor().compress(body), "zstd") == body
+
+
+@pytest.mark.unit
+def test_decode_body_rejects_bad_input():
+    """Test corrupt bodies and unknown encodings raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_body(b"not gzip", "gzip")
+    with pytest.raises(ValueError):
+        decode_body(b"data", "compress")
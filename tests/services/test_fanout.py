@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from backend.core.exceptions import APIError, CircuitOpenError
+from backend.services.fanout import error_type, fan_out, merge_results
+from backend.services.skogsstyrelsen_client import RawBody
+
+
+def returning(body: bytes):
+    """Call that succeeds with a raw body."""
+
+    async def call() -> RawBody:
+        return RawBody(body)
+
+    return call
+
+
+def failing(error: Exception):
+    """Call that fails with an error."""
+
+    async def call() -> RawBody:
+        raise error
+
+    return call
+
+
+@pytest.mark.unit
+def test_error_type_matches_error_handler():
+    """Test errors are named like the error handler middleware names them."""
+    assert error_type(CircuitOpenError("down")) == "circuit_open"
+    assert error_type(APIError("bad", status_code=400)) == "api_error"
+
+
+@pytest.mark.unit
+async def test_fan_out_reports_partial_failure():
+    """Test a failing call is reported next to the calls that succeeded."""
+    results = await fan_out(
+        {
+            "volym": returning(b'{"medel": 180.5}'),
+            "grundyta": failing(APIError("Upstream timeout", status_code=504)),
+        }
+    )
+
+    document = json.loads(merge_results(results, "metrics", 0.0123))
+
+    assert document["succeeded"] == ["volym"]
+    assert document["failed"] == ["grundyta"]
+    assert document["duration_ms"] == 12.3
+    assert document["metrics"]["volym"]["status"] == "ok"
+    assert document["metrics"]["volym"]["data"] == {"medel": 180.5}
+    assert document["metrics"]["grundyta"]["error"] == {
+        "type": "api_error",
+        "detail": "Upstream timeout",
+        "status_code": 504,
+    }
+    assert all("duration_ms" in entry for entry in document["metrics"].values())
+
+
+@pytest.mark.unit
+async def test_fan_out_raises_when_every_call_fails():
+    """Test the first error is raised when nothing succeeded."""
+    with pytest.raises(CircuitOpenError):
+        await fan_out(
+            {
+                "volym": failing(CircuitOpenError("down", retry_after=5)),
+                "grundyta": failing(APIError("bad")),
+            }
+        )
+
+
+@pytest.mark.unit
+async def test_fan_out_propagates_unexpected_errors():
+    """Test errors other than upstream errors are not swallowed."""
+    with pytest.raises(ValueError):
+        await fan_out({"volym": failing(ValueError("bug"))})
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.services.geometry import (
+    GeometryParseError,
+    canonical_wkt,
+    canonicalize_statistics_body,
+    geometry_hash,
+)
+from tests.conftest import EXAMPLE_MULTIPOLYGON, EXAMPLE_SMALL_POLYGON
+
+
+@pytest.mark.unit
+def test_canonical_wkt_ignores_start_vertex_and_orientation():
+    """Test rotated and reversed rings give the same canonical form."""
+    rotated = "POLYGON ((486179 7018896, 485486 7018896, 485486 7018193, 486179 7018193, 486179 7018896))"
+    reversed_ring = "POLYGON ((485486 7018193, 485486 7018896, 486179 7018896, 486179 7018193, 485486 7018193))"
+
+    assert canonical_wkt(rotated) == canonical_wkt(EXAMPLE_SMALL_POLYGON)
+    assert canonical_wkt(reversed_ring) == canonical_wkt(EXAMPLE_SMALL_POLYGON)
+
+
+@pytest.mark.unit
+def test_canonical_wkt_ignores_whitespace_case_and_float_noise():
+    """Test formatting differences and sub-centimetre noise are ignored."""
+    noisy = "polygon((485486.000001 7018193,486179 7018193.0000004,486179 7018896,485486 7018896,485486.000001 7018193))"
+
+    assert canonical_wkt(noisy) == canonical_wkt(EXAMPLE_SMALL_POLYGON)
+
+
+@pytest.mark.unit
+def test_single_part_multipolygon_equals_polygon():
+    """Test a one-part multipolygon is keyed like the polygon."""
+    assert canonical_wkt(EXAMPLE_MULTIPOLYGON) == canonical_wkt(EXAMPLE_SMALL_POLYGON)
+
+
+@pytest.mark.unit
+def test_multipolygon_part_order_is_ignored():
+    """Test polygon order inside a multipolygon does not matter."""
+    a = "((0 0, 1 0, 1 1, 0 0))"
+    b = "((5 5, 6 5, 6 6, 5 5))"
+
+    assert canonical_wkt(f"MULTIPOLYGON ({a}, {b})") == canonical_wkt(f"MULTIPOLYGON ({b}, {a})")
+
+
+@pytest.mark.unit
+def test_different_geometries_differ():
+    """Test distinct polygons keep distinct canonical forms."""
+    moved = "POLYGON ((485487 7018193, 486179 7018193, 486179 7018896, 485486 7018896, 485487 7018193))"
+
+    assert canonical_wkt(moved) != canonical_wkt(EXAMPLE_SMALL_POLYGON)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "wkt",
+    ["POINT (1 2)", "POLYGON ((0 0, 1 1))", "POLYGON ((0 0, 1 0, 1 1, 0 0)", "POLYGON ((a b, c d, e f))"],
+)
+def test_canonical_wkt_rejects_invalid_input(wkt: str):
+    """Test unsupported or malformed WKT raises."""
+    with pytest.raises(GeometryParseError):
+        canonical_wkt(wkt)
+
+
+@pytest.mark.unit
+def test_geometry_hash_falls_back_to_raw_text():
+    """Test unparseable geometries still hash deterministically."""
+    assert geometry_hash("POINT (1 2)") == geometry_hash(" POINT (1 2) ")
+
+
+@pytest.mark.unit
+def test_canonicalize_statistics_body():
+    """Test body canonicalization keeps parameters and sorts land types."""
+    body = {
+        "geometri": EXAMPLE_SMALL_POLYGON,
+        "omdrev": 2,
+        "marktyp": ["OvrigMark", "ProduktivSkogsmark"],
+    }
+
+    canonical = canonicalize_statistics_body(body)
+
+    assert canonical["geometri"] == "sha256:" + geometry_hash(EXAMPLE_SMALL_POLYGON)
+    assert canonical["omdrev"] == 2
+    assert canonical["marktyp"] == ["OvrigMark", "ProduktivSkogsmark"]
+    assert body["geometri"] == EXAMPLE_SMALL_POLYGON
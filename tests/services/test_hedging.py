@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.services.hedging import LatencyTracker
+
+
+@pytest.mark.unit
+def test_latency_tracker_percentile():
+    """Test percentiles are computed over the rolling window."""
+    tracker = LatencyTracker(window=100, min_samples=10)
+
+    for ms in range(1, 101):
+        tracker.record("GET /abin/v2/lan", ms / 1000)
+
+    assert tracker.percentile("GET /abin/v2/lan", 0.95) == pytest.approx(0.095)
+    assert tracker.percentile("GET /abin/v2/lan", 0.5) == pytest.approx(0.05)
+
+
+@pytest.mark.unit
+def test_latency_tracker_needs_min_samples():
+    """Test no percentile is reported until enough samples are seen."""
+    tracker = LatencyTracker(min_samples=3)
+
+    tracker.record("key", 0.1)
+    tracker.record("key", 0.2)
+    assert tracker.percentile("key", 0.95) is None
+    assert tracker.percentile("other", 0.95) is None
+
+    tracker.record("key", 0.3)
+    assert tracker.percentile("key", 0.95) == 0.3
+
+
+@pytest.mark.unit
+def test_latency_tracker_bounds_keys():
+    """Test the least recently used keys are dropped."""
+    tracker = LatencyTracker(min_samples=1, max_keys=2)
+
+    tracker.record("a", 0.1)
+    tracker.record("b", 0.1)
+    tracker.record("a", 0.1)
+    tracker.record("c", 0.1)
+
+    assert tracker.percentile("b", 0.5) is None
+    assert tracker.percentile("a", 0.5) == 0.1
+    assert tracker.stats()["tracked"] == 2
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.services.jobs import COMPLETED, RECEIVING, RUNNING, JobQueue, JobStore, JobTooLarge
+from backend.services.skogsstyrelsen_client import RawBody
+
+POLYGON = "POLYGON ((0 0, 1 0, 1 1, 0 0))"
+
+
+async def wait_finished(queue: JobQueue, job_id: str, timeout: float = 5.0):
+    """Poll a job until it has completed or failed."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = await queue.store.get(job_id)
+        if job.status in ("completed", "failed"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+@pytest.fixture
+async def job_queue(tmp_path: Path, mock_api_client):
+    """Create a started job queue with a mocked upstream."""
+    mock_api_client.post_raw = AsyncMock(return_value=RawBody(b'{"medel": 1.0}'))
+    queue = JobQueue(JobStore(tmp_path / "jobs.sqlite3"), mock_api_client, workers=1)
+    await queue.start()
+    yield queue
+    await queue.close()
+
+
+@pytest.mark.unit
+async def test_job_runs_items_and_stores_results(job_queue: JobQueue):
+    """Test a submitted job computes every item and keeps results in index order."""
+    items = [{"id": "a", "geometri": POLYGON}, b"not json", {"id": "c", "geometri": POLYGON}]
+
+    job, created = await job_queue.submit(items, ["volym"])
+    assert created
+    assert job.total == 3
+
+    job = await wait_finished(job_queue, job.id)
+    assert job.status == COMPLETED
+    assert (job.done, job.failed) == (3, 1)
+    lines = [json.loads(line) for _, line in await job_queue.store.results(job.id, 10)]
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert lines[1]["error"]["type"] == "validation_error"
+    assert lines[2]["metrics"]["volym"]["data"] == {"medel": 1.0}
+    assert [index for index, _ in await job_queue.store.results(job.id, 1, offset=1)] == [1]
+
+
+@pytest.mark.unit
+async def test_job_idempotency_key_returns_existing_job(job_queue: JobQueue):
+    """Test a repeated idempotency key returns the first job without reading items."""
+    first, created = await job_queue.submit([{"geometri": POLYGON}], idempotency_key="k")
+
+    async def never_read():
+        raise AssertionError("items were read")
+        yield
+
+    second, repeated = await job_queue.submit(never_read(), idempotency_key="k")
+
+    assert created and not repeated
+    assert second.id == first.id
+
+
+@pytest.mark.unit
+async def test_job_over_item_limit_is_rejected(job_queue: JobQueue):
+    """Test a job with too many items raises and leaves nothing behind."""
+    job_queue.max_items = 2
+
+    with pytest.raises(JobTooLarge):
+        await job_queue.submit([{"geometri": POLYGON}] * 3, idempotency_key="big")
+
+    # The key is free again, so a corrected batch can be submitted with it
+    job, created = await job_queue.submit([{"geometri": POLYGON}] * 2, idempotency_key="big")
+    assert created
+    assert job.total == 2
+
+
+@pytest.mark.unit
+async def test_job_resumes_after_restart(tmp_path: Path, mock_api_client):
+    """Test an interrupted job is resumed with only its unfinished items."""
+    path = tmp_path / "jobs.sqlite3"
+    mock_api_client.post_raw = AsyncMock(return_value=RawBody(b"{}"))
+    first = JobQueue(JobStore(path), mock_api_client, workers=0)
+    await first.start()
+    job, _ = await first.submit([{"geometri": POLYGON}] * 3, ["volym"])
+    await first.store.set_status(job.id, RUNNING)
+    await first.store.save_result(job.id, 0, "ok", b'{"index":0}\n')
+    abandoned, _ = await first.store.create(["volym"], None)
+    assert abandoned.status == RECEIVING
+    await first.close()
+
+    second = JobQueue(JobStore(path), mock_api_client, workers=1)
+    await second.start()
+    try:
+        resumed = await wait_finished(second, job.id)
+        assert resumed.status == COMPLETED
+        assert resumed.done == 3
+        assert mock_api_client.post_raw.await_count == 2
+        assert await second.store.get(abandoned.id) is None
+    finally:
+        await second.close()
+
+
+@pytest.mark.unit
+async def test_finished_jobs_are_purged(job_queue: JobQueue):
+    """Test finished jobs past the retention period are deleted."""
+    job, _ = await job_queue.submit([{"geometri": POLYGON}])
+    await wait_finished(job_queue, job.id)
+
+    assert await job_queue.store.purge(time.time() - 60) == 0
+    assert await job_queue.store.purge(time.time() + 1) == 1
+    assert await job_queue.store.get(job.id) is None
+    assert await job_queue.store.results(job.id, 10) == []
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.services.limiter import AdaptiveLimiter
+
+
+@pytest.mark.unit
+def test_limiter_grows_additively_under_demand():
+    """Test the limit grows by about one per window of successful calls."""
+    limiter = AdaptiveLimiter(initial_limit=4, min_limit=1, max_limit=10)
+
+    for _ in range(6):
+        limiter.on_success(0.1, demand=4)
+
+    assert limiter.limit == 5
+
+
+@pytest.mark.unit
+def test_limiter_does_not_grow_without_demand():
+    """Test an underused limit stays put."""
+    limiter = AdaptiveLimiter(initial_limit=8, min_limit=1, max_limit=10)
+
+    for _ in range(20):
+        limiter.on_success(0.1, demand=1)
+
+    assert limiter.limit == 8
+
+
+@pytest.mark.unit
+def test_limiter_backs_off_on_overload_and_latency():
+    """Test errors and rising latency shrink the limit, never below the minimum."""
+    limiter = AdaptiveLimiter(
+        initial_limit=10, min_limit=2, max_limit=10, backoff_ratio=0.5, latency_tolerance=2.0
+    )
+
+    limiter.on_overload()
+    assert limiter.limit == 5
+
+    limiter.on_success(0.1, demand=5)
+    for _ in range(5):
+        limiter.on_success(1.0, demand=5)
+    assert limiter.limit == 2
+    assert limiter.stats()["decreases"] >= 2
+
+
+@pytest.mark.unit
+def test_limiter_initial_limit_is_clamped():
+    """Test the initial limit respects the pool size."""
+    limiter = AdaptiveLimiter(initial_limit=10, min_limit=2, max_limit=4)
+
+    assert limiter.limit == 4
+    assert limiter.stats()["max_limit"] == 4
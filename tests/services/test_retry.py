@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from backend.services.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+@pytest.mark.unit
+def test_parse_retry_after_seconds_and_date():
+    """Test both Retry-After formats are understood."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    in_ten_seconds = formatdate(time.time() + 10, usegmt=True)
+    assert 8 <= parse_retry_after(in_ten_seconds) <= 10
+
+
+@pytest.mark.unit
+def test_backoff_is_jittered_and_capped():
+    """Test backoff stays within the exponential envelope and cap."""
+    policy = RetryPolicy(max_attempts=5, base_delay=0.5, max_delay=2.0)
+
+    for attempt in range(5):
+        delay = policy.backoff(attempt)
+        assert 0.0 <= delay <= min(2.0, 0.5 * 2**attempt)
+
+
+@pytest.mark.unit
+def test_backoff_honors_retry_after():
+    """Test Retry-After overrides jitter unless it exceeds the cap."""
+    policy = RetryPolicy(max_attempts=3, base_delay=0.1, max_delay=5.0)
+
+    assert policy.backoff(0, retry_after=2.0) == 2.0
+    assert policy.backoff(0, retry_after=60.0) is None
+
+
+@pytest.mark.unit
+def test_retry_budget_limits_retries_to_ratio():
+    """Test the budget allows roughly ratio retries per request once drained."""
+    budget = RetryBudget(ratio=0.25, min_per_second=0.0)
+    assert budget.try_spend() is True  # initial capacity
+    assert budget.try_spend() is False
+
+    for _ in range(4):
+        budget.deposit()
+
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+    assert budget.stats()["retries"] == 2
+    assert budget.stats()["budget_exhausted"] == 2
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.services.keys import request_key
+from backend.services.singleflight import SingleFlight
+
+
+@pytest.mark.unit
+async def test_concurrent_calls_share_one_execution():
+    """Test concurrent calls with the same key run once."""
+    singleflight = SingleFlight()
+    executions = 0
+
+    async def fetch() -> dict[str, int]:
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return {"value": 42}
+
+    results = await asyncio.gather(*(singleflight.do("key", fetch) for _ in range(10)))
+
+    assert results == [{"value": 42}] * 10
+    assert executions == 1
+    stats = singleflight.stats()
+    assert stats["calls"] == 10
+    assert stats["coalesced"] == 9
+    assert stats["coalescing_ratio"] == pytest.approx(0.9)
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.unit
+async def test_different_keys_run_separately():
+    """Test calls with different keys are not coalesced."""
+    singleflight = SingleFlight()
+
+    async def fetch(value: int) -> int:
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        singleflight.do("a", lambda: fetch(1)),
+        singleflight.do("b", lambda: fetch(2)),
+    )
+
+    assert results == [1, 2]
+    assert singleflight.stats()["executions"] == 2
+
+
+@pytest.mark.unit
+async def test_sequential_calls_are_not_coalesced():
+    """Test a finished call is not reused by later callers."""
+    singleflight = SingleFlight()
+
+    async def fetch() -> int:
+        return 1
+
+    await singleflight.do("key", fetch)
+    await singleflight.do("key", fetch)
+
+    assert singleflight.stats()["executions"] == 2
+
+
+@pytest.mark.unit
+async def test_errors_are_shared():
+    """Test every waiter receives the error of the shared call."""
+    singleflight = SingleFlight()
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(singleflight.do("key", fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert singleflight.stats()["executions"] == 1
+
+
+@pytest.mark.unit
+async def test_cancelled_caller_does_not_cancel_others():
+    """Test cancelling one waiter leaves the shared call running."""
+    singleflight = SingleFlight()
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.create_task(singleflight.do("key", fetch))
+    second = asyncio.create_task(singleflight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+
+
+@pytest.mark.unit
+def test_request_key_canonicalizes_params_and_body():
+    """Test request keys ignore key order but not values."""
+    a = request_key("get", "/x", params={"a": 1, "b": 2}, json_data={"p": [1, 2], "q": "w"})
+    b = request_key("GET", "/x", params={"b": 2, "a": 1}, json_data={"q": "w", "p": [1, 2]})
+    c = request_key("GET", "/x", params={"a": 1, "b": 3}, json_data={"q": "w", "p": [1, 2]})
+
+    assert a == b
+    assert a != c
+    assert request_key("GET", "/x") != request_key("POST", "/x")
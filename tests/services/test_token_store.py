@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import stat
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.config import Settings
+from backend.services.auth import SkogsstyrelsenAuth
+from backend.services.token_store import (
+    FileTokenStore,
+    MemoryTokenStore,
+    StoredToken,
+    create_token_store,
+)
+
+
+def mock_token_response(token: str, expires_in: int = 3600) -> MagicMock:
+    """Create a mock auth server response."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"access_token": token, "expires_in": expires_in}
+    mock_response.raise_for_status = MagicMock()
+    return mock_response
+
+
+@pytest.mark.unit
+async def test_file_store_round_trip(tmp_path: Path):
+    """Test file store saves and loads a token."""
+    store = FileTokenStore(tmp_path / "token.json")
+    assert await store.load() is None
+
+    await store.save(StoredToken(access_token="abc", expires_at=123.0))
+
+    assert await store.load() == StoredToken(access_token="abc", expires_at=123.0)
+    assert stat.S_IMODE((tmp_path / "token.json").stat().st_mode) == 0o600
+
+
+@pytest.mark.unit
+async def test_file_store_ignores_corrupt_file(tmp_path: Path):
+    """Test file store treats an unreadable file as empty."""
+    path = tmp_path / "token.json"
+    path.write_text("not json")
+
+    assert await FileTokenStore(path).load() is None
+
+
+@pytest.mark.unit
+async def test_file_store_lock_is_exclusive(tmp_path: Path):
+    """Test only one holder at a time gets the file lock."""
+    first = FileTokenStore(tmp_path / "token.json", poll_interval=0.001)
+    second = FileTokenStore(tmp_path / "token.json", poll_interval=0.001)
+    events: list[str] = []
+
+    async def hold(store: FileTokenStore, name: str) -> None:
+        async with store.lock():
+            events.append(f"{name}-in")
+            await asyncio.sleep(0.01)
+            events.append(f"{name}-out")
+
+    await asyncio.gather(hold(first, "a"), hold(second, "b"))
+
+    assert events in (["a-in", "a-out", "b-in", "b-out"], ["b-in", "b-out", "a-in", "a-out"])
+
+
+@pytest.mark.unit
+def test_create_token_store(test_settings: Settings, tmp_path: Path):
+    """Test token store is only created when a path is configured."""
+    assert create_token_store(test_settings) is None
+
+    test_settings.token_store_path = str(tmp_path / "token.json")
+    assert isinstance(create_token_store(test_settings), FileTokenStore)
+
+
+@pytest.mark.unit
+async def test_workers_share_one_token_fetch(test_settings: Settings):
+    """Test auth instances sharing a store authenticate only once."""
+    store = MemoryTokenStore()
+    workers = [SkogsstyrelsenAuth(test_settings, token_store=store) for _ in range(4)]
+
+    post = AsyncMock(return_value=mock_token_response("shared_token"))
+    patches = [patch.object(worker, "_get_client") for worker in workers]
+    for p in patches:
+        p.start().return_value.post = post
+    try:
+        tokens = await asyncio.gather(*(worker.get_token() for worker in workers))
+    finally:
+        for p in patches:
+            p.stop()
+
+    assert tokens == ["shared_token"] * 4
+    post.assert_called_once()
+
+
+@pytest.mark.unit
+async def test_worker_refreshes_when_shared_token_due(test_settings: Settings):
+    """Test a shared token that is due for renewal is replaced."""
+    store = MemoryTokenStore()
+    await store.save(StoredToken(access_token="stale", expires_at=time.time() + 60))
+    auth = SkogsstyrelsenAuth(test_settings, token_store=store)
+
+    with patch.object(auth, "_get_client") as mock_client:
+        mock_client.return_value.post = AsyncMock(
+            return_value=mock_token_response("fresh")
+        )
+        token = await auth.get_token()
+
+    assert token == "fresh"
+    stored = await store.load()
+    assert stored.access_token == "fresh"
+    assert stored.expires_at == pytest.approx(time.time() + 3600, abs=5)
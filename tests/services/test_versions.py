@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.api.constants import AbinEndpoints, ApiFamily, GrundataEndpoints
+from backend.core.config import Settings
+from backend.core.exceptions import APIError
+from backend.services.auth import SkogsstyrelsenAuth
+from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
+from backend.services.versions import ApiVersionPoller, version_tag
+
+
+def api_info(version: str, released: str = "2024-01-01") -> dict[str, str]:
+    """Build an api-info body."""
+    return {"apiName": "test", "apiVersion": version, "apiReleased": released}
+
+
+@pytest.mark.unit
+def test_version_tag():
+    """Test versions combine apiVersion and apiReleased."""
+    assert version_tag(api_info("2.1")) == "2.1@2024-01-01"
+    assert version_tag({"apiName": "test"}) is None
+    assert version_tag(["not", "a", "dict"]) is None
+
+
+@pytest.mark.unit
+async def test_poller_namespaces_keys_by_version(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test cache keys change with the family's version and api-info keys do not."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    client.refresh = AsyncMock(return_value=api_info("2.0"))
+    poller = ApiVersionPoller(client, interval=60)
+
+    _, before = client._cache_key("GET", AbinEndpoints.HELALANDET)
+    await poller.poll()
+    _, after = client._cache_key("GET", AbinEndpoints.HELALANDET)
+
+    assert after == f"2.0@2024-01-01 {before}"
+    assert client._cache_key("GET", AbinEndpoints.API_INFO)[1].startswith("GET ")
+    assert poller.stats()["versions"][ApiFamily.ABIN] == "2.0@2024-01-01"
+    assert poller.stats()["changes"] == 0
+
+
+@pytest.mark.unit
+async def test_poller_invalidates_family_on_new_version(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test a new upstream release drops only that family's cached responses."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    versions = {
+        AbinEndpoints.API_INFO: api_info("2.0"),
+        GrundataEndpoints.API_INFO: api_info("1.0"),
+    }
+    client.refresh = AsyncMock(side_effect=lambda endpoint: versions.get(endpoint, {}))
+    poller = ApiVersionPoller(client, interval=60)
+    await poller.poll()
+
+    abin_rule, abin_key = client._cache_key("GET", AbinEndpoints.HELALANDET)
+    dates_rule, dates_key = client._cache_key("GET", GrundataEndpoints.VALID_DATES)
+    await client.cache.set(abin_rule, abin_key, AbinEndpoints.HELALANDET, b"{}")
+    await client.cache.set(dates_rule, dates_key, GrundataEndpoints.VALID_DATES, b"[]")
+
+    versions[AbinEndpoints.API_INFO] = api_info("2.0", released="2024-06-01")
+    await poller.poll()
+
+    _, new_key = client._cache_key("GET", AbinEndpoints.HELALANDET)
+    assert new_key != abin_key
+    assert await client.cache.get(abin_rule, abin_key, AbinEndpoints.HELALANDET) is None
+    assert await client.cache.get(dates_rule, dates_key, GrundataEndpoints.VALID_DATES)
+    assert poller.changes == 1
+    # Raster api-info had no version information
+    assert poller.errors == 2
+
+
+@pytest.mark.unit
+async def test_poller_keeps_last_version_on_errors(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test a failed check leaves the known version in place."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    client.refresh = AsyncMock(return_value=api_info("2.0"))
+    poller = ApiVersionPoller(client, interval=60)
+    await poller.poll()
+
+    client.refresh = AsyncMock(side_effect=APIError("down", status_code=503))
+    await poller.poll()
+
+    assert client.cache.versions[ApiFamily.ABIN] == "2.0@2024-01-01"
+    assert poller.errors == 3
+
+
+@pytest.mark.unit
+async def test_poller_survives_non_json_api_info(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test a maintenance page instead of api-info is an error, not a dead poller."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    client.refresh = AsyncMock(side_effect=json.JSONDecodeError("Expecting value", "<html>", 0))
+    poller = ApiVersionPoller(client, interval=60)
+
+    poller.start()
+    assert await poller.wait_polled(timeout=1)
+    assert poller._task is not None and not poller._task.done()
+    assert poller.errors == 3
+    await poller.close()
+
+
+@pytest.mark.unit
+async def test_wait_polled_times_out(mock_auth: SkogsstyrelsenAuth, test_settings: Settings):
+    """Test waiting for the first poll gives up after the timeout."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+
+    async def hang(endpoint: str) -> None:
+        await asyncio.sleep(10)
+
+    client.refresh = AsyncMock(side_effect=hang)
+    poller = ApiVersionPoller(client, interval=60)
+
+    poller.start()
+    assert await poller.wait_polled(timeout=0.01) is False
+    await poller.close()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.api.constants import AbinEndpoints, GrundataEndpoints
+from backend.core.config import Settings
+from backend.core.exceptions import APIError
+from backend.services.auth import SkogsstyrelsenAuth
+from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
+from backend.services.versions import ApiVersionPoller
+from backend.services.warmup import CacheWarmer
+
+TREE = {
+    AbinEndpoints.LANDSDEL_METADATA: [{"namn": "Norra Norrland", "kod": "1"}],
+    "/abin/v2/landsdel/1/lan/metadata": [{"namn": "Norrbotten", "kod": "25"}],
+    "/abin/v2/landsdel/1/lan/25/afo/metadata": [
+        {"namn": "Norra", "kod": "251"},
+        {"namn": "Södra", "kod": "252"},
+    ],
+    "/abin/v2/landsdel/1/lan/25/afo/251/stratum/metadata": [{"namn": "Kust", "kod": "1"}],
+    "/abin/v2/landsdel/1/lan/25/afo/252/stratum/metadata": [],
+}
+
+
+def fake_get(endpoint: str):
+    """Serve the metadata tree and empty bodies for everything else."""
+    return TREE.get(endpoint, {})
+
+
+@pytest.mark.unit
+async def test_warm_walks_abin_tree(mock_auth: SkogsstyrelsenAuth, test_settings: Settings):
+    """Test the warmer loads static lookups and every metadata level."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    client.get = AsyncMock(side_effect=fake_get)
+    warmer = CacheWarmer(client, concurrency=2)
+
+    assert await warmer.warm() == 1.0
+
+    loaded = {call.args[0] for call in client.get.call_args_list}
+    assert GrundataEndpoints.VALID_DATES in loaded
+    assert AbinEndpoints.API_INFO in loaded
+    assert set(TREE) <= loaded
+    assert AbinEndpoints.LAN.format(lankod="25") not in loaded
+    assert warmer.loaded == len(loaded)
+
+
+@pytest.mark.unit
+async def test_warm_loads_summaries_when_enabled(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test each area's summary is loaded when summaries are enabled."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    client.get = AsyncMock(side_effect=fake_get)
+
+    await CacheWarmer(client, summaries=True).warm()
+
+    loaded = {call.args[0] for call in client.get.call_args_list}
+    assert {
+        AbinEndpoints.HELALANDET,
+        "/abin/v2/landsdel/1",
+        "/abin/v2/lan/25",
+        "/abin/v2/lan/25/afo/251",
+        "/abin/v2/lan/25/afo/251/stratum/1",
+    } <= loaded
+
+
+@pytest.mark.unit
+async def test_warmer_ready_after_threshold(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test readiness waits for a pass that loads enough endpoints."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    client.get = AsyncMock(side_effect=APIError("down", status_code=503))
+    warmer = CacheWarmer(client, ready_ratio=0.5)
+    assert warmer.ready
+
+    warmer.start()
+    await asyncio.sleep(0.01)
+    assert not warmer.ready
+    assert warmer.stats()["failed"] > 0
+    await warmer.close()
+
+    client.get = AsyncMock(side_effect=fake_get)
+    warmer.start()
+    await asyncio.sleep(0.01)
+    assert warmer.ready
+    assert warmer.stats()["running"] is False
+    await warmer.close()
+
+
+@pytest.mark.unit
+async def test_warm_counts_non_json_bodies_as_failures(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test a maintenance page in place of metadata fails that endpoint only."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    client.get = AsyncMock(side_effect=json.JSONDecodeError("Expecting value", "<html>", 0))
+    warmer = CacheWarmer(client)
+
+    assert await warmer.warm() == 0.0
+    assert warmer.failed > 0
+
+
+@pytest.mark.unit
+async def test_warmer_survives_failed_pass_and_missing_versions(
+    mock_auth: SkogsstyrelsenAuth, test_settings: Settings
+):
+    """Test a crashed pass is retried and an unfinished version poll is not waited on forever."""
+    client = SkogsstyrelsenClient(mock_auth, test_settings)
+    poller = ApiVersionPoller(client, interval=60)
+    poller.wait_polled = AsyncMock(return_value=False)
+    client.get = AsyncMock(side_effect=[RuntimeError("bug"), *[{}] * 50])
+    warmer = CacheWarmer(client, version_poller=poller)
+
+    with patch("backend.services.warmup.RETRY_SECONDS", 0):
+        warmer.start()
+        await asyncio.sleep(0.05)
+
+    assert warmer.ready
+    assert warmer.runs == 1
+    await warmer.close()
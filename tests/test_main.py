@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.core.exceptions import CircuitOpenError
+from backend.services.warmup import CacheWarmer
+
 
 @pytest.mark.unit
 def test_read_root(client: TestClient):
@@ -26,6 +31,21 @@ def test_health_check(client: TestClient):
     assert data == {"status": "healthy"}
 
 
+@pytest.mark.unit
+def test_readiness_check(client: TestClient):
+    """Test readiness reflects cache warm-up, which is off by default."""
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+    with patch.object(CacheWarmer, "ready", new_callable=PropertyMock, return_value=False):
+        response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming"
+
+
 @pytest.mark.unit
 def test_openapi_docs(client: TestClient):
     """Test OpenAPI documentation is available."""
@@ -66,3 +86,62 @@ def test_404_not_found(client: TestClient):
     response = client.get("/nonexistent")
 
     assert response.status_code == 404
+
+
+@pytest.mark.unit
+def test_lifespan_shares_api_client(client: TestClient):
+    """Test lifespan creates one API client reused across requests."""
+    from backend.core.dependencies import get_api_client
+    from backend.main import app
+    from backend.services.skogsstyrelsen_client import SkogsstyrelsenClient
+
+    api_client = app.state.api_client
+    assert isinstance(api_client, SkogsstyrelsenClient)
+
+    request = MagicMock()
+    request.app = app
+    assert get_api_client(request) is api_client
+    assert get_api_client(request) is api_client
+
+
+@pytest.mark.unit
+def test_lifespan_closes_api_client(app_env: None):
+    """Test lifespan closes the shared connection pool on shutdown."""
+    from backend.main import app
+
+    with TestClient(app):
+        api_client = app.state.api_client
+        assert api_client.pool_stats("grunddata")["open"] is True
+
+    assert api_client.pool_stats("grunddata")["open"] is False
+
+
+@pytest.mark.unit
+def test_metrics_reports_pool_stats(client: TestClient):
+    """Test metrics endpoint exposes connection pool statistics."""
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    metrics = response.json()
+    assert set(metrics["pools"]) == {"raster", "grunddata", "abin", "default"}
+    pool = metrics["pools"]["abin"]
+    assert pool["open"] is True
+    assert pool["connections"] == 0
+    assert pool["bulkhead"]["queued"] == 0
+    assert "bulkhead" in metrics["auth_pool"]
+    assert "hits" in metrics["compression"]
+
+
+@pytest.mark.unit
+def test_circuit_open_maps_to_503_with_retry_after(client: TestClient):
+    """Test an open circuit is reported as 503 with a Retry-After hint."""
+    with patch(
+        "backend.services.skogsstyrelsen_client.SkogsstyrelsenClient.get_raw",
+        new_callable=AsyncMock,
+        side_effect=CircuitOpenError("Skogsstyrelsen abin API is unavailable", retry_after=12.3),
+    ):
+        response = client.get("/api/abin/helalandet")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "13"
+    assert response.json()["type"] == "circuit_open"